@@ -13,8 +13,11 @@ from .scaler import Scaler
 from .outlier import OutlierHandler
 from .datetime import DatetimeFeatureExtractor
 from .featuregen import FeatureGenerator
+from .memory import MemoryOptimizer
 
-from .base import BaseTransformer
+from .base import BaseTransformer, keep_merge_state
+# --- Profiling ---
+from .profiling import DataProfile, profile
 # --- Explainability ---
 from .insight import InsightReporter
 
@@ -0,0 +1,90 @@
+"""
+asyncio entry points for fitted transformers.
+
+`transform` is CPU-bound and would block an event loop for the whole batch.
+`atransform` runs it on an executor instead, and `atransform_stream` keeps up to
+`max_pending` batches transforming in the executor while the event loop reads the
+next chunk and the consumer handles (e.g. writes) finished ones.
+
+Thread executors (the default) share the fitted transformer; `transform` does not
+modify it, so concurrent batches are safe. With a `ProcessPoolExecutor`, the
+transformer is pickled to the worker on every call (logging callbacks are not
+carried over), which only pays off for large batches of GIL-bound work.
+"""
+
+from __future__ import annotations
+import asyncio
+import collections
+import contextvars
+import functools
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Optional, Union
+
+from .base import BaseTransformer
+from .exceptions import ConfigurationError
+
+
+def _submit(loop: asyncio.AbstractEventLoop, executor: Optional[Executor],
+            transformer: BaseTransformer, X: Any) -> "asyncio.Future[Any]":
+    if isinstance(executor, ProcessPoolExecutor):
+        return loop.run_in_executor(executor, transformer.transform, X)
+    # Threads run in a copy of the caller's context, so per-call log routing carries over.
+    context = contextvars.copy_context()
+    return loop.run_in_executor(executor, functools.partial(context.run, transformer.transform, X))
+
+
+async def atransform(transformer: BaseTransformer, X: Any, executor: Optional[Executor] = None) -> Any:
+    """
+    Await `transformer.transform(X)` run on `executor` (the event loop's default
+    thread pool if None), without blocking the event loop.
+    """
+    return await _submit(asyncio.get_running_loop(), executor, transformer, X)
+
+
+async def _achunks(chunks: Union[AsyncIterable[Any], Iterable[Any]], loop: asyncio.AbstractEventLoop,
+                   executor: Optional[Executor]) -> AsyncIterator[Any]:
+    """Iterate async or sync chunks; sync `next()` calls (often file reads) run on a thread."""
+    if hasattr(chunks, "__aiter__"):
+        async for chunk in chunks:
+            yield chunk
+        return
+    iterator, done = iter(chunks), object()
+    thread_executor = None if isinstance(executor, ProcessPoolExecutor) else executor
+    while True:
+        chunk = await loop.run_in_executor(thread_executor, next, iterator, done)
+        if chunk is done:
+            return
+        yield chunk
+
+
+async def atransform_stream(transformer: BaseTransformer, chunks: Union[AsyncIterable[Any], Iterable[Any]],
+                            executor: Optional[Executor] = None, max_pending: int = 2) -> AsyncIterator[Any]:
+    """
+    Transform a stream of chunks on `executor`, yielding results in input order.
+
+    Parameters
+    ----------
+    transformer : BaseTransformer
+        A fitted transformer or Pipeline.
+    chunks : async iterable or iterable
+        Input frames. Items of a synchronous iterable are fetched on a worker thread.
+    executor : concurrent.futures.Executor, optional
+        Where `transform` runs. Defaults to the event loop's default thread pool.
+    max_pending : int
+        Maximum number of chunks submitted but not yet yielded. Bounds memory and lets
+        reading and consuming overlap with up to `max_pending` transforms.
+    """
+    if max_pending < 1:
+        raise ConfigurationError("`max_pending` must be a positive integer.")
+    loop = asyncio.get_running_loop()
+    pending: "collections.deque[asyncio.Future[Any]]" = collections.deque()
+    try:
+        async for chunk in _achunks(chunks, loop, executor):
+            pending.append(_submit(loop, executor, transformer, chunk))
+            if len(pending) >= max_pending:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,119 @@
+"""
+Execution backends for Transfory transformers.
+
+Transformers are written against pandas, but `transform` also accepts
+`polars.DataFrame` and `pyarrow.Table` inputs and returns the same type.
+Transformers that list "polars" in `_native_backends` implement
+`_transform_polars` and run natively on Polars (Arrow tables are wrapped
+zero-copy); every other transformer falls back to a pandas round trip.
+
+polars and pyarrow are optional dependencies and are only imported when an
+input of that type is seen. A `LazyFeatureFrame` input is materialized to pandas.
+"""
+
+from __future__ import annotations
+import importlib
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from .lazyframe import LazyFeatureFrame
+
+PANDAS = "pandas"
+POLARS = "polars"
+ARROW = "arrow"
+LAZY = "lazy"
+
+
+def import_optional(module_name: str) -> Any:
+    """Import an optional dependency, raising an informative ImportError if it is missing."""
+    try:
+        return importlib.import_module(module_name)
+    except ImportError as e:
+        raise ImportError(
+            f"The optional dependency '{module_name}' is required for this feature. "
+            f"Install it with `pip install {module_name}`."
+        ) from e
+
+
+def get_backend(X: Any) -> Optional[str]:
+    """Return the backend name for a supported frame type, or None."""
+    if isinstance(X, pd.DataFrame):
+        return PANDAS
+    if isinstance(X, LazyFeatureFrame):
+        return LAZY
+    # Check the defining module before importing, so unused backends are never imported.
+    module = type(X).__module__
+    if module.startswith("polars") and isinstance(X, import_optional("polars").DataFrame):
+        return POLARS
+    if module.startswith("pyarrow") and isinstance(X, import_optional("pyarrow").Table):
+        return ARROW
+    return None
+
+
+def to_pandas(X: Any) -> pd.DataFrame:
+    """Convert a supported frame to pandas (no-op for pandas input)."""
+    backend = get_backend(X)
+    if backend == PANDAS:
+        return X
+    if backend in (POLARS, ARROW, LAZY):
+        return X.to_pandas()
+    raise TypeError(f"Cannot convert object of type {type(X)} to a pandas.DataFrame.")
+
+
+def to_polars(X: Any) -> Any:
+    """Convert a supported frame to Polars. Arrow tables are wrapped without copying."""
+    pl = import_optional("polars")
+    backend = get_backend(X)
+    if backend == POLARS:
+        return X
+    if backend == ARROW:
+        return pl.from_arrow(X)
+    if backend in (PANDAS, LAZY):
+        return pl.from_pandas(to_pandas(X))
+    raise TypeError(f"Cannot convert object of type {type(X)} to a polars.DataFrame.")
+
+
+def from_pandas(df: pd.DataFrame, backend: str) -> Any:
+    """
+    Convert a pandas result back to the caller's backend. Sparse columns are densified.
+    Lazy results stay lazy for pandas callers and are materialized for any other backend;
+    lazy inputs get pandas results back.
+    """
+    if backend in (PANDAS, LAZY):
+        return df
+    if isinstance(df, LazyFeatureFrame):
+        df = df.to_pandas()
+    sparse = {c: dtype.subtype for c, dtype in df.dtypes.items() if isinstance(dtype, pd.SparseDtype)}
+    if sparse:
+        df = df.astype(sparse)
+    if backend == POLARS:
+        return import_optional("polars").from_pandas(df)
+    if backend == ARROW:
+        return import_optional("pyarrow").Table.from_pandas(df, preserve_index=False)
+    raise ValueError(f"Unknown backend '{backend}'.")
+
+
+def from_polars(df: Any, backend: str) -> Any:
+    """Convert a Polars result back to the caller's backend."""
+    if backend == POLARS:
+        return df
+    if backend == ARROW:
+        return df.to_arrow()
+    if backend == PANDAS:
+        return df.to_pandas()
+    raise ValueError(f"Unknown backend '{backend}'.")
+
+
+def polars_float(dtype: Any) -> Any:
+    """Polars float type matching a NumPy float dtype (Float64 for None)."""
+    pl = import_optional("polars")
+    return pl.Float32 if dtype is not None and np.dtype(dtype) == np.float32 else pl.Float64
+
+
+def polars_scalar(value: Any) -> Any:
+    """Unwrap NumPy scalars so Polars expressions receive plain Python values."""
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
@@ -1,11 +1,116 @@
 from __future__ import annotations
 import abc
-from .exceptions import FrozenTransformerError, NotFittedError, ColumnMismatchError
+import concurrent.futures
+import contextlib
+import contextvars
+import copy
+import inspect
+from .exceptions import FrozenTransformerError, NotFittedError, ColumnMismatchError, ConfigurationError
 import pickle
 import joblib
-from typing import Any, Callable, Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import numpy as np
 import pandas as pd
 import os
+from . import backend as _backend
+from . import schema as _schema
+from . import profiling as _profiling
+from . import sampling as _sampling
+
+# Floating dtypes accepted by the `dtype` option of numeric transformers.
+FLOAT_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+# Per-call logging routes: id(transformer) -> callback replacing its `_logging_callback`.
+# Orchestrators route their steps' events through this context variable instead of
+# reassigning callbacks on shared fitted steps, so one fitted object can serve
+# concurrent calls from several threads.
+_log_routes: contextvars.ContextVar[Dict[int, Optional[Callable[[str, Dict[str, Any]], None]]]] = \
+    contextvars.ContextVar("transfory_log_routes", default={})
+
+
+@contextlib.contextmanager
+def _routed_logs(transformer: "BaseTransformer", callback: Optional[Callable[[str, Dict[str, Any]], None]]):
+    """Within the block (in this thread / task only), send `transformer`'s events to `callback`; None silences it."""
+    routes = dict(_log_routes.get())
+    routes[id(transformer)] = callback
+    token = _log_routes.set(routes)
+    try:
+        yield
+    finally:
+        _log_routes.reset(token)
+
+
+# Whether fits and pickles keep the sufficient statistics `merge` needs (see `keep_merge_state`).
+_merge_state: contextvars.ContextVar[bool] = contextvars.ContextVar("transfory_merge_state", default=False)
+
+
+@contextlib.contextmanager
+def keep_merge_state():
+    """
+    Within the block (in this thread / task only), fits keep the sufficient statistics
+    that `BaseTransformer.merge` needs, and pickling keeps them too. `partial_fit` and
+    `fit_stream` checkpoints turn it on themselves; use it to fit partitions that are
+    combined later. Outside it, fits and pickles carry only what `transform` needs.
+    """
+    token = _merge_state.set(True)
+    try:
+        yield
+    finally:
+        _merge_state.reset(token)
+
+
+def _keeps_merge_state() -> bool:
+    return _merge_state.get()
+
+
+def _float_dtype(dtype: Any) -> Optional[np.dtype]:
+    """Normalize a `dtype` option to None or one of FLOAT_DTYPES, raising ConfigurationError otherwise."""
+    if dtype is None:
+        return None
+    try:
+        resolved = np.dtype(dtype)
+    except TypeError as e:
+        raise ConfigurationError(f"`dtype` must be float32 or float64, got {dtype!r}.") from e
+    if resolved not in FLOAT_DTYPES:
+        raise ConfigurationError(f"`dtype` must be float32 or float64, got {dtype!r}.")
+    return resolved
+
+
+def _check_n_jobs(n_jobs: Optional[int]) -> Optional[int]:
+    """Validate an `n_jobs` option: None or 1 (serial), a positive int, or -1 (all cores)."""
+    if n_jobs is None:
+        return None
+    if not isinstance(n_jobs, (int, np.integer)) or isinstance(n_jobs, bool) or n_jobs == 0 or n_jobs < -1:
+        raise ConfigurationError(f"`n_jobs` must be None, a positive integer or -1, got {n_jobs!r}.")
+    return int(n_jobs)
+
+
+def _check_decay_window(decay: Optional[float], window: Optional[int]) -> Tuple[Optional[float], Optional[int]]:
+    """Validate the `decay` / `window` options of `partial_fit`: at most one of them, decay in (0, 1), window >= 1."""
+    if decay is not None and window is not None:
+        raise ConfigurationError("Set at most one of `decay` and `window`.")
+    if decay is not None and not (isinstance(decay, (int, float, np.floating)) and 0 < decay < 1):
+        raise ConfigurationError(f"`decay` must be a float in (0, 1), got {decay!r}.")
+    if window is not None and (not isinstance(window, (int, np.integer)) or isinstance(window, bool) or window < 1):
+        raise ConfigurationError(f"`window` must be a positive integer, got {window!r}.")
+    return decay, window
+
+
+def _map_columns(fn: Callable[[Any], Any], columns: Iterable[Any], n_jobs: Optional[int] = None) -> List[Any]:
+    """
+    `[fn(col) for col in columns]`, spread over a thread pool of `n_jobs` workers
+    (-1: one per core). Per-column fit work is mostly pandas/NumPy code that releases
+    the GIL. Results keep column order; the first exception is re-raised.
+    """
+    columns = list(columns)
+    workers = (os.cpu_count() or 1) if n_jobs == -1 else (n_jobs or 1)
+    workers = min(workers, len(columns))
+    if workers <= 1:
+        return [fn(col) for col in columns]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="transfory-fit") as pool:
+        futures = [pool.submit(contextvars.copy_context().run, fn, col) for col in columns]
+        return [future.result() for future in futures]
+
 
 class BaseTransformer(abc.ABC):
     """
@@ -13,13 +118,21 @@ class BaseTransformer(abc.ABC):
 
     Key responsibilities:
       - provide fit/transform/fit_transform interface
-      - validate input types (pandas.DataFrame)
+      - validate input types (pandas.DataFrame; polars.DataFrame / pyarrow.Table via `backend`)
       - record fitted parameters into `_fitted_params`
       - support freezing (prevent re-fitting)
       - support saving / loading state to disk
       - optionally call a logging callback (for InsightReporter)
     """
 
+    # Non-pandas backends this class transforms natively via `_transform_<backend>`.
+    # Inputs from any other backend are converted to pandas and back.
+    _native_backends: Tuple[str, ...] = ()
+
+    # Attributes holding the sufficient statistics `_merge` / `_decay` read. Fits only set
+    # them inside `keep_merge_state()`, and pickles leave them out otherwise.
+    _merge_state_attributes: Tuple[str, ...] = ()
+
     def __init__(self, name: Optional[str] = None, logging_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None):
         """
         Parameters
@@ -35,6 +148,7 @@ class BaseTransformer(abc.ABC):
         self._fitted_params: Dict[str, Any] = {}
         self._frozen: bool = False
         self._last_input_columns: Optional[List[str]] = None
+        self._output_schema: Optional[Dict[str, Any]] = None
         self._logging_callback = logging_callback
 
     # ------------------------------
@@ -59,22 +173,44 @@ class BaseTransformer(abc.ABC):
     # ------------------------------
     # Public API
     # ------------------------------
-    def fit(self, X: pd.DataFrame, y: Optional[pd.Series] = None) -> "BaseTransformer":
+    def fit(self, X: pd.DataFrame, y: Optional[pd.Series] = None, sample: Optional[float] = None,
+            random_state: Optional[int] = None) -> "BaseTransformer":
         """
         Fit the transformer to X (and optional y). Records input columns and fitted params.
         Raises FrozenTransformerError if transformer is frozen.
+
+        With `sample` (a row count, or a fraction of rows), fit on a random sample drawn in
+        one pass (see `transfory.sampling`), stratified by `y` if it holds labels. X may
+        then also be an iterable of chunks. `random_state` seeds the sample, and
+        `sampling_report` records the estimated error of the fitted statistics.
+
+        Polars and Arrow inputs are converted to pandas before fitting: statistics are
+        always computed with pandas (only `transform` runs natively on Polars).
         """
         if self._frozen:
             raise FrozenTransformerError(f"Transformer {self.name} is frozen and cannot be refit.")
 
+        if sample is not None:
+            drawn = _sampling.draw(X, y, sample, random_state)
+            with _sampling.population(drawn.n_seen):
+                return self.fit(drawn.X, drawn.y)
+
+        incoming = _profiling.active_for(X)
         X = self._validate_input(X)
 
-        # let subclass do its work
-        self._fit(X, y)
+        # let subclass do its work, reading column statistics from the profile handed in
+        # by an enclosing Pipeline (or a fresh one, so each column is still scanned once)
+        profile = incoming.derive(X, ()) if incoming is not None else _profiling.DataProfile(X)
+        with _profiling.activate(profile):
+            self._fit(X, y)
 
         # record fitted metadata
         self._is_fitted = True
+        self._recent_batches = None  # `partial_fit` window restarts from this fit
         self._last_input_columns = list(X.columns)
+        self._output_schema = self._probe_output_schema(X, profile)
+        population = _sampling.active_population()
+        self._sampling_report = _sampling.report(self, profile, population) if population is not None else None
         # call logging hook
         self._log("fit", {"input_shape": X.shape, "fitted_params": dict(self._fitted_params)})
         return self
@@ -87,14 +223,39 @@ class BaseTransformer(abc.ABC):
         if not self._is_fitted:
             raise NotFittedError(f"Transformer {self.name} is not fitted. Call .fit() first.")
 
+        backend = _backend.get_backend(X)
+        if backend in (_backend.POLARS, _backend.ARROW) and _backend.POLARS in self._native_backends:
+            return self._transform_native(X, backend)
+
         X = self._validate_input(X, require_same_columns=True)
 
         transformed = self._transform(X)
+        # Inputs with exactly the fit columns must produce exactly the fitted output schema.
+        transformed = self._conform_output(transformed, reorder=len(X.columns) == len(self._last_input_columns or ()))
 
         # call logging hook
         self._log("transform", {"input_shape": X.shape, "output_shape": transformed.shape})
+        if backend not in (None, _backend.PANDAS):
+            transformed = _backend.from_pandas(transformed, backend)
         return transformed
 
+    def _transform_native(self, X: Any, backend: str) -> Any:
+        """Run `_transform_polars` on a Polars (or zero-copy wrapped Arrow) input."""
+        X = _backend.to_polars(X)
+        self._check_columns(list(X.columns))
+        if self._drops_unread_columns():
+            X = X.select(self.required_columns)
+        transformed = self._transform_polars(X)
+        self._log("transform", {"input_shape": X.shape, "output_shape": transformed.shape})
+        return _backend.from_polars(transformed, backend)
+
+    def _transform_polars(self, X: Any) -> Any:
+        """
+        Optional Polars implementation of `_transform`. Classes that implement it add
+        "polars" to `_native_backends`.
+        """
+        raise NotImplementedError
+
     def fit_transform(self, X: pd.DataFrame, y: Optional[pd.Series] = None) -> pd.DataFrame:
         """
         Convenience: fit then transform.
@@ -113,6 +274,267 @@ class BaseTransformer(abc.ABC):
     def fitted_params(self) -> Dict[str, Any]:
         return dict(self._fitted_params)
 
+    @property
+    def output_schema(self) -> Optional[Dict[str, Any]]:
+        """
+        Output contract recorded at fit time: ``{"columns", "dtypes", "block_dtype"}``, where
+        `block_dtype` is the NumPy dtype shared by every output column (or None).
+        None if the transformer is unfitted or its output could not be probed.
+        """
+        return getattr(self, "_output_schema", None)
+
+    @property
+    def sampling_report(self) -> Optional[Dict[str, Any]]:
+        """
+        For a transformer fitted with `fit(..., sample=...)` (or inside a sampled Pipeline
+        fit): ``{"sample_size", "population_size", "fraction", "errors"}``, where `errors`
+        holds estimated errors of the fitted statistics (see `_sampling_errors`). None otherwise.
+        """
+        return getattr(self, "_sampling_report", None)
+
+    @property
+    def required_columns(self) -> List[str]:
+        """
+        Input columns the fitted transformer reads at transform time. By default every
+        column seen during fit; transformers that ignore some of them narrow this.
+        Only these columns are checked by `transform`.
+        """
+        if not self._is_fitted:
+            raise NotFittedError(f"Transformer {self.name} is not fitted. Call .fit() first.")
+        return list(self._last_input_columns or [])
+
+    def _modified_columns(self) -> Optional[List[str]]:
+        """
+        Input columns whose values (or dtype) the fitted transformer changes; every other
+        input column it outputs passes through unchanged, so a Pipeline carries their
+        profiled statistics over to the next step. None means unknown (nothing is reused).
+        """
+        return None
+
+    def _sampling_errors(self, profile: "_profiling.DataProfile", population_size: int) -> Dict[str, Any]:
+        """
+        Estimated errors of the statistics fitted on the sample `profile.frame`, drawn from
+        `population_size` rows (see `transfory.sampling` for the estimators). Empty by default.
+        """
+        return {}
+
+    def _drops_unread_columns(self) -> bool:
+        """
+        Whether input columns outside `required_columns` never reach the output. If so,
+        `transform` projects the input onto `required_columns` before copying it.
+        """
+        return False
+
+    def get_params(self) -> Dict[str, Any]:
+        """
+        Return the constructor parameters of this transformer, read from the attributes
+        of the same name (`logging_callback` is read from `_logging_callback`).
+        Raises AttributeError if a parameter is not stored on the instance.
+        """
+        params = {}
+        for param in inspect.signature(self.__class__.__init__).parameters.values():
+            if param.name == "self" or param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+                continue
+            attr = "_logging_callback" if param.name == "logging_callback" else param.name
+            params[param.name] = getattr(self, attr)
+        return params
+
+    def clone(self) -> "BaseTransformer":
+        """
+        Return a new, unfitted transformer with the same constructor parameters.
+
+        Only parameters are copied, never fitted state, so cloning a fitted transformer
+        (or a Pipeline of them) is cheap. Nested transformers inside list/tuple parameters
+        (e.g. Pipeline steps) are cloned recursively. Transformers whose parameters cannot
+        be recovered from their attributes fall back to `copy.deepcopy`.
+        """
+        try:
+            params = self.get_params()
+        except AttributeError:
+            return copy.deepcopy(self)
+        return self.__class__(**{k: _clone_param(v) for k, v in params.items()})
+
+    # ------------------------------
+    # Merging partition fits
+    # ------------------------------
+    def merge(self, other: "BaseTransformer") -> "BaseTransformer":
+        """
+        Fold the fitted state of `other` into this transformer and return self.
+
+        `other` must be the same kind of transformer, with the same parameters, fitted on
+        another partition of the data. The result is the transformer that fitting on both
+        partitions together would give. Moments, counts, vocabularies and min/max are merged
+        exactly. Quantiles come from `QuantileSketch`es and are exact until a column passes
+        the sketch size, then bounded-error. Transformers that cannot merge raise
+        ConfigurationError.
+
+        The merged transformer covers the union of both fits' columns (this fit's columns
+        first): a column only one side saw is fitted on that side's values alone. This lets
+        a streamed step absorb columns that appear in later batches, such as new one-hot
+        columns from an Encoder before it.
+        """
+        if self._frozen:
+            raise FrozenTransformerError(f"Transformer {self.name} is frozen and cannot be refit.")
+        if not self._is_fitted or not getattr(other, "_is_fitted", False):
+            raise NotFittedError(f"Both transformers must be fitted before merging into {self.name}.")
+        if type(other) is not type(self):
+            raise ConfigurationError(f"Cannot merge {type(other).__name__} into {type(self).__name__}.")
+        if _merge_params(self) != _merge_params(other):
+            raise ConfigurationError(f"Cannot merge transformers with different parameters: {self!r} and {other!r}.")
+        for transformer in (self, other):
+            if not transformer._has_merge_state():
+                raise ConfigurationError(
+                    f"{transformer.name} has no merge state: fit it inside `keep_merge_state()` "
+                    f"(or with `partial_fit`) to merge it."
+                )
+
+        self._merge(other)
+        self._last_input_columns = _union_columns(self._last_input_columns, other._last_input_columns)
+
+        # Partitions that produced different output layouts (e.g. new one-hot categories)
+        # leave the merged output schema unknown (`partial_fit` probes it again).
+        if self._output_schema != other._output_schema:
+            self._output_schema = None
+        self._log("merge", {"fitted_params": dict(self._fitted_params)})
+        return self
+
+    @classmethod
+    def combine(cls, transformers: Iterable["BaseTransformer"]) -> "BaseTransformer":
+        """
+        Reduce transformers fitted on disjoint partitions into one new fitted transformer
+        (see `merge`). The inputs are left unchanged.
+        """
+        transformers = list(transformers)
+        if not transformers:
+            raise ConfigurationError("`combine` needs at least one fitted transformer.")
+        merged = copy.deepcopy(transformers[0])
+        merged._frozen = False
+        for other in transformers[1:]:
+            merged.merge(other)
+        return merged
+
+    def _has_merge_state(self) -> bool:
+        """Whether the sufficient statistics in `_merge_state_attributes` were kept by the last fit."""
+        return all(getattr(self, attr, None) is not None for attr in self._merge_state_attributes)
+
+    def _merge(self, other: "BaseTransformer") -> None:
+        """
+        Subclass hook for `merge`: combine `other`'s fitted state into self, over the union
+        of both fits' columns. Parameters and fitted status have already been checked.
+        """
+        raise ConfigurationError(f"{self.__class__.__name__} ('{self.name}') does not support merging fitted state.")
+
+    # ------------------------------
+    # Incremental fitting
+    # ------------------------------
+    def partial_fit(self, X: pd.DataFrame, y: Optional[pd.Series] = None) -> "BaseTransformer":
+        """
+        Update the fitted state with one more batch, at a cost that depends on the batch
+        and not on the data seen before. The batch is fitted on its own and merged in (see
+        `merge`), so only transformers that support merging can be updated.
+
+        Transformers with a `decay` option down-weight the state fitted so far by `decay`
+        before each batch is merged (exponential forgetting). With a `window` option, the
+        fitted state covers only the last `window` batches. Otherwise every batch counts
+        equally, as if all of them had been fitted together. The first call fits.
+        """
+        if self._frozen:
+            raise FrozenTransformerError(f"Transformer {self.name} is frozen and cannot be refit.")
+        batch = self.clone()
+        with _routed_logs(batch, None), keep_merge_state():
+            batch.fit(X, y)
+
+        decay, window = getattr(self, "decay", None), getattr(self, "window", None)
+        with _routed_logs(self, None):
+            if window is not None:
+                # Per-batch states are kept so the oldest one can be dropped; the fitted
+                # state is re-merged from the (bounded) window.
+                # A state from `fit` counts as one batch.
+                recent = getattr(self, "_recent_batches", None)
+                if recent is None:
+                    recent = [copy.deepcopy(self)] if self._is_fitted else []
+                recent = (recent + [batch])[-window:]
+                self._adopt(recent[0])
+                for other in recent[1:]:
+                    self.merge(other)
+                self._recent_batches = recent
+            elif not self._is_fitted:
+                self._adopt(batch)
+            else:
+                if decay is not None:
+                    self._decay(decay, batch)
+                self.merge(batch)
+            if self._output_schema is None:
+                self._output_schema = self._probe_output_schema(_backend.to_pandas(X))
+        self._log("partial_fit", {"input_shape": X.shape, "fitted_params": dict(self._fitted_params)})
+        return self
+
+    def _adopt(self, source: "BaseTransformer") -> None:
+        """Replace this transformer's fitted state with a copy of `source`'s (same class and parameters)."""
+        callback = self._logging_callback
+        self.__dict__.update(copy.deepcopy(source.__dict__))
+        self._logging_callback = callback
+
+    def _decay(self, factor: float, batch: "BaseTransformer") -> None:
+        """
+        Subclass hook for `partial_fit(decay=...)`: down-weight the fitted state by `factor`
+        before `batch` (the newly fitted batch) is merged in.
+        """
+        raise ConfigurationError(f"{self.__class__.__name__} ('{self.name}') does not support decayed updates.")
+
+    def fit_stream(self, chunks: Iterable[Any], checkpoint: Optional[str] = None, checkpoint_every: int = 1,
+                   resume_from: Optional[Any] = None) -> "BaseTransformer":
+        """
+        Fit on a stream of chunks with `partial_fit`, optionally checkpointing the progress.
+
+        Parameters
+        ----------
+        chunks : iterable
+            DataFrames, or `(DataFrame, y)` pairs, e.g. from `fileio.iter_batches`.
+        checkpoint : str, optional
+            File the partially fitted state and the number of chunks fitted so far are
+            written to (atomically) every `checkpoint_every` chunks and at the end.
+        checkpoint_every : int
+            Chunks between checkpoints.
+        resume_from : str or Checkpoint, optional
+            A checkpoint of this transformer (same class and, for Pipelines, the same step
+            names and classes). Its state is restored and the first `offset` chunks of
+            `chunks`, the same stream from the start, are skipped without being fitted.
+        """
+        from . import checkpoint as _checkpoint
+        if self._frozen:
+            raise FrozenTransformerError(f"Transformer {self.name} is frozen and cannot be refit.")
+        if not isinstance(checkpoint_every, (int, np.integer)) or isinstance(checkpoint_every, bool) or checkpoint_every < 1:
+            raise ConfigurationError(f"`checkpoint_every` must be a positive int, got {checkpoint_every!r}.")
+
+        offset = 0
+        if resume_from is not None:
+            saved = _checkpoint.load_checkpoint(resume_from)
+            if _checkpoint.layout(saved.transformer) != _checkpoint.layout(self):
+                raise ConfigurationError(
+                    f"Checkpoint holds {_checkpoint.layout(saved.transformer)}, which does not match "
+                    f"{_checkpoint.layout(self)}; it cannot be resumed into '{self.name}'."
+                )
+            self._adopt(saved.transformer)
+            offset = saved.offset
+
+        n_chunks = n_saved = 0
+        for chunk in chunks:
+            n_chunks += 1
+            if n_chunks <= offset:
+                continue
+            X, y = chunk if isinstance(chunk, tuple) else (chunk, None)
+            self.partial_fit(X, y)
+            if checkpoint is not None and (n_chunks - offset) % checkpoint_every == 0:
+                _checkpoint.save_checkpoint(self, checkpoint, n_chunks)
+                n_saved = n_chunks
+        if n_chunks < offset:
+            raise ConfigurationError(f"The stream has {n_chunks} chunks but the checkpoint was taken after {offset}.")
+        if checkpoint is not None and n_saved != n_chunks:
+            _checkpoint.save_checkpoint(self, checkpoint, n_chunks)
+        self._log("fit_stream", {"n_chunks": n_chunks, "resumed_from": offset})
+        return self
+
     def freeze(self) -> None:
         """Prevent further calls to fit() — useful after saving a trained pipeline."""
         self._frozen = True
@@ -143,39 +565,135 @@ class BaseTransformer(abc.ABC):
             raise TypeError("Loaded object is not a BaseTransformer.")
         return obj
 
+    # ------------------------------
+    # Export
+    # ------------------------------
+    def _numpy_source(self, fn_name: str, input_columns: List[str]) -> Tuple[List[str], List[str]]:
+        """
+        Return (source_lines, output_columns) for a NumPy-only function `fn_name(cols) -> cols`
+        that reproduces this fitted transformer on a dict of 1-D arrays.
+        Subclasses that can be exported override this; see `numpy_export.compile_numpy_function`.
+        """
+        raise ConfigurationError(f"{self.__class__.__name__} ('{self.name}') does not support export to a NumPy function.")
+
     # ------------------------------
     # Validation and helpers
     # ------------------------------
     def _validate_input(self, X: pd.DataFrame, require_same_columns: bool = False) -> pd.DataFrame:
         """
         Ensure X is a pandas DataFrame and optionally ensure columns match those seen during fit.
+        polars.DataFrame and pyarrow.Table inputs are converted to pandas.
         Returns a shallow copy for safety.
         """
-        if not isinstance(X, pd.DataFrame):
-            raise TypeError(f"{self.name} expects a pandas.DataFrame, got {type(X)}")
+        backend = _backend.get_backend(X)
+        if backend is None:
+            raise TypeError(f"{self.name} expects a pandas.DataFrame, polars.DataFrame or pyarrow.Table, got {type(X)}")
+        if backend != _backend.PANDAS:
+            X = _backend.to_pandas(X)
 
         # Optionally check columns match training
-        if require_same_columns and self._last_input_columns is not None:
-            # Check that all columns from `fit` are present in `transform`'s X.
-            # This is more flexible than an exact match, allowing extra columns.
-            fit_cols_set = set(self._last_input_columns)
-            transform_cols_set = set(X.columns)
-
-            if not fit_cols_set.issubset(transform_cols_set):
-                missing_cols = fit_cols_set - transform_cols_set # Use ColumnMismatchError
-                raise ColumnMismatchError(
-                    f"Missing columns for {self.name}. Transformer was fitted on {self._last_input_columns}, "
-                    f"but the following columns are missing from the input: {list(missing_cols)}."
-                )
+        if require_same_columns:
+            self._check_columns(X.columns)
+            if self._drops_unread_columns():
+                required = self.required_columns
+                if len(required) < len(X.columns):
+                    # Column selection already returns a new frame holding only what is read.
+                    return X[required]
 
         # return a shallow copy to avoid accidental in-place edits by subclasses
         return X.copy()
 
+    @staticmethod
+    def _schema_of(df: Any) -> Optional[Dict[str, Any]]:
+        """Column order and dtypes of a pandas output frame (or of a lazy frame, without computing it)."""
+        if not isinstance(df, pd.DataFrame) and _backend.get_backend(df) != _backend.LAZY:
+            return None
+        # LazyFeatureFrame takes its dtypes from an empty slice.
+        columns, dtypes = list(df.columns), list(df.dtypes)
+        uniform = (bool(columns) and len(set(columns)) == len(columns)
+                   and all(isinstance(dtype, np.dtype) and dtype == dtypes[0] for dtype in dtypes))
+        return {"columns": columns, "dtypes": dtypes, "block_dtype": dtypes[0] if uniform else None}
+
+    def _probe_output_schema(self, X: Any, profile: Optional[_profiling.DataProfile] = None) -> Optional[Dict[str, Any]]:
+        """
+        Record the output schema by silently transforming two fit rows: the first row, and a
+        copy of it that is missing in every column with missing fit values (read from the
+        profile's null counts), so NaN-driven dtypes (e.g. int -> float) are part of the
+        contract whichever batch is transformed first. Returns None if the probe fails.
+        """
+        if not isinstance(X, pd.DataFrame) or X.empty:
+            return None
+        self._output_schema = None
+        try:
+            profile = profile if profile is not None else _profiling.DataProfile(X)
+            missing = [i for i, col in enumerate(X.columns) if profile.has_missing(col)]
+            probe = X.iloc[[0, 0] if missing else [0]].copy()
+            for i in missing:
+                probe.iloc[1, i] = None
+            with _routed_logs(self, None):
+                return self._schema_of(self._transform(probe))
+        except Exception:
+            return None
+
+    def _conform_output(self, out: Any, reorder: bool = True) -> Any:
+        """
+        Enforce the fitted output schema on a pandas result. With `reorder`, the output is
+        reordered to the fitted columns in one operation (a different column set raises
+        ColumnMismatchError). NumPy dtypes are restored when the cast is lossless
+        (e.g. int -> float, or integral floats -> int); integer columns that
+        received missing values stay float. Other dtypes are left as produced.
+        """
+        schema = self.output_schema
+        if schema is None or not isinstance(out, pd.DataFrame) or not out.columns.is_unique:
+            return out
+        columns = schema["columns"]
+        if reorder and list(out.columns) != columns:
+            if len(out.columns) != len(columns) or set(out.columns) != set(columns):
+                raise ColumnMismatchError(
+                    f"Output of {self.name} does not match the columns recorded at fit time. "
+                    f"Missing: {[c for c in columns if c not in out.columns]}, "
+                    f"unexpected: {[c for c in out.columns if c not in set(columns)]}."
+                )
+            out = out[columns]
+        casts = {}
+        for col, dtype in zip(columns, schema["dtypes"]):
+            if col not in out.columns:
+                continue
+            current = out[col].dtype
+            if current == dtype or not (isinstance(current, np.dtype) and isinstance(dtype, np.dtype)):
+                continue
+            if np.can_cast(current, dtype, casting="safe"):
+                casts[col] = dtype
+            elif current.kind == "f" and dtype.kind in "iub":
+                values = out[col].to_numpy()
+                if np.isfinite(values).all() and (values == np.round(values)).all():
+                    casts[col] = dtype
+        return out.astype(casts) if casts else out
+
+    def _check_columns(self, columns: Iterable[str]) -> None:
+        """
+        Raise ColumnMismatchError if any of `required_columns` is missing from `columns`.
+        Column layouts that already passed are cached in `transfory.schema`.
+        """
+        if self._last_input_columns is None:
+            return
+        # Check that all columns from `fit` are present in `transform`'s X.
+        # This is more flexible than an exact match, allowing extra columns.
+        required = self.required_columns
+        if not _schema.covers_columns(columns, required):
+            missing_cols = set(required) - set(columns) # Use ColumnMismatchError
+            raise ColumnMismatchError(
+                f"Missing columns for {self.name}. Transformer was fitted on {self._last_input_columns}, "
+                f"but the following columns are missing from the input: {list(missing_cols)}."
+            )
+
     def _log(self, event: str, details: Dict[str, Any], step_name: Optional[str] = None, config: Optional[Dict[str, Any]] = None, transformer_name: Optional[str] = None) -> None:
         """
-        Internal logging hook. If a logging_callback is set, call it with standardized payload.
+        Internal logging hook. If a logging_callback is set (or routed to this transformer
+        for the current call), call it with standardized payload.
         """
-        if not callable(self._logging_callback):
+        callback = self._current_callback()
+        if not callable(callback):
             return
 
         # If a config is passed directly (e.g., from a ColumnTransformer forwarding a sub-log),
@@ -197,20 +715,40 @@ class BaseTransformer(abc.ABC):
                 "config": config_params,
             }
             # Use the provided step_name (from a pipeline) or the transformer's own name.
-            self._logging_callback(step_name or self.name, payload)
+            callback(step_name or self.name, payload)
         except Exception:
             # Logging should never break pipeline execution. Silently ignore logging errors.
             # In development you may want to raise or print a warning.
             pass
 
+    def _current_callback(self) -> Optional[Callable[[str, Dict[str, Any]], None]]:
+        """The callback for the current call: a route set by an enclosing orchestrator, else our own."""
+        routes = _log_routes.get()
+        return routes[id(self)] if id(self) in routes else self._logging_callback
+
     def __getstate__(self) -> Dict[str, Any]:
         """
-        Customize serialization. Exclude the logging callback, which is not serializable.
+        Customize serialization. Exclude the logging callback, which is not serializable,
+        and (outside `keep_merge_state()`) the merge state, which `transform` does not need.
         """
         state = self.__dict__.copy()
         state["_logging_callback"] = None  # Exclude non-serializable callback
+        if not _keeps_merge_state():
+            for attr in self._merge_state_attributes:
+                state.pop(attr, None)
+            if "_recent_batches" in state:
+                state["_recent_batches"] = None
         return state
 
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "BaseTransformer":
+        """Copy the full fitted state, merge state included; the logging callback is not copied."""
+        duplicate = self.__class__.__new__(self.__class__)
+        memo[id(self)] = duplicate
+        state = {key: value for key, value in self.__dict__.items() if key != "_logging_callback"}
+        duplicate.__dict__.update(copy.deepcopy(state, memo))
+        duplicate._logging_callback = None
+        return duplicate
+
     def __setstate__(self, state: Dict[str, Any]) -> None:
         """
         Customize deserialization.
@@ -236,6 +774,42 @@ class BaseTransformer(abc.ABC):
         return len(self._fitted_params)
 
 
+def _union_columns(first: Iterable[Any], second: Iterable[Any]) -> List[Any]:
+    """The columns of `first`, then those of `second` not in `first`, in order."""
+    first = list(first)
+    seen = set(first)
+    return first + [col for col in second if col not in seen]
+
+
+def _updatable(transformer: Any) -> bool:
+    """Whether `partial_fit` can update the fitted transformer (it merges batches or has its own `partial_fit`)."""
+    if not isinstance(transformer, BaseTransformer):
+        return False
+    cls = type(transformer)
+    return cls._merge is not BaseTransformer._merge or cls.partial_fit is not BaseTransformer.partial_fit
+
+
+def _merge_params(transformer: BaseTransformer) -> Any:
+    """Parameters that must agree for two fits to merge (names, callbacks and `n_jobs` may differ)."""
+    try:
+        params = transformer.get_params()
+    except AttributeError:
+        return None
+    return repr({k: v for k, v in params.items() if k not in ("name", "logging_callback", "n_jobs")})
+
+
+def _clone_param(value: Any) -> Any:
+    """Clone one constructor parameter for `BaseTransformer.clone`."""
+    if isinstance(value, BaseTransformer):
+        return value.clone()
+    if isinstance(value, (list, tuple)) and any(isinstance(v, (BaseTransformer, list, tuple)) for v in value):
+        return type(value)(_clone_param(v) for v in value)
+    if callable(value):
+        # Callables (selectors, logging callbacks) are shared, not copied.
+        return value
+    return copy.deepcopy(value)
+
+
 # ------------------------------
 # Minimal example subclass for demonstration / testing
 # ------------------------------
@@ -0,0 +1,68 @@
+"""
+Checkpoints for long-running streaming fits.
+
+`fit_stream(chunks, checkpoint=path)` saves the partially fitted transformer (for a
+Pipeline, every step) together with the number of chunks fitted so far. After a
+crash or pre-emption, `fit_stream(chunks, resume_from=path)` restores that state and
+skips the chunks it already covers instead of starting over.
+
+Checkpoints are written atomically: the state goes to a temporary file in the same
+directory, which then replaces the previous checkpoint, so a crash mid-write leaves
+the last complete checkpoint in place. Unlike a plain pickle, a checkpoint keeps the
+merge state (see `keep_merge_state`) the remaining chunks are merged into. Logging
+callbacks are not saved; a resumed transformer keeps its own.
+"""
+
+from __future__ import annotations
+import os
+import tempfile
+from typing import Any, NamedTuple, Union
+
+import joblib
+
+from .base import keep_merge_state
+from .exceptions import ConfigurationError
+
+# Bumped when the checkpoint layout changes.
+FORMAT_VERSION = 1
+
+
+class Checkpoint(NamedTuple):
+    """A partially fitted transformer and the number of chunks (`offset`) it has been fitted on."""
+    transformer: Any
+    offset: int
+
+
+def save_checkpoint(transformer: Any, path: str, offset: int) -> None:
+    """Atomically write `transformer` and `offset` to `path`."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".checkpoint-", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f, keep_merge_state():
+            joblib.dump({"format": FORMAT_VERSION, "offset": offset, "transformer": transformer}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_checkpoint(source: Union[str, Checkpoint]) -> Checkpoint:
+    """Read a checkpoint written by `save_checkpoint` (a `Checkpoint` is returned as is)."""
+    if isinstance(source, Checkpoint):
+        return source
+    state = joblib.load(source)
+    if not isinstance(state, dict) or state.get("format") != FORMAT_VERSION:
+        raise ConfigurationError(f"'{source}' is not a Transfory checkpoint (format {FORMAT_VERSION}).")
+    return Checkpoint(state["transformer"], state["offset"])
+
+
+def layout(transformer: Any) -> Any:
+    """Class and nested step names / classes: what a checkpoint must match to be resumed into `transformer`."""
+    steps = getattr(transformer, "steps", None)
+    if not isinstance(steps, list):
+        return type(transformer).__name__
+    return type(transformer).__name__, [(name, layout(step)) for name, step in steps]
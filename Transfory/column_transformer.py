@@ -1,9 +1,14 @@
 import pandas as pd
 import numpy as np
+import contextlib
 import copy
 from typing import Any, Dict, List, Optional, Tuple, Union, Callable
-from .base import BaseTransformer
-from .exceptions import InvalidStepError, PipelineProcessingError, NotFittedError, ConfigurationError
+from .base import BaseTransformer, _routed_logs, _union_columns, _updatable, keep_merge_state
+from .exceptions import InvalidStepError, PipelineProcessingError, NotFittedError, ConfigurationError, FrozenTransformerError
+from .numpy_export import _literal, _indent
+from . import backend as _backend
+from .schema import select_columns
+from .profiling import activate, profile_of
 
 class ColumnTransformer(BaseTransformer):
     """
@@ -38,6 +43,8 @@ class ColumnTransformer(BaseTransformer):
     logging_callback : callable, optional
         A callback function for logging events, typically from an InsightReporter.
     """
+    # Branches handle their own backends, so Polars/Arrow frames are only split and re-joined here.
+    _native_backends = ("polars",)
 
     def __init__(self,
                  transformers: List[Tuple[str, Union[BaseTransformer, str], Union[str, List[str], Callable]]],
@@ -75,9 +82,9 @@ class ColumnTransformer(BaseTransformer):
             return [col for col in selector if col in X.columns]
         elif isinstance(selector, str):
             if selector == 'numeric':
-                return X.select_dtypes(include=np.number).columns.tolist()
+                return select_columns(X, np.number)
             elif selector == 'categorical':
-                return X.select_dtypes(include=['object', 'category']).columns.tolist() # Use ConfigurationError
+                return select_columns(X, ['object', 'category'])
             else:
                 raise ConfigurationError(f"Unknown string selector '{selector}'. Use 'numeric', 'categorical', or a list of column names.")
         elif callable(selector):
@@ -89,6 +96,7 @@ class ColumnTransformer(BaseTransformer):
             raise TypeError(f"Invalid column selector type: {type(selector)}. Must be list, str, or callable.")
 
     def _fit(self, X: pd.DataFrame, y: Optional[pd.Series] = None) -> None:
+        profile = profile_of(X)
         processed_transformers_info = []
         all_selected_cols = set()
         explicit_passthrough_cols = set()
@@ -106,21 +114,16 @@ class ColumnTransformer(BaseTransformer):
                 self._log("fit_skip_transformer", {"transformer_name": t_instance.name if isinstance(t_instance, BaseTransformer) else t_name, "reason": "No columns selected for transformation."})
                 continue
 
-            # Create a deep copy of the transformer to ensure isolation
-            cloned_transformer = copy.deepcopy(t_instance)
-
-            # Route sub-transformer's logs through this ColumnTransformer's logger
-            cloned_transformer._logging_callback = lambda sub_step_name, payload: self._log(
-                event=payload.get("event", "unknown"),
-                details=payload.get("details", {}),
-                transformer_name=payload.get("transformer_name"), # Pass sub-transformer's name
-                config=payload.get("config"), # Pass sub-transformer's config
-                step_name=f"{t_name}::{sub_step_name}" # Prefix sub-step name
-            )
+            # Fit an unfitted clone so the user's instance is never modified. Cloning copies
+            # constructor params only; objects without `clone` fall back to a deep copy.
+            cloned_transformer = t_instance.clone() if isinstance(t_instance, BaseTransformer) else copy.deepcopy(t_instance)
 
             self._log("fit_sub_transformer_start", {"transformer_name": cloned_transformer.name, "columns": actual_cols, "input_shape": X[actual_cols].shape})
+            branch_input = X[actual_cols]
             try:
-                cloned_transformer.fit(X[actual_cols], y)
+                # Branches share the column statistics already profiled for X.
+                with self._branch_logs(t_name, cloned_transformer), activate(profile.derive(branch_input, ())):
+                    cloned_transformer.fit(branch_input, y)
             except Exception as e:
                 raise PipelineProcessingError(f"Error during 'fit' in ColumnTransformer step '{t_name}': {e}") from e
 
@@ -141,50 +144,212 @@ class ColumnTransformer(BaseTransformer):
         ]
 
 
+    def partial_fit(self, X: pd.DataFrame, y: Optional[pd.Series] = None) -> "ColumnTransformer":
+        """
+        Update every branch with one more batch: each branch is updated with `partial_fit`
+        on its columns of the batch. The first call fits. Columns a selector picks for the
+        first time are added to its branch (which merges on the union of the columns), and
+        a branch whose selector first matches now is fitted on them. Branches that cannot
+        be updated (see `Pipeline.partial_fit`) raise ConfigurationError.
+        """
+        if self._frozen:
+            raise FrozenTransformerError(f"Transformer {self.name} is frozen and cannot be refit.")
+        if not self._is_fitted:
+            # Branches keep their merge state, so later batches can be merged into them.
+            with keep_merge_state():
+                return self.fit(X, y)
+
+        X = self._validate_input(X)
+        fitted = {t_name: (transformer, actual_cols)
+                  for t_name, transformer, actual_cols in self._fitted_params['processed_transformers']}
+        for t_name, (transformer, _) in fitted.items():
+            if not _updatable(transformer):
+                raise ConfigurationError(
+                    f"ColumnTransformer step '{t_name}' ({transformer.__class__.__name__}) cannot be updated "
+                    f"with partial_fit: it neither merges fitted state nor has its own partial_fit."
+                )
+
+        processed_transformers_info = []
+        explicit_passthrough_cols = set()
+        for t_name, t_instance, col_selector in self.transformers:
+            if t_instance == 'passthrough':
+                explicit_passthrough_cols.update(col_selector)
+                continue
+            transformer, actual_cols = fitted.get(t_name, (None, []))
+            actual_cols = _union_columns(actual_cols, self._get_columns_by_selector(X, col_selector))
+            if not actual_cols:
+                continue
+            if transformer is None:
+                # The selector matches columns for the first time: `partial_fit` fits the clone.
+                transformer = t_instance.clone() if isinstance(t_instance, BaseTransformer) else copy.deepcopy(t_instance)
+            try:
+                with self._branch_logs(t_name, transformer):
+                    transformer.partial_fit(X[actual_cols], y)
+            except Exception as e:
+                raise PipelineProcessingError(f"Error during 'partial_fit' in ColumnTransformer step '{t_name}': {e}") from e
+            processed_transformers_info.append((t_name, transformer, actual_cols))
+
+        columns = _union_columns(self._last_input_columns, X.columns)
+        handled_cols = {col for _, _, actual_cols in processed_transformers_info for col in actual_cols}
+        handled_cols.update(explicit_passthrough_cols)
+        self._fitted_params['processed_transformers'] = processed_transformers_info
+        self._fitted_params['passthrough_columns'] = _union_columns(
+            self._fitted_params['passthrough_columns'], [col for col in X.columns if col in explicit_passthrough_cols])
+        self._fitted_params['remainder_columns'] = [col for col in columns if col not in handled_cols]
+        self._last_input_columns = columns
+        self._output_schema = self._probe_output_schema(X)
+        self._log("partial_fit", {"input_shape": X.shape, "fitted_params": dict(self._fitted_params)})
+        return self
+
     def _transform(self, X: pd.DataFrame) -> pd.DataFrame:
         if not self.is_fitted:
             raise NotFittedError(f"Transformer {self.name} is not fitted. Call .fit() first.")
+        return self._transform_parts(X)
+
+    def _transform_parts(self, X: Any) -> Any:
+        """Run every branch on its columns and assemble the output."""
+        is_pandas = isinstance(X, pd.DataFrame)
+        # Output layout recorded at fit time (see BaseTransformer.output_schema).
+        schema = self.output_schema if is_pandas else None
+        block, position = None, 0
+        if schema is not None and schema['block_dtype'] is not None:
+            # Every output column shares one NumPy dtype: write branch results straight into a
+            # single preallocated (n_columns, n_rows) block, the layout pandas stores internally.
+            block = np.empty((len(schema['columns']), len(X)), dtype=schema['block_dtype'])
 
         transformed_parts = []
-        
-        # Process each fitted transformer
         for t_name, fitted_transformer, actual_cols in self._fitted_params['processed_transformers']:
-            # Route sub-transformer's logs through this ColumnTransformer's logger
-            fitted_transformer._logging_callback = lambda sub_step_name, payload: self._log(
-                event=payload.get("event", "unknown"),
-                details=payload.get("details", {}),
-                transformer_name=payload.get("transformer_name"), # Pass sub-transformer's name
-                config=payload.get("config"), # Pass sub-transformer's config
-                step_name=f"{t_name}::{sub_step_name}" # Prefix sub-step name
-            )
-            self._log("transform_sub_transformer_start", {"transformer_name": fitted_transformer.name, "columns": actual_cols, "input_shape": X[actual_cols].shape})
-            try:
-                transformed_subset = fitted_transformer.transform(X[actual_cols])
-            except Exception as e:
-                raise PipelineProcessingError(f"Error during 'transform' in ColumnTransformer step '{t_name}': {e}") from e
-
-            self._log("transform_sub_transformer_end", {"transformer_name": fitted_transformer.name, "columns": actual_cols, "output_shape": transformed_subset.shape})
-            transformed_parts.append(transformed_subset)
+            transformed_parts.append(self._transform_branch(X, t_name, fitted_transformer, actual_cols))
 
         # Handle explicit passthrough columns
         if self._fitted_params['passthrough_columns']:
-            passthrough_df = X[self._fitted_params['passthrough_columns']].copy()
-            transformed_parts.append(passthrough_df)
+            transformed_parts.append(self._select(X, self._fitted_params['passthrough_columns']))
             self._log("transform_passthrough", {"columns": self._fitted_params['passthrough_columns'], "reason": "Explicitly passed through."})
 
         # Handle remainder columns
         if self.remainder == 'passthrough' and self._fitted_params['remainder_columns']:
-            remainder_df = X[self._fitted_params['remainder_columns']].copy()
-            transformed_parts.append(remainder_df)
+            transformed_parts.append(self._select(X, self._fitted_params['remainder_columns']))
             self._log("transform_remainder", {"columns": self._fitted_params['remainder_columns'], "reason": "Remainder columns passed through."})
 
+        if not is_pandas:
+            pl = _backend.import_optional("polars")
+            return pl.concat(transformed_parts, how="horizontal") if transformed_parts else X.select([])
+
         if not transformed_parts:
             # If no transformers ran and no passthrough/remainder, return an empty DataFrame
             return pd.DataFrame(index=X.index)
-        
-        # Concatenate all parts
-        X_out = pd.concat(transformed_parts, axis=1)
-        return X_out
+
+        if block is not None:
+            for part in transformed_parts:
+                width = part.shape[1]
+                if (list(part.columns) != schema['columns'][position:position + width]
+                        or any(dtype != block.dtype for dtype in part.dtypes)
+                        or not part.index.equals(X.index)):
+                    # Output drifted from the fitted schema (e.g. a dtype change); assemble generically.
+                    block = None
+                    break
+                block[position:position + width] = part.to_numpy().T
+                position += width
+        if block is not None and position == len(block):
+            return pd.DataFrame(block.T, index=X.index, columns=schema['columns'], copy=False)
+        return self._assemble(transformed_parts, X.index)
+
+    def _branch_logs(self, t_name: str, transformer: Any):
+        """Route a branch transformer's events through this ColumnTransformer's logger for the current call."""
+        if not isinstance(transformer, BaseTransformer):
+            return contextlib.nullcontext()
+        return _routed_logs(transformer, lambda sub_step_name, payload: self._log(
+            event=payload.get("event", "unknown"),
+            details=payload.get("details", {}),
+            transformer_name=payload.get("transformer_name"), # Pass sub-transformer's name
+            config=payload.get("config"), # Pass sub-transformer's config
+            step_name=f"{t_name}::{sub_step_name}" # Prefix sub-step name
+        ))
+
+    def _transform_branch(self, X: Any, t_name: str, fitted_transformer: Any, actual_cols: List[str]) -> Any:
+        subset = self._select(X, actual_cols)
+        self._log("transform_sub_transformer_start", {"transformer_name": fitted_transformer.name, "columns": actual_cols, "input_shape": subset.shape})
+        try:
+            with self._branch_logs(t_name, fitted_transformer):
+                transformed_subset = fitted_transformer.transform(subset)
+        except Exception as e:
+            raise PipelineProcessingError(f"Error during 'transform' in ColumnTransformer step '{t_name}': {e}") from e
+        if _backend.get_backend(transformed_subset) == _backend.LAZY:
+            # Branch outputs are joined column-wise, so lazy columns are computed here.
+            transformed_subset = transformed_subset.to_pandas()
+
+        self._log("transform_sub_transformer_end", {"transformer_name": fitted_transformer.name, "columns": actual_cols, "output_shape": transformed_subset.shape})
+        return transformed_subset
+
+    @staticmethod
+    def _assemble(parts: List[pd.DataFrame], index: pd.Index) -> pd.DataFrame:
+        """
+        Join output parts column-wise. When column names are unique and every part shares
+        `index`, columns are handed to the new frame without copying or index alignment.
+        """
+        columns = [col for part in parts for col in part.columns]
+        if len(set(columns)) != len(columns) or not all(part.index.equals(index) for part in parts):
+            return pd.concat(parts, axis=1)
+        data = {col: part[col].array for part in parts for col in part.columns}
+        return pd.DataFrame(data, index=index, columns=columns, copy=False)
+
+    @property
+    def required_columns(self) -> List[str]:
+        """With remainder='drop', only the columns routed to a transformer or passed through."""
+        columns = super().required_columns
+        if self.remainder == 'passthrough':
+            return columns
+        read = {col for _, _, actual_cols in self._fitted_params['processed_transformers'] for col in actual_cols}
+        read.update(self._fitted_params['passthrough_columns'])
+        return [col for col in columns if col in read]
+
+    def _sampling_errors(self, profile: Any, population_size: int) -> Dict[str, Any]:
+        return {t_name: fitted_transformer.sampling_report["errors"]
+                for t_name, fitted_transformer, _ in self._fitted_params.get('processed_transformers', [])
+                if isinstance(fitted_transformer, BaseTransformer) and fitted_transformer.sampling_report is not None}
+
+    def _modified_columns(self) -> Optional[List[str]]:
+        modified: List[str] = []
+        for _, fitted_transformer, _ in self._fitted_params.get('processed_transformers', []):
+            columns = fitted_transformer._modified_columns() if isinstance(fitted_transformer, BaseTransformer) else None
+            if columns is None:
+                return None
+            modified.extend(col for col in columns if col not in modified)
+        return modified
+
+    def _drops_unread_columns(self) -> bool:
+        return self.remainder == 'drop'
+
+    def _transform_polars(self, X: Any) -> Any:
+        return self._transform_parts(X)
+
+    @staticmethod
+    def _select(X: Any, columns: List[str]) -> Any:
+        """Column subset of a pandas or Polars frame (list indexing already returns a new pandas frame)."""
+        if isinstance(X, pd.DataFrame):
+            return X[columns]
+        return X.select(columns)
+
+    def _numpy_source(self, fn_name: str, input_columns: List[str]) -> Tuple[List[str], List[str]]:
+        lines: List[str] = [f"def {fn_name}(cols):"]
+        body: List[str] = ["out = {}"]
+        output_columns: List[str] = []
+        for i, (t_name, fitted_transformer, actual_cols) in enumerate(self._fitted_params['processed_transformers']):
+            branch_fn = f"{fn_name}_{i}"
+            branch_lines, branch_out = fitted_transformer._numpy_source(branch_fn, list(actual_cols))
+            lines += _indent(branch_lines)
+            body.append(f"out.update({branch_fn}({{name: cols[name] for name in {_literal(list(actual_cols))}}}))")
+            output_columns += branch_out
+
+        kept = list(self._fitted_params['passthrough_columns'])
+        if self.remainder == 'passthrough':
+            kept += self._fitted_params['remainder_columns']
+        if kept:
+            body.append(f"out.update({{name: cols[name] for name in {_literal(kept)}}})")
+            output_columns += kept
+        body.append("return out")
+        lines += _indent(body) + [""]
+        return lines, output_columns
 
     def __repr__(self) -> str:
         status = "fitted" if self._is_fitted else "unfitted"
@@ -1,7 +1,11 @@
 import pandas as pd
 from typing import Optional, List
-from .base import BaseTransformer
+from .base import BaseTransformer, _check_n_jobs, _map_columns
 from .exceptions import NoApplicableColumnsError
+from .numpy_export import _literal
+from .backend import import_optional, from_pandas, POLARS
+from .schema import select_columns
+from .profiling import profile_of
 class DatetimeFeatureExtractor(BaseTransformer):
     """
     Extracts date and time features from datetime columns.
@@ -10,8 +14,19 @@ class DatetimeFeatureExtractor(BaseTransformer):
     converted to it) and extracts specified features, such as year, month, day,
     etc., into new columns. The original datetime column is dropped after extraction.
     """
+    _native_backends = ("polars",)
 
-    def __init__(self, features: Optional[List[str]] = None, columns: Optional[List[str]] = None, name: Optional[str] = None):
+    # pandas `.dt` attribute -> (Polars `.dt` method, offset added to the result)
+    _POLARS_FEATURES = {
+        "year": ("year", 0), "month": ("month", 0), "day": ("day", 0),
+        "dayofweek": ("weekday", -1), "weekday": ("weekday", -1),
+        "dayofyear": ("ordinal_day", 0), "day_of_year": ("ordinal_day", 0),
+        "quarter": ("quarter", 0), "week": ("week", 0),
+        "hour": ("hour", 0), "minute": ("minute", 0), "second": ("second", 0),
+    }
+
+    def __init__(self, features: Optional[List[str]] = None, columns: Optional[List[str]] = None,
+                 n_jobs: Optional[int] = None, name: Optional[str] = None):
         """
         Initializes the DatetimeFeatureExtractor.
 
@@ -23,10 +38,14 @@ class DatetimeFeatureExtractor(BaseTransformer):
         columns : list of str, optional
             The specific columns to process. If None, the transformer will attempt to
             process all object or datetime64 columns.
+        n_jobs : int, optional
+            Number of threads used to detect datetime columns during fit. None or 1
+            runs serially; -1 uses one thread per core.
         """
         super().__init__(name=name or "DatetimeFeatureExtractor")
         self.features = features or ['year', 'month', 'day', 'dayofweek']
         self.columns = columns
+        self.n_jobs = _check_n_jobs(n_jobs)
         self._fitted_params = {"datetime_columns": []}
 
     def _fit(self, X: pd.DataFrame, y=None):
@@ -35,13 +54,11 @@ class DatetimeFeatureExtractor(BaseTransformer):
             cols_to_process = self.columns
         else:
             # Auto-detect object or datetime columns
-            cols_to_process = X.select_dtypes(include=['object', 'datetime64[ns]']).columns
+            cols_to_process = select_columns(X, ['object', 'datetime64[ns]'])
 
         # Further filter to find columns that are convertible to datetime
-        datetime_cols = []
-        for col in cols_to_process:
-            if pd.api.types.is_datetime64_any_dtype(X[col]) or pd.to_datetime(X[col], errors='coerce').notna().any():
-                datetime_cols.append(col)
+        is_datetime = _map_columns(profile_of(X).datetime_convertible, cols_to_process, self.n_jobs)
+        datetime_cols = [col for col, convertible in zip(cols_to_process, is_datetime) if convertible]
 
         if not datetime_cols:
             raise NoApplicableColumnsError(
@@ -50,6 +67,9 @@ class DatetimeFeatureExtractor(BaseTransformer):
 
         self._fitted_params["datetime_columns"] = datetime_cols
 
+    def _modified_columns(self):
+        return list(self._fitted_params.get("datetime_columns", []))
+
     def _transform(self, X: pd.DataFrame) -> pd.DataFrame:
         """Extracts features from the datetime columns and drops the original."""
         X_out = X.copy()
@@ -75,4 +95,47 @@ class DatetimeFeatureExtractor(BaseTransformer):
             "new_columns_created": new_cols_created,
             "fitted_params": self.fitted_params  # Pass datetime_columns for reporter
         })
-        return X_out
\ No newline at end of file
+        return X_out
+
+    def _transform_polars(self, X):
+        """Polars version of `_transform`. Features Polars has no equivalent for fall back to pandas."""
+        pl = import_optional("polars")
+        if any(feature not in self._POLARS_FEATURES for feature in self.features):
+            return from_pandas(self._transform(X.to_pandas()), POLARS)
+
+        datetime_cols = self._fitted_params.get("datetime_columns", [])
+        exprs, new_cols_created = [], []
+        for col in datetime_cols:
+            series = pl.col(col)
+            if X.schema[col] == pl.String:
+                series = series.str.to_datetime(strict=False)
+            for feature in self.features:
+                method, offset = self._POLARS_FEATURES[feature]
+                expr = getattr(series.dt, method)()
+                if offset:
+                    expr = expr + offset
+                new_col_name = f"{col}_{feature}"
+                exprs.append(expr.alias(new_col_name))
+                new_cols_created.append(new_col_name)
+        X_out = X.with_columns(exprs).drop(datetime_cols)
+
+        self._log("transform", {
+            "input_shape": X.shape,
+            "output_shape": X_out.shape,
+            "new_columns_created": new_cols_created,
+            "fitted_params": self.fitted_params
+        })
+        return X_out
+
+    def _numpy_source(self, fn_name, input_columns):
+        output_columns = list(input_columns)
+        lines = [f"def {fn_name}(cols):", "    cols = dict(cols)"]
+        for col in self._fitted_params.get("datetime_columns", []):
+            lines.append(f"    d = _to_datetime(cols.pop({_literal(col)}))")
+            output_columns.remove(col)
+            for feature in self.features:
+                new_col = f"{col}_{feature}"
+                lines.append(f"    cols[{_literal(new_col)}] = _dt_feature(d, {_literal(feature)})")
+                output_columns.append(new_col)
+        lines += ["    return cols", ""]
+        return lines, output_columns
@@ -1,59 +1,355 @@
 import pandas as pd
+import numpy as np
+import scipy.sparse
 from typing import Optional
-from .base import BaseTransformer
+from .base import BaseTransformer, _check_n_jobs, _keeps_merge_state, _map_columns, _union_columns
 from .exceptions import ConfigurationError, NoApplicableColumnsError
+from .numpy_export import _literal
+from .schema import select_columns
+from .profiling import profile_of
+from .sampling import unseen_share
+from .backend import import_optional, polars_scalar, from_pandas, get_backend, to_pandas, PANDAS, POLARS
+
+# Bucket that infrequent (and, at transform time, unseen) categories are folded into.
+OTHER_CATEGORY = "__other__"
 
 class Encoder(BaseTransformer):
-    def __init__(self, method="onehot", handle_unseen="ignore", name: Optional[str] = None):
+    """
+    Encodes categorical ('object' or 'category') columns as numbers.
+
+    Methods:
+    - 'label': Maps each category seen during fit to an integer (unseen -> -1).
+    - 'onehot': Creates one 0/1 column per category seen during fit.
+    - 'hashing': Hashes each value into one of `n_features` sparse 0/1 columns per
+      input column. No vocabulary is stored, so fit cost and artifact size do not
+      grow with cardinality. Unseen values simply hash into an existing bucket.
+    - 'frequency': Replaces each category with its share of the non-missing fit rows
+      (unseen -> 0.0).
+    - 'target': Replaces each category with the mean of `y` for that category, blended
+      with the global mean: (sum_y + smoothing * prior) / (count + smoothing)
+      (unseen/missing -> prior). `fit_transform` returns out-of-fold encodings over
+      `cv` folds so training rows never see their own target.
+
+    `min_frequency` / `max_categories` cap the vocabulary of every method except
+    'hashing': categories seen fewer than `min_frequency` times (an int count, or a
+    float share of non-missing rows), or outside the `max_categories - 1` most frequent,
+    are folded into a single '__other__' category at fit time. At transform time any
+    value outside the kept vocabulary maps to '__other__' instead of being treated
+    as unseen.
+
+    `n_jobs` builds the per-column vocabularies in parallel on a thread pool.
+    """
+    _native_backends = ("polars",)
+    _merge_state_attributes = ("_stats",)
+
+    def __init__(self, method="onehot", handle_unseen="ignore", n_features: int = 1024,
+                 smoothing: float = 10.0, cv: int = 5, random_state: Optional[int] = None,
+                 min_frequency: Optional[float] = None, max_categories: Optional[int] = None,
+                 n_jobs: Optional[int] = None, name: Optional[str] = None):
         super().__init__(name=name or f"Encoder(method='{method}')")
         
-        supported_methods = ["label", "onehot"]
+        supported_methods = ["label", "onehot", "hashing", "frequency", "target"]
         if method not in supported_methods:
             raise ConfigurationError(f"Method '{method}' is not supported. Use one of {supported_methods}.")
 
         supported_unseen = ["ignore", "error"]
         if handle_unseen not in supported_unseen:
             raise ConfigurationError(f"handle_unseen='{handle_unseen}' is not supported. Use one of {supported_unseen}.")
+
+        if method == "hashing" and (not isinstance(n_features, (int, np.integer)) or n_features < 1):
+            raise ConfigurationError("`n_features` must be a positive integer for method 'hashing'.")
+
+        if method == "target":
+            if smoothing < 0:
+                raise ConfigurationError("`smoothing` must be non-negative.")
+            if not isinstance(cv, (int, np.integer)) or cv < 1:
+                raise ConfigurationError("`cv` must be a positive integer (1 disables out-of-fold encoding).")
+
+        if min_frequency is not None or max_categories is not None:
+            if method == "hashing":
+                raise ConfigurationError("`min_frequency` and `max_categories` cannot be used with method 'hashing'.")
+            if min_frequency is not None and (min_frequency <= 0 or (isinstance(min_frequency, float) and min_frequency >= 1)):
+                raise ConfigurationError("`min_frequency` must be a positive int count or a float share in (0, 1).")
+            if max_categories is not None and (not isinstance(max_categories, (int, np.integer)) or max_categories < 1):
+                raise ConfigurationError("`max_categories` must be a positive integer.")
             
         self.method = method
         self.handle_unseen = handle_unseen
+        self.n_features = n_features
+        self.smoothing = smoothing
+        self.cv = cv
+        self.random_state = random_state
+        self.min_frequency = min_frequency
+        self.max_categories = max_categories
+        # Threads the per-column vocabularies are built on (None/1: serial, -1: all cores).
+        self.n_jobs = _check_n_jobs(n_jobs)
         self._fitted_params = {"mappings": {}}
 
     def _fit(self, X: pd.DataFrame, y=None):
         self._fitted_params["mappings"] = {}
-        cat_cols = X.select_dtypes(include=["object", "category"]).columns
+        self._stats = None
+        cat_cols = pd.Index(select_columns(X, ["object", "category"]))
         if cat_cols.empty:
             raise NoApplicableColumnsError(
                 f"Encoder found no 'object' or 'category' columns to encode. Columns available: {X.columns.tolist()}"
             )
-        for col in cat_cols:
-            # Store unique categories found during fitting
-            unique_cats = X[col].dropna().unique()
+        if self.method == "hashing":
+            # Stateless apart from which columns to hash.
+            self._fitted_params["hashed_columns"] = list(cat_cols)
+            return
+        # Per-category counts (and target sums/counts) are the sufficient statistics every
+        # vocabulary is derived from; they are kept (on request) so partition fits can be merged.
+        stats = {"counts": {}, "target_sums": {}, "target_counts": {}}
+        if self.method == "target":
+            y = self._target_series(X, y)
+            stats["y_sum"], stats["y_count"] = float(y.sum()), int(y.count())
+            y_values = y.to_numpy()
+            y_valid = ~np.isnan(y_values)
+
+        profile = profile_of(X)
+
+        def column_stats(col):
+            # One pass per column (shared through the profile): codes in first-appearance
+            # order give counts via bincount.
+            codes, index = profile.factorize(col)
+            counts = profile.category_counts(col)
+            if self.method != "target":
+                return counts, None, None
+            rows = (codes >= 0) & y_valid
+            return (counts,
+                    pd.Series(np.bincount(codes[rows], weights=y_values[rows], minlength=len(index)), index=index),
+                    pd.Series(np.bincount(codes[rows], minlength=len(index)), index=index))
+
+        for col, (counts, sums, target_counts) in zip(cat_cols, _map_columns(column_stats, cat_cols, self.n_jobs)):
+            stats["counts"][col] = counts
+            if sums is not None:
+                stats["target_sums"][col], stats["target_counts"][col] = sums, target_counts
+        self._set_mappings(stats)
+        if _keeps_merge_state():
+            self._stats = stats
+
+    def _set_mappings(self, stats: dict):
+        """Derive the fitted vocabularies / encodings from the sufficient statistics."""
+        mappings = {}
+        if self.method == "target":
+            prior = stats["y_sum"] / stats["y_count"] if stats["y_count"] else float("nan")
+            self._fitted_params["target_prior"] = prior
+
+        grouping = self.min_frequency is not None or self.max_categories is not None
+        for col, counts in stats["counts"].items():
+            sums, target_counts = stats["target_sums"].get(col), stats["target_counts"].get(col)
+            if grouping:
+                kept = self._frequent_categories(counts)
+                if len(kept) < len(counts):
+                    counts = self._fold_counts(counts, kept)
+                    if sums is not None:
+                        sums, target_counts = self._fold_counts(sums, kept), self._fold_counts(target_counts, kept)
+            unique_cats = list(counts.index)
+
             if self.method == "label":
-                self._fitted_params["mappings"][col] = {cat: i for i, cat in enumerate(unique_cats)}
+                mappings[col] = {cat: i for i, cat in enumerate(unique_cats)}
             elif self.method == "onehot":
-                self._fitted_params["mappings"][col] = list(unique_cats)
+                mappings[col] = unique_cats
+            elif self.method == "frequency":
+                mappings[col] = (counts / counts.sum()).to_dict()
+            elif self.method == "target":
+                encoded = (sums + self.smoothing * prior) / (target_counts + self.smoothing)
+                mappings[col] = encoded.to_dict()
+        self._fitted_params["mappings"] = mappings
+        # Categories and their encoded values as arrays, so `_transform` looks a batch up
+        # through the index's hash table instead of scanning the vocabulary on every call.
+        self._lookups = {col: (pd.Index(list(mapping), dtype=object), np.asarray(list(mapping.values()), dtype=np.float64))
+                         for col, mapping in mappings.items() if isinstance(mapping, dict)}
+
+    def _has_merge_state(self):
+        # Hashing keeps no statistics: there is nothing to merge.
+        return self.method == "hashing" or super()._has_merge_state()
+
+    def _merge(self, other):
+        """Add per-category counts (and target sums); new categories follow this fit's, in their order."""
+        if self.method == "hashing":
+            self._fitted_params["hashed_columns"] = _union_columns(self._fitted_params["hashed_columns"],
+                                                                   other._fitted_params["hashed_columns"])
+            return
+        a, b = self._stats, other._stats
+        merged = {"counts": {}, "target_sums": {}, "target_counts": {}}
+        for key in merged:
+            for col in _union_columns(a[key], b[key]):
+                left, right = a[key].get(col), b[key].get(col)
+                if left is None or right is None:
+                    # A column only one side encoded.
+                    merged[key][col] = left if right is None else right
+                    continue
+                index = left.index.append(right.index.difference(left.index, sort=False))
+                merged[key][col] = left.reindex(index, fill_value=0) + right.reindex(index, fill_value=0)
+        if self.method == "target":
+            merged["y_sum"], merged["y_count"] = a["y_sum"] + b["y_sum"], a["y_count"] + b["y_count"]
+        self._stats = merged
+        self._set_mappings(merged)
+
+    @staticmethod
+    def _fold_counts(counts: pd.Series, kept: list) -> pd.Series:
+        """Sum the entries outside `kept` into one '__other__' entry."""
+        return pd.concat([counts[kept], pd.Series({OTHER_CATEGORY: counts.drop(kept).sum()})])
+
+    def _frequent_categories(self, counts: pd.Series) -> list:
+        """Categories kept by `min_frequency` / `max_categories`, in first-appearance order."""
+        keep = np.ones(len(counts), dtype=bool)
+        if self.min_frequency is not None:
+            threshold = self.min_frequency * counts.sum() if isinstance(self.min_frequency, float) else self.min_frequency
+            keep &= counts.to_numpy() >= threshold
+        if self.max_categories is not None:
+            # Reserve one slot for the '__other__' bucket when anything is folded.
+            limit = self.max_categories if keep.sum() <= self.max_categories and keep.all() else self.max_categories - 1
+            ranked = np.argsort(-counts.to_numpy(), kind="stable")
+            top = np.zeros(len(counts), dtype=bool)
+            top[ranked[:limit]] = True
+            keep &= top
+        return list(counts.index[keep])
+
+    @staticmethod
+    def _fold_rare(values: pd.Series, known) -> pd.Series:
+        """Replace non-missing values outside `known` with '__other__'."""
+        values = values.astype(object)
+        return values.where(values.isin(known) | values.isna(), OTHER_CATEGORY)
+
+    @staticmethod
+    def _target_series(X: pd.DataFrame, y) -> pd.Series:
+        if y is None:
+            raise ConfigurationError("Encoder(method='target') requires `y` to be passed to fit().")
+        y = pd.Series(np.asarray(y, dtype=float), index=X.index)
+        if len(y) != len(X):
+            raise ConfigurationError(f"`y` has {len(y)} rows but X has {len(X)}.")
+        return y
+
+    def _default_value(self):
+        """Encoded value for unseen or missing categories."""
+        if self.method == "label":
+            return -1
+        if self.method == "target":
+            return self._fitted_params.get("target_prior", 0.0)
+        return 0.0
+
+    def fit_transform(self, X, y=None):
+        """
+        Fit then transform. For method='target' with cv > 1, training rows receive
+        out-of-fold encodings instead of encodings that include their own target.
+        """
+        out = super().fit_transform(X, y)
+        if self.method != "target" or self.cv < 2:
+            return out
+
+        backend = get_backend(out)
+        X_pd = to_pandas(X)
+        if backend != PANDAS:
+            out = to_pandas(out)
+        for col, values in self._out_of_fold_encodings(X_pd, self._target_series(X_pd, y)).items():
+            out[col] = values.to_numpy()
+        return out if backend == PANDAS else from_pandas(out, backend)
+
+    def _out_of_fold_encodings(self, X: pd.DataFrame, y: pd.Series):
+        n = len(X)
+        n_folds = min(self.cv, n)
+        folds = np.random.default_rng(self.random_state).permutation(n) % n_folds
+        fold_sum = np.bincount(folds, weights=y.to_numpy(), minlength=n_folds)
+        fold_count = np.bincount(folds, minlength=n_folds)
+        # Prior computed without each row's own fold.
+        row_prior = pd.Series(((y.sum() - fold_sum) / np.maximum(n - fold_count, 1))[folds], index=X.index)
+
+        encodings = {}
+        for col, mapping in self._fitted_params["mappings"].items():
+            if col not in X.columns:
+                continue
+            key = X[col]
+            if OTHER_CATEGORY in mapping:
+                key = self._fold_rare(key, [cat for cat in mapping if cat != OTHER_CATEGORY])
+            # One grouped pass per column: per-(fold, category) sums and counts.
+            stats = y.groupby([folds, key.to_numpy()]).agg(["sum", "count"])
+            totals = stats.groupby(level=1).sum()
+            row_index = pd.MultiIndex.from_arrays([folds, key.to_numpy()])
+            in_fold = stats.reindex(row_index).fillna(0.0).to_numpy()
+            total = totals.reindex(key.to_numpy()).fillna(0.0).to_numpy()
+            oof_sum, oof_count = (total - in_fold).T
+            encoded = (oof_sum + self.smoothing * row_prior.to_numpy()) / (oof_count + self.smoothing)
+            encodings[col] = pd.Series(encoded, index=X.index).where(key.notna(), row_prior)
+        return encodings
+
+    def _sampling_errors(self, profile, population_size):
+        if self.method == "hashing":
+            return {}
+        # Share of rows expected to carry a category the fitted vocabulary lacks.
+        return {"unseen_share": {col: unseen_share(profile.category_counts(col)) for col in self._fitted_params["mappings"]}}
+
+    def _modified_columns(self):
+        if self.method == "hashing":
+            return list(self._fitted_params.get("hashed_columns", []))
+        return list(self._fitted_params.get("mappings", {}))
+
+    def _hash_buckets(self, values: pd.Series):
+        """Return (row positions, bucket ids) for the non-null entries of `values`."""
+        present = values.notna().to_numpy()
+        rows = np.flatnonzero(present)
+        hashes = pd.util.hash_array(values.to_numpy(dtype=object)[present])
+        return rows, (hashes % np.uint64(self.n_features)).astype(np.int64)
+
+    def _transform_hashing(self, X: pd.DataFrame) -> pd.DataFrame:
+        hashed_columns = [c for c in self._fitted_params.get("hashed_columns", []) if c in X.columns]
+        blocks = []
+        for col in hashed_columns:
+            rows, buckets = self._hash_buckets(X[col])
+            matrix = scipy.sparse.csr_matrix(
+                (np.ones(len(rows), dtype=np.int8), (rows, buckets)),
+                shape=(len(X), self.n_features),
+            )
+            blocks.append(pd.DataFrame.sparse.from_spmatrix(
+                matrix, index=X.index, columns=[f"{col}_hash_{i}" for i in range(self.n_features)]
+            ))
+        out = pd.concat([X.drop(columns=hashed_columns)] + blocks, axis=1)
+
+        self._log("transform", {
+            "input_shape": X.shape,
+            "new_columns_added": [c for block in blocks for c in block.columns],
+            "output_shape": out.shape
+        })
+        return out
 
     def _transform(self, X: pd.DataFrame) -> pd.DataFrame:
+        if self.method == "hashing":
+            return self._transform_hashing(X)
+
         mappings = self._fitted_params.get("mappings", {})
         original_cols = X.columns.tolist()
         out = X.copy()
 
-        if self.method == "label":
-            for col, mapping in mappings.items():
+        for col, mapping in mappings.items():
+            if col in out.columns and OTHER_CATEGORY in mapping:
+                out[col] = self._fold_rare(out[col], [cat for cat in mapping if cat != OTHER_CATEGORY])
+
+        if self.method in ("label", "frequency", "target"):
+            default = self._default_value()
+            for col in mappings:
                 if col in out.columns:
-                    # Unseen values will become NaN after mapping
-                    unseen_mask = ~out[col].isin(mapping.keys()) & out[col].notna()
+                    categories, encoded = self._lookups[col]
+                    codes = categories.get_indexer(out[col])
+                    # Unseen values have no position in the fitted categories
+                    unseen_mask = (codes < 0) & out[col].notna().to_numpy()
                     if unseen_mask.any() and self.handle_unseen == "error":
                         unseen_values = out[col][unseen_mask].unique()
                         raise ValueError(f"Unseen categories in column '{col}': {list(unseen_values)}")
-                    
-                    # Map known categories, fill unseen with -1
-                    out[col] = out[col].map(mapping).fillna(-1).astype(int)
+
+                    # Encode known categories, fill unseen/missing with the method's default
+                    values = np.full(len(codes), np.nan)
+                    known = codes >= 0
+                    values[known] = encoded[codes[known]]
+                    values = pd.Series(values, index=out.index).fillna(default)
+                    out[col] = values.astype(int) if self.method == "label" else values
 
             self._log("transform", {"columns_encoded": list(mappings.keys())})
 
         elif self.method == "onehot":
+            # Indicator columns follow the fitted categories, so the output columns never
+            # depend on the batch; they are built first and joined in one operation.
+            indicators, encoded = {}, []
             for col, known_cats in mappings.items():
                 if col in out.columns:
                     unseen_mask = ~out[col].isin(known_cats) & out[col].notna()
@@ -61,20 +357,96 @@ class Encoder(BaseTransformer):
                         unseen_values = out[col][unseen_mask].unique()
                         raise ValueError(f"Unseen categories in column '{col}': {list(unseen_values)}")
 
+                    values = out[col].to_numpy()
                     for cat in known_cats:
                         # Create column for each known category
-                        out[f"{col}_{cat}"] = (out[col] == cat).astype(int)
-                    # Drop original column after encoding
-                    out.drop(columns=[col], inplace=True)
-            
-            new_cols = [c for c in out.columns if c not in original_cols]
+                        indicators[f"{col}_{cat}"] = (values == cat).astype(int)
+                    encoded.append(col)
+            # Drop original columns after encoding
+            out = out.drop(columns=encoded)
+            out = pd.concat([out, pd.DataFrame(indicators, index=out.index)], axis=1) if indicators else out
+
             self._log("transform", {
                 "input_shape": (out.shape[0], len(original_cols)),
-                "new_columns_added": new_cols,
+                "new_columns_added": list(indicators),
                 "output_shape": out.shape
             })
 
         return out
 
+    def _transform_polars(self, X):
+        """Polars version of `_transform`."""
+        pl = import_optional("polars")
+        if self.method == "hashing":
+            # Bucket ids must match the pandas hash used elsewhere, so hash via pandas.
+            return from_pandas(self._transform_hashing(X.to_pandas()), POLARS)
+        mappings = self._fitted_params.get("mappings", {})
+        exprs, encoded = [], []
+        for col, mapping in mappings.items():
+            if col not in X.columns:
+                continue
+            known = [polars_scalar(cat) for cat in mapping]
+            source = pl.col(col)
+            if OTHER_CATEGORY in mapping:
+                kept = [cat for cat in known if cat != OTHER_CATEGORY]
+                source = pl.when(pl.col(col).is_in(kept) | pl.col(col).is_null()).then(pl.col(col).cast(pl.String)).otherwise(pl.lit(OTHER_CATEGORY))
+            elif self.handle_unseen == "error":
+                unseen = X.filter(~pl.col(col).is_in(known) & pl.col(col).is_not_null())[col].unique()
+                if len(unseen):
+                    raise ValueError(f"Unseen categories in column '{col}': {unseen.to_list()}")
+            if self.method in ("label", "frequency", "target"):
+                mapping = {polars_scalar(k): polars_scalar(v) for k, v in mapping.items()}
+                return_dtype = pl.Int64 if self.method == "label" else pl.Float64
+                exprs.append(source.replace_strict(mapping, default=polars_scalar(self._default_value()), return_dtype=return_dtype))
+            elif self.method == "onehot":
+                exprs += [
+                    (source == cat).fill_null(False).cast(pl.Int64).alias(f"{col}_{cat}")
+                    for cat in known
+                ]
+                encoded.append(col)
+
+        out = X.with_columns(exprs).drop(encoded)
+        if self.method == "onehot":
+            self._log("transform", {
+                "input_shape": X.shape,
+                "new_columns_added": [c for c in out.columns if c not in X.columns],
+                "output_shape": out.shape
+            })
+        else:
+            self._log("transform", {"columns_encoded": list(mappings.keys())})
+        return out
+
+    def _numpy_source(self, fn_name, input_columns):
+        if self.method == "hashing":
+            raise ConfigurationError("Encoder(method='hashing') relies on pandas hashing and cannot be exported to a NumPy function.")
+        mappings = self._fitted_params.get("mappings", {})
+        output_columns = list(input_columns)
+        lines = [f"def {fn_name}(cols):", "    cols = dict(cols)"]
+        for col, mapping in mappings.items():
+            if col not in output_columns:
+                continue
+            known = mapping if isinstance(mapping, dict) else dict.fromkeys(mapping)
+            if OTHER_CATEGORY in known:
+                kept = [cat for cat in known if cat != OTHER_CATEGORY]
+                lines.append(f"    cols[{_literal(col)}] = _fold(cols[{_literal(col)}], {_literal(set(kept))}, {_literal(OTHER_CATEGORY)})")
+            elif self.handle_unseen == "error":
+                lines.append(f"    _check_known({_literal(col)}, cols[{_literal(col)}], {_literal(known)})")
+            if self.method in ("label", "frequency", "target"):
+                dtype = "np.int64" if self.method == "label" else "np.float64"
+                lines.append(f"    cols[{_literal(col)}] = _lookup(cols[{_literal(col)}], {_literal(mapping)}, {_literal(self._default_value())}).astype({dtype})")
+            elif self.method == "onehot":
+                lines.append(f"    values = cols.pop({_literal(col)})")
+                output_columns.remove(col)
+                for cat in mapping:
+                    new_col = f"{col}_{cat}"
+                    lines.append(f"    cols[{_literal(new_col)}] = (values == {_literal(cat)}).astype(np.int64)")
+                    output_columns.append(new_col)
+        lines += ["    return cols", ""]
+        return lines, output_columns
+
     def __repr__(self):
+        if self.method == "hashing":
+            return f"Encoder(method='hashing', n_features={self.n_features})"
+        if self.method == "target":
+            return f"Encoder(method='target', smoothing={self.smoothing}, cv={self.cv}, handle_unseen='{self.handle_unseen}')"
         return f"Encoder(method='{self.method}', handle_unseen='{self.handle_unseen}')"
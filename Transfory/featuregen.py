@@ -1,44 +1,165 @@
+import numpy as np
 import pandas as pd
 from itertools import combinations
-from typing import Optional
-from .base import BaseTransformer
-from .exceptions import NoApplicableColumnsError
+from typing import List, Optional, Sequence, Tuple
+from .base import BaseTransformer, _float_dtype
+from .exceptions import ConfigurationError, NoApplicableColumnsError
+from .lazyframe import LazyFeatureFrame
+from .numpy_export import _literal
+from .schema import select_columns
+
+# Candidate features scored per block during screening, bounding the fit-time memory spike.
+_SCREENING_BLOCK = 256
+
+
 class FeatureGenerator(BaseTransformer):
-    def __init__(self, degree=2, include_interactions=True, name: Optional[str] = None, logging_callback: Optional[callable] = None):
+    """
+    Generates polynomial (`col^p`) and pairwise interaction (`col1_x_col2`) features
+    from the numeric columns.
+
+    The candidate set can be narrowed with `interaction_only` (no powers) or an explicit
+    `pairs` list. With `max_features`, candidates are scored on a sample of at most
+    `sample_size` fit rows -- by absolute correlation with `y` ('correlation') or by
+    variance ('variance'; 'auto' picks correlation when `y` is given) -- and only the
+    top `max_features` are kept, so unselected features are never materialized.
+
+    With `lazy=True`, `transform` returns a `LazyFeatureFrame` whose generated columns
+    are computed when read (per column, or per batch via `iter_batches`) instead of up front.
+    """
+
+    def __init__(self, degree=2, include_interactions=True, dtype=None,
+                 max_features: Optional[int] = None, interaction_only: bool = False,
+                 pairs: Optional[Sequence[Tuple[str, str]]] = None, screening: str = "auto",
+                 sample_size: int = 10000, random_state: Optional[int] = None, lazy: bool = False,
+                 name: Optional[str] = None, logging_callback: Optional[callable] = None):
         super().__init__(
             name=name or f"FeatureGenerator(degree={degree})",
             logging_callback=logging_callback
         )
+        if max_features is not None and (not isinstance(max_features, (int, np.integer)) or max_features < 1):
+            raise ConfigurationError("`max_features` must be a positive integer.")
+        if screening not in ("auto", "correlation", "variance"):
+            raise ConfigurationError("`screening` must be 'auto', 'correlation' or 'variance'.")
+        if sample_size < 2:
+            raise ConfigurationError("`sample_size` must be at least 2.")
+        if pairs is not None and not all(isinstance(p, (tuple, list)) and len(p) == 2 for p in pairs):
+            raise ConfigurationError("`pairs` must be a list of (column1, column2) tuples.")
+
         self.degree = degree
         self.include_interactions = include_interactions
+        # float32 / float64: source columns are cast to it and features are generated in it.
+        self.dtype = dtype
+        _float_dtype(dtype)
+        self.max_features = max_features
+        self.interaction_only = interaction_only
+        self.pairs = pairs
+        self.screening = screening
+        self.sample_size = sample_size
+        self.random_state = random_state
+        self.lazy = lazy
 
     def _fit(self, X: pd.DataFrame, y=None):
         # Only select numeric columns
-        numeric_cols = list(X.select_dtypes(include="number").columns)
+        numeric_cols = select_columns(X, "number")
         if not numeric_cols:
             raise NoApplicableColumnsError(
                 f"FeatureGenerator found no numeric columns to generate features from. Columns available: {X.columns.tolist()}"
             )
         self._fitted_params["columns_to_process"] = numeric_cols
 
+        powers = [] if self.interaction_only else [
+            (col, p) for col in numeric_cols for p in range(2, self.degree + 1)
+        ]
+        if self.pairs is not None:
+            unknown = sorted({str(c) for pair in self.pairs for c in pair if c not in numeric_cols})
+            if unknown:
+                raise ConfigurationError(f"`pairs` reference columns that are not numeric fit columns: {unknown}.")
+            interactions = [tuple(pair) for pair in self.pairs]
+        elif self.include_interactions or self.interaction_only:
+            interactions = list(combinations(numeric_cols, 2))
+        else:
+            interactions = []
+
+        if self.max_features is not None and len(powers) + len(interactions) > self.max_features:
+            powers, interactions, scores = self._screen(X, y, powers, interactions)
+            self._fitted_params["feature_scores"] = scores
+        self._fitted_params["powers"] = powers
+        self._fitted_params["interactions"] = interactions
+
+    def _screen(self, X: pd.DataFrame, y, powers, interactions):
+        """Keep the `max_features` best candidates, scored block by block on a row sample."""
+        method = self.screening
+        if method == "auto":
+            method = "variance" if y is None else "correlation"
+        if method == "correlation" and y is None:
+            raise ConfigurationError("FeatureGenerator(screening='correlation') requires `y` to be passed to fit().")
+
+        n = len(X)
+        rows = np.arange(n)
+        if n > self.sample_size:
+            rows = np.sort(np.random.default_rng(self.random_state).choice(n, self.sample_size, replace=False))
+        columns = self._fitted_params["columns_to_process"]
+        sample = X[columns].iloc[rows].to_numpy(dtype=np.float64)
+        position = {col: i for i, col in enumerate(columns)}
+        target = None if method == "variance" else np.asarray(y, dtype=np.float64)[rows]
+
+        candidates = [("power", c) for c in powers] + [("interaction", c) for c in interactions]
+        scores = np.empty(len(candidates))
+        for start in range(0, len(candidates), _SCREENING_BLOCK):
+            block = candidates[start:start + _SCREENING_BLOCK]
+            values = np.column_stack([
+                sample[:, position[a]] ** b if kind == "power" else sample[:, position[a]] * sample[:, position[b]]
+                for kind, (a, b) in block
+            ])
+            scores[start:start + len(block)] = _score(values, target)
+
+        # Top-k by score (ties keep candidate order); output keeps candidate order.
+        keep = np.sort(np.argsort(-np.nan_to_num(scores, nan=-np.inf), kind="stable")[:self.max_features])
+        kept = [candidates[i] for i in keep]
+        names = {i: self._feature_name(kind, pair) for i, (kind, pair) in enumerate(candidates)}
+        return (
+            [pair for kind, pair in kept if kind == "power"],
+            [pair for kind, pair in kept if kind == "interaction"],
+            {names[i]: float(scores[i]) for i in keep},
+        )
+
+    @staticmethod
+    def _feature_name(kind: str, pair) -> str:
+        return f"{pair[0]}^{pair[1]}" if kind == "power" else f"{pair[0]}_x_{pair[1]}"
+
+    def _planned_features(self) -> Tuple[List[Tuple[str, int]], List[Tuple[str, str]]]:
+        """(powers, interactions) to generate; transformers fitted before screening existed derive them."""
+        if "powers" in self._fitted_params:
+            return self._fitted_params["powers"], self._fitted_params["interactions"]
+        columns_to_process = self._fitted_params.get("columns_to_process", [])
+        powers = [(col, p) for col in columns_to_process for p in range(2, self.degree + 1)]
+        interactions = list(combinations(columns_to_process, 2)) if self.include_interactions else []
+        return powers, interactions
+
+    def _modified_columns(self):
+        # Generated columns are new; originals change only when cast to `dtype`.
+        return list(self._fitted_params.get("columns_to_process", [])) if self.dtype is not None else []
+
     def _transform(self, X: pd.DataFrame) -> pd.DataFrame:
         X = X.copy()
         columns_to_process = self._fitted_params.get("columns_to_process", [])
-        new_feature_names = []
+        dtype = _float_dtype(self.dtype)
+        if dtype is not None:
+            X = X.astype({col: dtype for col in columns_to_process})
 
+        powers, interactions = self._planned_features()
+        if self.lazy:
+            return self._transform_lazy(X, powers, interactions)
+        features = {}
         # Polynomial features
-        for col in columns_to_process:
-            for p in range(2, self.degree + 1):
-                new_col_name = f"{col}^{p}"
-                X[new_col_name] = X[col] ** p
-                new_feature_names.append(new_col_name)
-
+        for col, p in powers:
+            features[f"{col}^{p}"] = X[col] ** p
         # Interaction terms
-        if self.include_interactions:
-            for col1, col2 in combinations(columns_to_process, 2):
-                new_col_name = f"{col1}_x_{col2}"
-                X[new_col_name] = X[col1] * X[col2]
-                new_feature_names.append(new_col_name)
+        for col1, col2 in interactions:
+            features[f"{col1}_x_{col2}"] = X[col1] * X[col2]
+        new_feature_names = list(features)
+        if features:
+            X = pd.concat([X, pd.DataFrame(features, index=X.index)], axis=1)
 
         # Log the newly created features for better insight
         self._log("transform", {
@@ -49,5 +170,59 @@ class FeatureGenerator(BaseTransformer):
 
         return X
 
+    def _transform_lazy(self, X: pd.DataFrame, powers, interactions) -> LazyFeatureFrame:
+        """Return X with the generated features attached as recipes, not values."""
+        features = {f"{col}^{p}": ("pow", col, p) for col, p in powers}
+        features.update({f"{col1}_x_{col2}": ("mul", col1, col2) for col1, col2 in interactions})
+        out = LazyFeatureFrame(X, features)
+        self._log("transform", {
+            "input_shape": X.shape,
+            "new_features_created": list(features),
+            "output_shape": out.shape,
+            "lazy": True
+        })
+        return out
+
+    def _numpy_source(self, fn_name, input_columns):
+        columns_to_process = self._fitted_params.get("columns_to_process", [])
+        output_columns = list(input_columns)
+        lines = [f"def {fn_name}(cols):", "    cols = dict(cols)"]
+        if self.dtype is not None:
+            for col in columns_to_process:
+                lines.append(f"    cols[{_literal(col)}] = cols[{_literal(col)}].astype(np.{_float_dtype(self.dtype).name})")
+        powers, interactions = self._planned_features()
+        for col, p in powers:
+            new_col = f"{col}^{p}"
+            lines.append(f"    cols[{_literal(new_col)}] = cols[{_literal(col)}] ** {p}")
+            output_columns.append(new_col)
+        for col1, col2 in interactions:
+            new_col = f"{col1}_x_{col2}"
+            lines.append(f"    cols[{_literal(new_col)}] = cols[{_literal(col1)}] * cols[{_literal(col2)}]")
+            output_columns.append(new_col)
+        lines += ["    return cols", ""]
+        return lines, output_columns
+
     def __repr__(self):
+        if self.max_features is not None:
+            return (f"FeatureGenerator(degree={self.degree}, include_interactions={self.include_interactions}, "
+                    f"max_features={self.max_features}, screening='{self.screening}')")
         return f"FeatureGenerator(degree={self.degree}, include_interactions={self.include_interactions})"
+
+
+def _score(values: np.ndarray, target: Optional[np.ndarray]) -> np.ndarray:
+    """Per-column variance, or absolute Pearson correlation with `target`, ignoring NaNs."""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if target is None:
+            return np.nanvar(values, axis=0)
+        valid = ~np.isnan(values) & ~np.isnan(target)[:, None]
+        n = valid.sum(axis=0)
+        x = np.where(valid, values, 0.0)
+        t = np.where(valid, target[:, None], 0.0)
+        mean_x, mean_t = x.sum(axis=0) / n, t.sum(axis=0) / n
+        # Center before multiplying: E[xy] - E[x]E[y] cancels badly for large means.
+        x = np.where(valid, values - mean_x, 0.0)
+        t = np.where(valid, target[:, None] - mean_t, 0.0)
+        cov = (x * t).sum(axis=0) / n
+        var_x = (x * x).sum(axis=0) / n
+        var_t = (t * t).sum(axis=0) / n
+        return np.nan_to_num(np.abs(cov / np.sqrt(var_x * var_t)), nan=0.0, posinf=0.0)
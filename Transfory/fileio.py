@@ -0,0 +1,217 @@
+"""
+File readers and batch-streaming writers for fitted transformers.
+
+`transformer.required_columns` is passed to pandas as `usecols` (CSV) or
+`columns` (Parquet), so wide source tables are pruned at read time instead of
+being loaded, validated and copied in full. `transform_file` streams a file
+through a transformer batch by batch with a fixed output schema.
+"""
+
+from __future__ import annotations
+import os
+import queue
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import pandas as pd
+
+from .base import BaseTransformer
+from .backend import import_optional, to_pandas
+from .exceptions import ColumnMismatchError, ConfigurationError
+
+FORMATS = ("parquet", "csv")
+
+
+def read_csv(path: Any, transformer: Optional[BaseTransformer] = None, **kwargs: Any) -> pd.DataFrame:
+    """
+    Read a CSV file with `pandas.read_csv`.
+
+    If a fitted `transformer` is given and `usecols` is not, only
+    `transformer.required_columns` are parsed.
+    """
+    if transformer is not None:
+        kwargs.setdefault("usecols", transformer.required_columns)
+    return pd.read_csv(path, **kwargs)
+
+
+def read_parquet(path: Any, transformer: Optional[BaseTransformer] = None, **kwargs: Any) -> pd.DataFrame:
+    """
+    Read a Parquet file with `pandas.read_parquet`.
+
+    If a fitted `transformer` is given and `columns` is not, only
+    `transformer.required_columns` are read from the file.
+    """
+    if transformer is not None:
+        kwargs.setdefault("columns", transformer.required_columns)
+    return pd.read_parquet(path, **kwargs)
+
+
+def iter_batches(path: Any, format: str = "parquet", batch_size: int = 65536,
+                 columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+    """
+    Yield a file as pandas DataFrames of at most `batch_size` rows.
+
+    Parquet files are read batch by batch with pyarrow; CSV files with
+    `pandas.read_csv(chunksize=...)`. `columns` restricts the columns read.
+    """
+    _check_format(format)
+    if format == "parquet":
+        pq = import_optional("pyarrow.parquet")
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size, columns=columns):
+            yield batch.to_pandas()
+    else:
+        with pd.read_csv(path, chunksize=batch_size, usecols=columns) as reader:
+            yield from reader
+
+
+def prefetch(iterable: Iterable[Any], depth: int = 1) -> Iterator[Any]:
+    """
+    Iterate `iterable` on a background thread, keeping up to `depth` items ready,
+    so producing the next item overlaps with consuming the current one.
+    Exceptions raised by the producer are re-raised in the consumer.
+    """
+    items: "queue.Queue[Any]" = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    done = object()
+
+    def put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in iterable:
+                if not put((None, item)):
+                    return
+            put((done, None))
+        except BaseException as e:
+            put((done, e))
+
+    thread = threading.Thread(target=produce, name="transfory-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            marker, item = items.get()
+            if marker is done:
+                if item is not None:
+                    raise item
+                return
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+class _BatchWriter:
+    """Writes transformed batches to one file, enforcing the first batch's columns and dtypes."""
+
+    def __init__(self, path: Any, format: str, **kwargs: Any):
+        self.path = path
+        self.format = format
+        self.kwargs = kwargs
+        self.columns: Optional[List[str]] = None
+        self._arrow_schema = None
+        self._parquet_writer = None
+        self._n_written = 0
+
+    def _conform(self, df: pd.DataFrame) -> pd.DataFrame:
+        if self.columns is None:
+            self.columns = list(df.columns)
+            return df
+        if list(df.columns) != self.columns:
+            if set(df.columns) != set(self.columns) or len(df.columns) != len(self.columns):
+                extra = [c for c in df.columns if c not in self.columns]
+                missing = [c for c in self.columns if c not in df.columns]
+                raise ColumnMismatchError(
+                    f"Batch output columns differ from the first batch. Missing: {missing}, unexpected: {extra}."
+                )
+            df = df[self.columns]
+        return df
+
+    def write(self, df: pd.DataFrame) -> None:
+        df = self._conform(to_pandas(df))
+        first = self._n_written == 0
+        self._n_written += 1
+        if self.format == "csv":
+            df.to_csv(self.path, mode="w" if first else "a", header=first, index=False, **self.kwargs)
+            return
+        pa = import_optional("pyarrow")
+        pq = import_optional("pyarrow.parquet")
+        if first:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            self._arrow_schema = table.schema
+            self._parquet_writer = pq.ParquetWriter(self.path, self._arrow_schema, **self.kwargs)
+        else:
+            # Casting to the first batch's schema keeps dtypes identical across row groups.
+            table = pa.Table.from_pandas(df, schema=self._arrow_schema, preserve_index=False)
+        self._parquet_writer.write_table(table)
+
+    def close(self) -> None:
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+
+
+def transform_file(transformer: BaseTransformer, src: Any, dst: Any, format: str = "parquet",
+                   batch_size: int = 65536, prefetch_batches: int = 1,
+                   write_kwargs: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Stream `src` through a fitted transformer into `dst`, one batch at a time.
+
+    Parameters
+    ----------
+    transformer : BaseTransformer
+        A fitted transformer or Pipeline. Only its `required_columns` are read.
+    src, dst : str or path-like
+        Input and output files, both in `format`.
+    format : {'parquet', 'csv'}
+        File format. Parquet is written as one row group per batch.
+    batch_size : int
+        Maximum rows per batch.
+    prefetch_batches : int
+        Number of batches read ahead on a background thread while the current batch
+        transforms. 0 reads synchronously.
+    write_kwargs : dict, optional
+        Extra arguments for `pyarrow.parquet.ParquetWriter` or `DataFrame.to_csv`.
+
+    Returns
+    -------
+    dict
+        ``{"n_rows", "n_batches", "columns"}`` of the written output. Every batch is
+        written with the first batch's columns and dtypes; a batch whose output columns
+        differ raises ColumnMismatchError.
+    """
+    _check_format(format)
+    if batch_size < 1:
+        raise ConfigurationError("`batch_size` must be a positive integer.")
+    if prefetch_batches < 0:
+        raise ConfigurationError("`prefetch_batches` must be non-negative.")
+
+    batches: Iterable[pd.DataFrame] = iter_batches(src, format, batch_size, columns=transformer.required_columns)
+    if prefetch_batches:
+        batches = prefetch(batches, depth=prefetch_batches)
+
+    writer = _BatchWriter(dst, format, **(write_kwargs or {}))
+    n_rows = n_batches = 0
+    try:
+        for batch in batches:
+            writer.write(transformer.transform(batch))
+            n_rows += len(batch)
+            n_batches += 1
+    except BaseException:
+        writer.close()
+        if os.path.exists(dst):
+            os.remove(dst)
+        raise
+    writer.close()
+    return {"n_rows": n_rows, "n_batches": n_batches, "columns": writer.columns}
+
+
+def _check_format(format: str) -> None:
+    if format not in FORMATS:
+        raise ConfigurationError(f"Unsupported file format '{format}'. Choose from {list(FORMATS)}.")
@@ -137,6 +137,10 @@ class InsightReporter:
         # Encoder
         if "encoder" in logic_transformer_name:
             if event == "fit":
+                hashed_columns = details.get("fitted_params", {}).get("hashed_columns", [])
+                if hashed_columns:
+                    n_features = config.get("n_features", "unknown")
+                    return f"Step '{step_name}' (Encoder) fitted for 'hashing' encoding on {len(hashed_columns)} column(s) into {n_features} buckets each: {hashed_columns}."
                 mappings = details.get("fitted_params", {}).get("mappings", {})
                 if mappings:
                     cols = list(mappings.keys())
@@ -146,10 +150,10 @@ class InsightReporter:
                         return f"Step '{step_name}' (Encoder) fitted for 'onehot' encoding on {len(cols)} column(s). This will create {total_new_cols} new columns."
                     return f"Step '{step_name}' (Encoder) fitted for '{method}' encoding on {len(cols)} column(s): {cols}."
                 return f"Step '{step_name}' (Encoder) fitted, but no categorical columns were found to encode."
-            if event == "transform" and config.get("method") == 'onehot':
+            if event == "transform" and config.get("method") in ('onehot', 'hashing'):
                 new_cols = details.get("new_columns_added", [])
                 if new_cols:
-                    return f"Step '{step_name}' (Encoder) applied 'onehot' encoding, creating {len(new_cols)} new columns and removing originals."
+                    return f"Step '{step_name}' (Encoder) applied '{config.get('method')}' encoding, creating {len(new_cols)} new columns and removing originals."
 
         # Scaler
         if "scaler" in logic_transformer_name:
@@ -0,0 +1,124 @@
+"""
+Frames whose generated columns are computed on access.
+
+`FeatureGenerator(lazy=True)` returns a `LazyFeatureFrame`: the source columns are
+held as a regular pandas DataFrame and each generated column is stored only as a
+recipe (a power of one column, or the product of two). Generated columns are
+computed when they are read -- one column via `frame[col]`, or one row batch at a
+time via `iter_batches` -- so consumers that read in mini-batches never hold more
+than a batch of generated features in memory.
+
+Transformers accept a `LazyFeatureFrame` like any other input and materialize it
+with `to_pandas()`.
+"""
+
+from __future__ import annotations
+from typing import Dict, Hashable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+# name -> ("pow", column, power) or ("mul", column1, column2)
+FeatureSpec = Tuple[str, Hashable, Union[Hashable, int]]
+
+
+def _compute(frame: pd.DataFrame, spec: FeatureSpec) -> pd.Series:
+    op, left, right = spec
+    if op == "pow":
+        return frame[left] ** right
+    if op == "mul":
+        return frame[left] * frame[right]
+    raise ValueError(f"Unknown lazy feature operation '{op}'.")
+
+
+class LazyFeatureFrame:
+    """
+    A pandas DataFrame plus generated columns that are computed on access.
+
+    Parameters
+    ----------
+    base : pd.DataFrame
+        The materialized columns.
+    features : dict
+        Generated column name -> ``("pow", column, power)`` or ``("mul", column1, column2)``,
+        referring to columns of `base`. Generated columns follow `base`'s columns, in order.
+    """
+
+    def __init__(self, base: pd.DataFrame, features: Dict[Hashable, FeatureSpec]):
+        self.base = base
+        self.features = dict(features)
+
+    # ------------------------------
+    # DataFrame-like metadata
+    # ------------------------------
+    @property
+    def columns(self) -> pd.Index:
+        return pd.Index(list(self.base.columns) + list(self.features))
+
+    @property
+    def generated_columns(self) -> List[Hashable]:
+        return list(self.features)
+
+    @property
+    def index(self) -> pd.Index:
+        return self.base.index
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return (len(self.base), self.base.shape[1] + len(self.features))
+
+    @property
+    def dtypes(self) -> pd.Series:
+        """Column dtypes, taken from an empty slice so nothing is computed."""
+        return self._materialize(self.base.iloc[:0], list(self.columns)).dtypes
+
+    def __len__(self) -> int:
+        return len(self.base)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self.columns)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.features or key in self.base.columns
+
+    # ------------------------------
+    # Access
+    # ------------------------------
+    def __getitem__(self, key: Union[Hashable, Sequence[Hashable]]) -> Union[pd.Series, pd.DataFrame]:
+        """A single column (as a Series) or a list of columns (as a DataFrame), computed now."""
+        if isinstance(key, list):
+            return self._materialize(self.base, key)
+        if key in self.features:
+            return _compute(self.base, self.features[key]).rename(key)
+        return self.base[key]
+
+    def iter_batches(self, batch_size: int = 1024, columns: Optional[Sequence[Hashable]] = None) -> Iterator[pd.DataFrame]:
+        """
+        Yield the frame as pandas DataFrames of at most `batch_size` rows. Generated columns
+        are computed per batch; `columns` restricts which columns are computed and returned.
+        """
+        if batch_size < 1:
+            raise ValueError("`batch_size` must be a positive integer.")
+        columns = list(self.columns) if columns is None else list(columns)
+        for start in range(0, len(self.base), batch_size):
+            yield self._materialize(self.base.iloc[start:start + batch_size], columns)
+
+    def head(self, n: int = 5) -> pd.DataFrame:
+        return self._materialize(self.base.iloc[:n], list(self.columns))
+
+    def to_pandas(self, columns: Optional[Sequence[Hashable]] = None) -> pd.DataFrame:
+        """Materialize all (or the given) columns as a pandas DataFrame."""
+        return self._materialize(self.base, list(self.columns) if columns is None else list(columns))
+
+    def _materialize(self, frame: pd.DataFrame, columns: List[Hashable]) -> pd.DataFrame:
+        missing = [c for c in columns if c not in self]
+        if missing:
+            raise KeyError(f"Columns not found: {missing}")
+        data = {
+            col: _compute(frame, self.features[col]) if col in self.features else frame[col]
+            for col in columns
+        }
+        return pd.DataFrame(data, index=frame.index, columns=columns)
+
+    def __repr__(self) -> str:
+        return (f"LazyFeatureFrame({self.shape[0]} rows, {self.base.shape[1]} materialized columns, "
+                f"{len(self.features)} generated columns)")
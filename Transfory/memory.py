@@ -0,0 +1,213 @@
+import copy
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Optional
+from .base import BaseTransformer, _keeps_merge_state, _union_columns
+from .exceptions import ConfigurationError
+from .numpy_export import _literal
+from .profiling import DataProfile, profile_of
+
+# Candidate integer dtypes, narrowest first, by signedness of the column.
+_SIGNED = (np.dtype(np.int8), np.dtype(np.int16), np.dtype(np.int32), np.dtype(np.int64))
+_UNSIGNED = (np.dtype(np.uint8), np.dtype(np.uint16), np.dtype(np.uint32), np.dtype(np.uint64))
+
+
+class MemoryOptimizer(BaseTransformer):
+    """
+    Casts each column to the narrowest dtype that holds its fit-time values, to cut the
+    memory of everything downstream. Use it as the first step of a Pipeline.
+
+    - Integer columns are downcast to the smallest integer type of the same signedness
+      that holds their fit-time range.
+    - float64 columns become float32 when every fit value survives the round trip within
+      a relative error of `float_rtol` (0: exactly). `float_rtol=None` keeps floats.
+    - String columns with at most `category_ratio` distinct values per non-missing row
+      become `category`, with the fit-time values as categories. Other string columns
+      become Arrow-backed `string[pyarrow]` (if pyarrow is installed).
+
+    `transform` applies all casts in one `astype` mapping. Integer columns whose values
+    fall outside the range of their narrow type keep their dtype, columns that arrive with
+    a different dtype than at fit (e.g. integers as floats) are left alone, and values
+    unseen at fit time are added to a category column's categories, so no value is ever lost.
+
+    `partial_fit` and `merge` widen the plan over batches: ranges, float round-trip errors,
+    row counts and categories are combined.
+    """
+    _merge_state_attributes = ("_stats",)
+
+    def __init__(self, category_ratio: float = 0.5, float_rtol: Optional[float] = 0.0,
+                 name: Optional[str] = None, logging_callback: Optional[callable] = None):
+        super().__init__(name=name or "MemoryOptimizer", logging_callback=logging_callback)
+        if isinstance(category_ratio, bool) or not isinstance(category_ratio, (int, float)) or not 0 <= category_ratio <= 1:
+            raise ConfigurationError(f"`category_ratio` must be a number in [0, 1], got {category_ratio!r}.")
+        if float_rtol is not None and (isinstance(float_rtol, bool) or not isinstance(float_rtol, (int, float)) or float_rtol < 0):
+            raise ConfigurationError(f"`float_rtol` must be None or a non-negative number, got {float_rtol!r}.")
+        self.category_ratio = category_ratio
+        self.float_rtol = float_rtol
+        self._dtypes: Dict[Any, Any] = {}  # column -> dtype it is cast to (changed columns only)
+
+    def _fit(self, X: pd.DataFrame, y=None):
+        profile = profile_of(X)
+        column_stats = {}
+        for col in X.columns:
+            stats = _column_stats(profile, col, self.category_ratio)
+            if stats is not None:
+                column_stats[col] = stats
+        self._plan(column_stats)
+        self._stats = column_stats if _keeps_merge_state() else None
+
+    def _plan(self, column_stats: Dict[Any, Dict[str, Any]]) -> None:
+        """Choose the target dtype of every column from its statistics."""
+        arrow = _has_pyarrow()
+        dtypes = {}
+        for col, stats in column_stats.items():
+            kind = stats["kind"]
+            if kind == "int":
+                dtype = _narrowest_int(stats["dtype"], stats["min"], stats["max"])
+            elif kind == "float":
+                rtol = self.float_rtol
+                dtype = np.dtype(np.float32) if rtol is not None and stats["error"] <= rtol else stats["dtype"]
+            elif stats["categories"] is not None:
+                dtype = pd.CategoricalDtype(stats["categories"])
+            elif arrow and getattr(stats["dtype"], "storage", None) != "pyarrow":
+                dtype = pd.StringDtype("pyarrow")
+            else:
+                dtype = stats["dtype"]
+            if dtype != stats["dtype"]:
+                dtypes[col] = dtype
+        self._dtypes = dtypes
+        self._fitted_params["dtypes"] = {col: str(dtype) for col, dtype in dtypes.items()}
+
+    def _merge(self, other):
+        """Widen integer ranges, take the larger float32 error and union the categories."""
+        for col in _union_columns(self._stats, other._stats):
+            stats, theirs = self._stats.get(col), other._stats.get(col)
+            if stats is None:
+                self._stats[col] = copy.deepcopy(theirs)
+                continue
+            if theirs is None or theirs["kind"] != stats["kind"]:
+                continue
+            if stats["kind"] == "int":
+                stats["min"], stats["max"] = min(stats["min"], theirs["min"]), max(stats["max"], theirs["max"])
+            elif stats["kind"] == "float":
+                stats["error"] = max(stats["error"], theirs["error"])
+            else:
+                stats["count"] += theirs["count"]
+                if stats["categories"] is None or theirs["categories"] is None:
+                    stats["categories"] = None
+                else:
+                    stats["categories"] = stats["categories"].append(theirs["categories"]).unique()
+                    stats["categories"] = _keep_categories(stats["categories"], stats["count"], self.category_ratio)
+        self._plan(self._stats)
+
+    def _modified_columns(self):
+        return list(self._dtypes)
+
+    def _transform(self, X: pd.DataFrame) -> pd.DataFrame:
+        # Columns that no longer have the dtype they were planned from (e.g. integers that
+        # arrive as floats, with NaN or fractions) are left as they are.
+        dtypes = {col: dtype for col, dtype in self._dtypes.items() if col in X.columns and _castable(X[col].dtype, dtype)}
+        ints = [col for col, dtype in dtypes.items() if isinstance(dtype, np.dtype) and dtype.kind in "iu"]
+        if ints:
+            # Values outside a narrow type's range would wrap around: keep those columns as they are.
+            lo, hi = X[ints].min(), X[ints].max()
+            for col in ints:
+                info = np.iinfo(dtypes[col])
+                if lo[col] < info.min or hi[col] > info.max:
+                    del dtypes[col]
+        for col, dtype in dtypes.items():
+            if isinstance(dtype, pd.CategoricalDtype):
+                # Values unseen at fit time are appended to the categories instead of becoming missing.
+                values = X[col]
+                unseen = values.notna().to_numpy() & ~values.isin(dtype.categories).to_numpy()
+                if unseen.any():
+                    extra = pd.Index(pd.unique(values[unseen]), dtype=object)
+                    dtypes[col] = pd.CategoricalDtype(dtype.categories.append(extra))
+        return X.astype(dtypes) if dtypes else X.copy()
+
+    def _numpy_source(self, fn_name, input_columns):
+        # Only numeric casts apply to NumPy arrays; string columns pass through.
+        lines = [f"def {fn_name}(cols):", "    cols = dict(cols)"]
+        for col, dtype in self._dtypes.items():
+            if not isinstance(dtype, np.dtype):
+                continue
+            name = _literal(col)
+            if dtype.kind in "iu":
+                # Same dtype and range checks as `_transform`; `initial` makes them pass for empty arrays.
+                info = np.iinfo(dtype)
+                lines += [
+                    f"    if {name} in cols and cols[{name}].dtype.kind in 'iu' "
+                    f"and cols[{name}].min(initial={info.min}) >= {info.min} "
+                    f"and cols[{name}].max(initial={info.max}) <= {info.max}:",
+                    f"        cols[{name}] = cols[{name}].astype(np.{dtype.name})",
+                ]
+            else:
+                lines += [f"    if {name} in cols and cols[{name}].dtype == np.float64:",
+                          f"        cols[{name}] = cols[{name}].astype(np.{dtype.name})"]
+        lines += ["    return cols", ""]
+        return lines, list(input_columns)
+
+    def __repr__(self):
+        return f"MemoryOptimizer(category_ratio={self.category_ratio}, float_rtol={self.float_rtol})"
+
+
+def _column_stats(profile: DataProfile, col, category_ratio: float) -> Optional[Dict[str, Any]]:
+    """What the dtype choice of one column depends on, or None for columns that are left alone."""
+    values = profile.frame[col]
+    dtype = values.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in "iu":
+        if not len(values):
+            return None
+        return {"kind": "int", "dtype": dtype, "min": int(values.min()), "max": int(values.max())}
+    if isinstance(dtype, np.dtype) and dtype == np.float64:
+        return {"kind": "float", "dtype": dtype, "error": _float32_error(values.to_numpy())}
+    if isinstance(dtype, pd.CategoricalDtype) or not pd.api.types.is_string_dtype(values):
+        return None
+    count = len(values) - profile.null_count(col)
+    categories = _keep_categories(profile.factorize(col)[1], count, category_ratio)
+    return {"kind": "string", "dtype": dtype, "count": count, "categories": categories}
+
+
+def _castable(source: Any, target: Any) -> bool:
+    """Whether a column of dtype `source` can take the planned cast to `target` without losing values."""
+    if isinstance(target, np.dtype) and target.kind in "iu":
+        return isinstance(source, np.dtype) and source.kind in "iu"
+    if isinstance(target, np.dtype) and target == np.float32:
+        return isinstance(source, np.dtype) and source == np.float64
+    return True
+
+
+def _keep_categories(categories: pd.Index, count: int, ratio: float) -> Optional[pd.Index]:
+    """The categories while the column is low-cardinality, else None (it stays a string column)."""
+    return categories if len(categories) <= ratio * count else None
+
+
+def _float32_error(values: np.ndarray) -> float:
+    """Largest relative error of casting the values to float32 (inf if any value overflows)."""
+    finite = values[np.isfinite(values)]
+    if not len(finite):
+        return 0.0
+    with np.errstate(over="ignore"):
+        rounded = finite.astype(np.float32).astype(np.float64)
+    if not np.isfinite(rounded).all():
+        return float("inf")
+    nonzero = finite != 0
+    if (rounded[~nonzero] != 0).any():
+        return float("inf")
+    return float(np.max(np.abs(rounded[nonzero] - finite[nonzero]) / np.abs(finite[nonzero]), initial=0.0))
+
+
+def _narrowest_int(dtype: np.dtype, lo: int, hi: int) -> np.dtype:
+    for candidate in (_UNSIGNED if dtype.kind == "u" else _SIGNED):
+        info = np.iinfo(candidate)
+        if info.min <= lo and hi <= info.max:
+            return candidate if candidate.itemsize < dtype.itemsize else dtype
+    return dtype
+
+
+def _has_pyarrow() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
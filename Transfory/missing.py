@@ -1,7 +1,16 @@
 import pandas as pd
 import numpy as np
-from .base import BaseTransformer as Transformer
+from .base import BaseTransformer as Transformer, FLOAT_DTYPES, _check_decay_window, _check_n_jobs, _float_dtype, _keeps_merge_state, _map_columns, _union_columns
 from .exceptions import ConfigurationError
+from .numpy_export import _literal
+from .backend import import_optional, polars_scalar, polars_float
+from .schema import select_columns
+from .profiling import DataProfile, profile_of
+from .sampling import mean_error, quantile_error
+from .sketch import merge_sketches
+
+# Marks columns the strategy does not fill (e.g. non-numeric columns under 'mean').
+_NO_FILL = object()
 
 class MissingValueHandler(Transformer):
     """
@@ -12,8 +21,21 @@ class MissingValueHandler(Transformer):
     - 'median': Fills missing values with the median of the column (numeric only).
     - 'mode': Fills missing values with the mode of the column (numeric or categorical).
     - 'constant': Fills missing values with a provided `fill_value`.
+
+    With `dtype` (float32 or float64), every numeric column is cast to it: statistics
+    are computed on the cast values and the filled columns are returned in it.
+    `n_jobs` computes per-column statistics in parallel on a thread pool.
+
+    `partial_fit` updates the fill values with a new batch. With `decay`, the sums and
+    counts ('mean'), sketch weights ('median') or value counts ('mode') fitted so far are
+    multiplied by `decay` before each batch is merged. With `window`, only the last
+    `window` batches count.
     """
-    def __init__(self, strategy="mean", fill_value=None, name: str = None):
+    _native_backends = ("polars",)
+    _merge_state_attributes = ("_stats",)
+
+    def __init__(self, strategy="mean", fill_value=None, dtype=None, decay=None, window=None,
+                 n_jobs: int = None, name: str = None):
         super().__init__(name=name or f"MissingValueHandler(strategy='{strategy}')")
         
         supported_strategies = ["mean", "median", "mode", "constant"]
@@ -24,37 +46,187 @@ class MissingValueHandler(Transformer):
 
         self.strategy = strategy
         self.fill_value = fill_value
+        self.dtype = dtype
+        _float_dtype(dtype)
+        # Threads the per-column statistics are computed on (None/1: serial, -1: all cores).
+        self.n_jobs = _check_n_jobs(n_jobs)
+        # `partial_fit` forgetting: old state weighted by `decay` per batch, or only the last `window` batches.
+        self.decay, self.window = _check_decay_window(decay, window)
         self._fill_values = {}  # stored during fit
 
     def _fit(self, X: pd.DataFrame, y=None):
         """Calculate the imputation values for each column based on the strategy."""
         self._fill_values = {}
-        for col in X.columns:
-            if X[col].isna().any():
-                if self.strategy == "mean":
-                    if pd.api.types.is_numeric_dtype(X[col]):
-                        self._fill_values[col] = X[col].mean()
-                elif self.strategy == "median":
-                    if pd.api.types.is_numeric_dtype(X[col]):
-                        self._fill_values[col] = X[col].median()
-                elif self.strategy == "mode":
-                    self._fill_values[col] = X[col].mode().iloc[0]
-                elif self.strategy == "constant":
-                    self._fill_values[col] = self.fill_value
-        
+        dtype = _float_dtype(self.dtype)
+        if dtype is not None:
+            numeric_cols = select_columns(X, "number")
+            self._fitted_params["numeric_columns"] = numeric_cols
+            X = X.astype({col: dtype for col in numeric_cols})
+        # Statistics come from the shared profile (a fresh one for the cast frame).
+        profile = profile_of(X)
+        missing = [col for col in X.columns if profile.has_missing(col)]
+        fills = _map_columns(lambda col: self._fill_value(profile, col), missing, self.n_jobs)
+        self._fill_values = {col: value for col, value in zip(missing, fills) if value is not _NO_FILL}
+
         # Store fitted params for logging and persistence
         self._fitted_params["fill_values"] = self._fill_values
+        self._stats = self._sufficient_stats(X, profile, missing) if _keeps_merge_state() else None
+
+    def _fill_value(self, profile: DataProfile, col):
+        """Fill value for one column with missing values, or _NO_FILL if the strategy does not apply."""
+        values = profile.frame[col]
+        numeric = pd.api.types.is_numeric_dtype(values)
+        # Scalars of the column's float type (float64 for other numbers), as pandas returns them.
+        scalar = values.dtype.type if values.dtype in FLOAT_DTYPES else np.float64
+        if self.strategy == "mean":
+            return scalar(profile.mean(col)) if numeric else _NO_FILL
+        if self.strategy == "median":
+            return scalar(profile.median(col)) if numeric else _NO_FILL
+        if self.strategy == "mode":
+            return _mode(profile.value_counts(col))
+        return self.fill_value
+
+    def _sufficient_stats(self, X: pd.DataFrame, profile: DataProfile, missing: list) -> dict:
+        """Per-column statistics the fill values are derived from, kept (on request) so partition fits can merge."""
+        stats = {"missing": missing}
+        numeric_cols = select_columns(X, "number")
+        if self.strategy == "mean":
+            stats["sum"] = {col: profile.sum(col) for col in numeric_cols}
+            stats["count"] = {col: profile.count(col) for col in numeric_cols}
+        elif self.strategy == "median":
+            stats["sketch"] = dict(zip(numeric_cols, _map_columns(profile.sketch, numeric_cols, self.n_jobs)))
+        elif self.strategy == "mode":
+            stats["value_counts"] = dict(zip(X.columns, _map_columns(profile.value_counts, X.columns, self.n_jobs)))
+        return stats
+
+    def _merge(self, other):
+        """Merge sums/counts ('mean'), quantile sketches ('median') or value counts ('mode') and refill."""
+        a, b = self._stats, other._stats
+        missing = set(a["missing"]) | set(b["missing"])
+        columns = _union_columns(self._last_input_columns, other._last_input_columns)
+        stats = {"missing": [col for col in columns if col in missing]}
+        if self.strategy == "mean":
+            stats["sum"] = {col: a["sum"].get(col, 0) + b["sum"].get(col, 0) for col in _union_columns(a["sum"], b["sum"])}
+            stats["count"] = {col: a["count"].get(col, 0) + b["count"].get(col, 0) for col in _union_columns(a["count"], b["count"])}
+        elif self.strategy == "median":
+            stats["sketch"] = {col: merge_sketches(a["sketch"].get(col), b["sketch"].get(col))
+                               for col in _union_columns(a["sketch"], b["sketch"])}
+        elif self.strategy == "mode":
+            stats["value_counts"] = {col: _add_counts(a["value_counts"].get(col), b["value_counts"].get(col))
+                                     for col in _union_columns(a["value_counts"], b["value_counts"])}
+        self._stats = stats
+        if "numeric_columns" in self._fitted_params:
+            self._fitted_params["numeric_columns"] = _union_columns(self._fitted_params["numeric_columns"],
+                                                                    other._fitted_params["numeric_columns"])
+
+        fill_values = {}
+        for col in stats["missing"]:
+            if self.strategy == "mean" and col in stats["count"]:
+                fill_values[col] = stats["sum"][col] / stats["count"][col] if stats["count"][col] else np.nan
+            elif self.strategy == "median" and col in stats["sketch"]:
+                fill_values[col] = stats["sketch"][col].quantile(0.5)
+            elif self.strategy == "mode":
+                fill_values[col] = _mode(stats["value_counts"][col])
+            elif self.strategy == "constant":
+                fill_values[col] = self.fill_value
+        self._fill_values = fill_values
+        self._fitted_params["fill_values"] = fill_values
+
+    def _decay(self, factor, batch):
+        """Down-weight the sufficient statistics fitted so far."""
+        stats = self._stats
+        if self.strategy == "mean":
+            stats["sum"] = {col: value * factor for col, value in stats["sum"].items()}
+            stats["count"] = {col: value * factor for col, value in stats["count"].items()}
+        elif self.strategy == "median":
+            stats["sketch"] = {col: sketch.scaled(factor) for col, sketch in stats["sketch"].items()}
+        elif self.strategy == "mode":
+            stats["value_counts"] = {col: counts * factor for col, counts in stats["value_counts"].items()}
+
+    def _sampling_errors(self, profile, population_size):
+        numeric = [col for col in self._fill_values if pd.api.types.is_numeric_dtype(profile.frame[col])]
+        if self.strategy == "mean":
+            return {"fill_values": {col: mean_error(profile, col, population_size) for col in numeric}}
+        if self.strategy == "median":
+            return {"fill_values": {col: quantile_error(profile, col, 0.5, population_size) for col in numeric}}
+        return {}
+
+    def _modified_columns(self):
+        cast = self._fitted_params.get("numeric_columns", [])
+        return list(self._fill_values) + [col for col in cast if col not in self._fill_values]
 
     def _transform(self, X: pd.DataFrame) -> pd.DataFrame:
         """Fill missing values using the stored imputation values."""
         X = X.copy()
         # The fillna method can take a dictionary, which is more efficient
         # than iterating and filling one column at a time.
+        dtype = _float_dtype(self.dtype)
+        if dtype is not None:
+            X = X.astype({col: dtype for col in self._fitted_params.get("numeric_columns", []) if col in X.columns})
         if self._fill_values:
+            for col, value in self._fill_values.items():
+                # Categorical columns (e.g. from MemoryOptimizer) only take values that are categories.
+                if col in X.columns and isinstance(X[col].dtype, pd.CategoricalDtype) \
+                        and not pd.isna(value) and value not in X[col].cat.categories:
+                    X[col] = X[col].cat.add_categories([value])
             X.fillna(self._fill_values, inplace=True)
         return X
 
+    def _transform_polars(self, X):
+        """Polars version of `_transform`. NaN counts as missing, as it does in pandas."""
+        pl = import_optional("polars")
+        exprs = []
+        if self.dtype is not None:
+            X = X.with_columns([pl.col(col).cast(polars_float(self.dtype))
+                                for col in self._fitted_params.get("numeric_columns", []) if col in X.columns])
+        for col, value in self._fill_values.items():
+            if col in X.columns:
+                value = polars_scalar(value)
+                expr = pl.col(col)
+                if X.schema[col].is_float():
+                    expr = expr.fill_nan(value)
+                exprs.append(expr.fill_null(value))
+        return X.with_columns(exprs) if exprs else X
+
+    def _numpy_source(self, fn_name, input_columns):
+        lines = [
+            f"def {fn_name}(cols):",
+            "    cols = dict(cols)",
+        ]
+        if self.dtype is not None:
+            lines += [
+                f"    for name in {_literal(self._fitted_params.get('numeric_columns', []))}:",
+                "        if name in cols:",
+                f"            cols[name] = cols[name].astype(np.{_float_dtype(self.dtype).name})",
+            ]
+        lines += [
+            f"    for name, value in {_literal(self._fill_values)}.items():",
+            "        if name in cols:",
+            "            cols[name] = _fillna(cols[name], value)",
+            "    return cols",
+            "",
+        ]
+        return lines, list(input_columns)
+
     def __repr__(self):
         if self.strategy == 'constant':
             return f"MissingValueHandler(strategy='{self.strategy}', fill_value={self.fill_value})"
         return f"MissingValueHandler(strategy='{self.strategy}')"
+
+
+def _mode(counts: pd.Series):
+    """First of the most frequent values, as `Series.mode().iloc[0]` (tied modes are sorted), or NaN if none."""
+    modes = counts[counts == counts.max()].index
+    if not len(modes):
+        return np.nan
+    try:
+        return modes.sort_values()[0]
+    except TypeError:
+        return modes[0]
+
+
+def _add_counts(a: pd.Series, b: pd.Series) -> pd.Series:
+    """Sum two value counts, either of which may be None (a column only one partition has)."""
+    if a is None or b is None:
+        return a if b is None else b
+    return a.add(b, fill_value=0)
@@ -0,0 +1,207 @@
+"""
+Compile fitted transformers into standalone, NumPy-only Python source.
+
+Each exportable transformer implements `_numpy_source(fn_name, input_columns)`,
+returning the source lines of a function `fn_name(cols) -> cols` that operates on
+a dict of 1-D NumPy arrays, plus the list of column names it produces. This module
+stitches those functions together with a small runtime prelude into a module that
+imports nothing but NumPy, so it can run in containers without pandas or Transfory.
+"""
+
+from __future__ import annotations
+import math
+from typing import Any, Callable, List, Optional, Tuple
+
+import numpy as np
+
+from .exceptions import ConfigurationError, NotFittedError
+
+
+# Helpers copied verbatim into every generated module.
+_PRELUDE = '''
+def _isnull(a):
+    if a.dtype.kind in "fc":
+        return np.isnan(a)
+    if a.dtype.kind in "mM":
+        return np.isnat(a)
+    if a.dtype.kind == "O":
+        return np.frompyfunc(lambda v: v is None or v != v, 1, 1)(a).astype(bool)
+    return np.zeros(a.shape, dtype=bool)
+
+
+def _fillna(a, value):
+    mask = _isnull(a)
+    if not mask.any():
+        return a
+    out = a.copy()
+    try:
+        out[mask] = value
+    except (TypeError, ValueError):
+        out = a.astype(object)
+        out[mask] = value
+    return out
+
+
+def _check_known(name, a, known):
+    unseen = [v for v in a.tolist() if v not in known and not (v is None or v != v)]
+    if unseen:
+        raise ValueError(f"Unseen categories in column '{name}': {sorted(set(map(str, unseen)))}")
+
+
+def _fold(a, known, other):
+    return np.array([v if v in known or v is None or v != v else other for v in a.tolist()], dtype=object)
+
+
+def _lookup(a, mapping, default):
+    return np.array([mapping.get(v, default) for v in a.tolist()])
+
+
+def _to_datetime(a):
+    if a.dtype.kind == "M":
+        return a.astype("datetime64[ns]")
+    try:
+        return a.astype("datetime64[ns]")
+    except (TypeError, ValueError):
+        out = np.empty(a.shape, dtype="datetime64[ns]")
+        for i, v in enumerate(a.tolist()):
+            try:
+                out[i] = np.datetime64(v, "ns")
+            except (TypeError, ValueError):
+                out[i] = np.datetime64("NaT")
+        return out
+
+
+def _dt_feature(d, feature):
+    nat = np.isnat(d)
+    days = d.astype("datetime64[D]").astype(np.int64)
+    if feature == "year":
+        values = d.astype("datetime64[Y]").astype(np.int64) + 1970
+    elif feature == "month":
+        values = d.astype("datetime64[M]").astype(np.int64) % 12 + 1
+    elif feature == "day":
+        values = days - d.astype("datetime64[M]").astype("datetime64[D]").astype(np.int64) + 1
+    elif feature in ("dayofweek", "weekday"):
+        values = (days + 3) % 7
+    elif feature in ("dayofyear", "day_of_year"):
+        values = days - d.astype("datetime64[Y]").astype("datetime64[D]").astype(np.int64) + 1
+    elif feature == "quarter":
+        values = (d.astype("datetime64[M]").astype(np.int64) % 12) // 3 + 1
+    elif feature == "week":
+        thursday = days - (days + 3) % 7 + 3
+        jan1 = thursday.astype("datetime64[D]").astype("datetime64[Y]").astype("datetime64[D]").astype(np.int64)
+        values = (thursday - jan1) // 7 + 1
+    elif feature == "hour":
+        values = (d - d.astype("datetime64[D]")).astype("timedelta64[h]").astype(np.int64)
+    elif feature == "minute":
+        values = (d - d.astype("datetime64[h]")).astype("timedelta64[m]").astype(np.int64)
+    elif feature == "second":
+        values = (d - d.astype("datetime64[m]")).astype("timedelta64[s]").astype(np.int64)
+    else:
+        raise ValueError(f"Unsupported datetime feature '{feature}'.")
+    if nat.any():
+        values = values.astype(np.float64)
+        values[nat] = np.nan
+        return values
+    return values.astype(np.int32)
+
+
+def _as_column(a):
+    if a.dtype.kind == "O" and all(isinstance(v, (int, float, np.number)) or v is None for v in a.tolist()):
+        return np.array([np.nan if v is None else v for v in a.tolist()], dtype=np.float64)
+    return a
+'''
+
+_TRANSFORM = '''
+def transform(data):
+    """
+    Apply the exported transformation.
+
+    `data` is either a dict mapping column names to 1-D arrays (a dict of arrays is
+    returned), or a 2-D array whose columns follow INPUT_COLUMNS (a 2-D array whose
+    columns follow OUTPUT_COLUMNS is returned).
+    """
+    if isinstance(data, dict):
+        return _main({name: np.asarray(values) for name, values in data.items()})
+    arr = np.asarray(data)
+    if arr.ndim != 2 or arr.shape[1] != len(INPUT_COLUMNS):
+        raise ValueError(f"Expected a 2-D array with {len(INPUT_COLUMNS)} columns {INPUT_COLUMNS}, got shape {arr.shape}.")
+    out = _main({name: _as_column(arr[:, i]) for i, name in enumerate(INPUT_COLUMNS)})
+    return np.column_stack([out[name] for name in OUTPUT_COLUMNS])
+'''
+
+
+def _literal(value: Any) -> str:
+    """Return Python source that evaluates to `value` using only builtins and NumPy."""
+    if isinstance(value, np.ndarray):
+        return f"np.array({_literal(value.tolist())}, dtype={value.dtype.str!r})"
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, bool) or value is None or isinstance(value, (int, str)):
+        return repr(value)
+    if isinstance(value, float):
+        if math.isnan(value):
+            return "float('nan')"
+        if math.isinf(value):
+            return "float('inf')" if value > 0 else "float('-inf')"
+        return repr(value)
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{_literal(k)}: {_literal(v)}" for k, v in value.items()) + "}"
+    if isinstance(value, tuple):
+        return "(" + "".join(f"{_literal(v)}, " for v in value) + ")"
+    if isinstance(value, (set, frozenset)):
+        return "{" + ", ".join(_literal(v) for v in value) + "}" if value else "set()"
+    if isinstance(value, (list, range)):
+        return "[" + ", ".join(_literal(v) for v in value) + "]"
+    raise ConfigurationError(f"Cannot embed value of type {type(value).__name__} in an exported NumPy function.")
+
+
+def _indent(lines: List[str], level: int = 1) -> List[str]:
+    return [("    " * level + line) if line else line for line in lines]
+
+
+def compile_numpy_function(transformer: Any, path: Optional[str] = None) -> Callable[[Any], Any]:
+    """
+    Compile a fitted transformer into a standalone NumPy transform function.
+
+    Parameters
+    ----------
+    transformer : BaseTransformer
+        A fitted transformer that implements `_numpy_source`.
+    path : str, optional
+        If given, the generated module source is also written to this file. The file
+        only imports NumPy and exposes `transform`, `INPUT_COLUMNS` and `OUTPUT_COLUMNS`.
+
+    Returns
+    -------
+    callable
+        The generated `transform(data)` function. Its `source`, `input_columns` and
+        `output_columns` attributes describe the generated module.
+    """
+    if not transformer.is_fitted:
+        raise NotFittedError(f"Transformer {transformer.name} is not fitted. Call .fit() first.")
+
+    input_columns = list(transformer._last_input_columns or [])
+    body, output_columns = transformer._numpy_source("_main", input_columns)
+
+    source = "\n".join([
+        f'"""Standalone NumPy transform exported from Transfory ({transformer.name}). Requires only NumPy."""',
+        "import numpy as np",
+        "",
+        f"INPUT_COLUMNS = {_literal(input_columns)}",
+        f"OUTPUT_COLUMNS = {_literal(output_columns)}",
+        _PRELUDE,
+        *body,
+        _TRANSFORM,
+    ])
+
+    namespace: dict = {"__name__": "transfory_numpy_export"}
+    exec(compile(source, path or "<transfory-numpy-export>", "exec"), namespace)
+    if path is not None:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(source)
+
+    fn = namespace["transform"]
+    fn.source = source
+    fn.input_columns = input_columns
+    fn.output_columns = output_columns
+    return fn
@@ -1,7 +1,14 @@
+import numpy as np
 import pandas as pd
 from typing import Optional, List
-from .base import BaseTransformer
+from .base import BaseTransformer, _check_decay_window, _check_n_jobs, _float_dtype, _keeps_merge_state, _map_columns, _union_columns
 from .exceptions import ConfigurationError, NoApplicableColumnsError
+from .numpy_export import _literal
+from .backend import import_optional, polars_scalar, polars_float
+from .schema import select_columns
+from .profiling import DataProfile, profile_of
+from .sampling import quantile_error
+from .sketch import merge_sketches
 
 class OutlierHandler(BaseTransformer):
     """
@@ -11,12 +18,24 @@ class OutlierHandler(BaseTransformer):
     - 'iqr': Caps outliers based on the Interquartile Range (IQR).
              Values below Q1 - factor * IQR or above Q3 + factor * IQR are capped.
     - 'percentile': Caps outliers at specified lower and upper percentiles.
+
+    With `dtype` (float32 or float64), processed columns are cast to it before the
+    bounds are computed, and the capped columns are returned in it. `n_jobs` fits
+    columns in parallel on a thread pool.
+
+    `partial_fit` updates the bounds with a new batch by merging quantile sketches. With
+    `decay`, the sketch weights fitted so far are multiplied by `decay` before each batch
+    is merged. With `window`, only the last `window` batches count.
     """
+    _native_backends = ("polars",)
+    _merge_state_attributes = ("_stats",)
 
     def __init__(self, method: str = "iqr", factor: float = 1.5,
                  lower_quantile: float = 0.01, upper_quantile: float = 0.99,
                  quantile_interpolation: str = 'linear',
-                 columns: Optional[List[str]] = None, name: Optional[str] = None):
+                 columns: Optional[List[str]] = None, dtype=None,
+                 decay: Optional[float] = None, window: Optional[int] = None,
+                 n_jobs: Optional[int] = None, name: Optional[str] = None):
         super().__init__(name=name or f"OutlierHandler(method='{method}')")
 
         supported_methods = ["iqr", "percentile"]
@@ -35,38 +54,99 @@ class OutlierHandler(BaseTransformer):
         self.upper_quantile = upper_quantile
         self.quantile_interpolation = quantile_interpolation
         self.columns = columns
+        self.dtype = dtype
+        _float_dtype(dtype)
+        # Threads the per-column bounds are computed on (None/1: serial, -1: all cores).
+        self.n_jobs = _check_n_jobs(n_jobs)
+        # `partial_fit` forgetting: old state weighted by `decay` per batch, or only the last `window` batches.
+        self.decay, self.window = _check_decay_window(decay, window)
         self._fitted_params = {"bounds": {}}
 
     def _fit(self, X: pd.DataFrame, y=None):
         """Calculate the upper and lower bounds for capping."""
-        bounds = {}
-        cols_to_process = self.columns or X.select_dtypes(include="number").columns
+        cols_to_process = pd.Index(self.columns or select_columns(X, "number"))
 
         if cols_to_process.empty:
             raise NoApplicableColumnsError(
                 f"OutlierHandler found no numeric columns to process. Columns available: {X.columns.tolist()}"
             )
 
-        for col in cols_to_process:
+        dtype = _float_dtype(self.dtype)
+        if dtype is not None:
+            X = X.astype({col: dtype for col in cols_to_process})
+        # Quantiles come from the shared profile (a fresh one for the cast frame).
+        profile = profile_of(X)
+        bounds = _map_columns(lambda col: self._fit_column(profile, col), cols_to_process, self.n_jobs)
+        self._fitted_params["bounds"] = dict(zip(cols_to_process, bounds))
+        self._stats = None
+        if _keeps_merge_state():
+            # Quantile sketches, kept so fits on separate partitions can be merged (see `_merge`).
+            sketches = _map_columns(profile.sketch, cols_to_process, self.n_jobs)
+            self._stats = {"sketch": dict(zip(cols_to_process, sketches))}
+
+    def _fit_column(self, profile: DataProfile, col):
+        """(lower, upper) bounds for one column."""
+        dtype = _float_dtype(self.dtype)
+        quantile = lambda q: profile.quantile(col, q, interpolation=self.quantile_interpolation)
+        if self.method == "iqr":
+            Q1 = quantile(0.25)
+            Q3 = quantile(0.75)
+            IQR = Q3 - Q1
+            lower_bound = Q1 - self.factor * IQR
+            upper_bound = Q3 + self.factor * IQR
+        elif self.method == "percentile":
+            lower_bound = quantile(self.lower_quantile)
+            upper_bound = quantile(self.upper_quantile)
+        if dtype is not None:
+            lower_bound, upper_bound = dtype.type(lower_bound), dtype.type(upper_bound)
+        return lower_bound, upper_bound
+
+    def _merge(self, other):
+        """Merge the per-column quantile sketches and recompute the bounds from them."""
+        mine, theirs = self._stats["sketch"], other._stats["sketch"]
+        sketches = {col: merge_sketches(mine.get(col), theirs.get(col)) for col in _union_columns(mine, theirs)}
+        dtype = _float_dtype(self.dtype)
+        bounds = {}
+        for col, sketch in sketches.items():
+            quantile = lambda q: sketch.quantile(q, interpolation=self.quantile_interpolation)
             if self.method == "iqr":
-                Q1 = X[col].quantile(0.25, interpolation=self.quantile_interpolation)
-                Q3 = X[col].quantile(0.75, interpolation=self.quantile_interpolation)
-                IQR = Q3 - Q1
-                lower_bound = Q1 - self.factor * IQR
-                upper_bound = Q3 + self.factor * IQR
-            elif self.method == "percentile":
-                lower_bound = X[col].quantile(self.lower_quantile, interpolation=self.quantile_interpolation)
-                upper_bound = X[col].quantile(self.upper_quantile, interpolation=self.quantile_interpolation)
+                Q1, Q3 = quantile(0.25), quantile(0.75)
+                lower_bound, upper_bound = Q1 - self.factor * (Q3 - Q1), Q3 + self.factor * (Q3 - Q1)
+            else:
+                lower_bound, upper_bound = quantile(self.lower_quantile), quantile(self.upper_quantile)
+            if dtype is not None:
+                lower_bound, upper_bound = dtype.type(lower_bound), dtype.type(upper_bound)
             bounds[col] = (lower_bound, upper_bound)
-
+        self._stats = {"sketch": sketches}
         self._fitted_params["bounds"] = bounds
 
+    def _decay(self, factor, batch):
+        """Down-weight the quantile sketches fitted so far."""
+        self._stats = {"sketch": {col: sketch.scaled(factor) for col, sketch in self._stats["sketch"].items()}}
+
+    def _sampling_errors(self, profile, population_size):
+        errors = {}
+        for col in self._fitted_params.get("bounds", {}):
+            error = lambda q: quantile_error(profile, col, q, population_size)
+            if self.method == "iqr":
+                # Bounds are (1 + f) * Q1 - f * Q3 and (1 + f) * Q3 - f * Q1.
+                e1, e3, f = error(0.25), error(0.75), self.factor
+                errors[col] = (float(np.hypot((1 + f) * e1, f * e3)), float(np.hypot(f * e1, (1 + f) * e3)))
+            else:
+                errors[col] = (error(self.lower_quantile), error(self.upper_quantile))
+        return {"bounds": errors}
+
+    def _modified_columns(self):
+        return list(self._fitted_params.get("bounds", {}))
+
     def _transform(self, X: pd.DataFrame) -> pd.DataFrame:
         """Cap the values in the DataFrame based on the fitted bounds."""
         X_out = X.copy()
         bounds = self._fitted_params.get("bounds", {})
+        dtype = _float_dtype(self.dtype)
         for col, (lower, upper) in bounds.items():
-            X_out[col] = X_out[col].clip(lower=lower, upper=upper)
+            values = X_out[col].astype(dtype) if dtype is not None else X_out[col]
+            X_out[col] = values.clip(lower=lower, upper=upper)
 
         # Log the transform event with details for the reporter
         self._log("transform", {
@@ -74,4 +154,43 @@ class OutlierHandler(BaseTransformer):
             "output_shape": X_out.shape,
             "fitted_params": self.fitted_params # Pass bounds for reporter to use
         })
-        return X_out
\ No newline at end of file
+        return X_out
+
+    def _transform_polars(self, X):
+        """Polars version of `_transform`."""
+        pl = import_optional("polars")
+        bounds = self._fitted_params.get("bounds", {})
+        exprs = []
+        for col, (lower, upper) in bounds.items():
+            lower = None if pd.isna(lower) else polars_scalar(lower)
+            upper = None if pd.isna(upper) else polars_scalar(upper)
+            expr = pl.col(col) if self.dtype is None else pl.col(col).cast(polars_float(self.dtype))
+            # pandas upcasts integer columns clipped at fractional bounds; Polars would truncate the bound.
+            if self.dtype is None and X.schema[col].is_integer() and any(b is not None and float(b) != int(b) for b in (lower, upper)):
+                expr = expr.cast(pl.Float64)
+            exprs.append(expr.clip(lower, upper))
+        X_out = X.with_columns(exprs) if exprs else X
+
+        self._log("transform", {
+            "input_shape": X.shape,
+            "output_shape": X_out.shape,
+            "fitted_params": self.fitted_params
+        })
+        return X_out
+
+    def _numpy_source(self, fn_name, input_columns):
+        lines = [f"def {fn_name}(cols):", "    cols = dict(cols)"]
+        for col, (lower, upper) in self._fitted_params.get("bounds", {}).items():
+            # pandas treats a NaN bound as "no bound"; np.clip expects None for that.
+            lower = None if pd.isna(lower) else lower
+            upper = None if pd.isna(upper) else upper
+            source = f"cols[{_literal(col)}]"
+            if self.dtype is not None:
+                source = f"{source}.astype(np.{_float_dtype(self.dtype).name})"
+            if lower is None and upper is None:
+                if self.dtype is not None:
+                    lines.append(f"    cols[{_literal(col)}] = {source}")
+                continue
+            lines.append(f"    cols[{_literal(col)}] = np.clip({source}, {_literal(lower)}, {_literal(upper)})")
+        lines += ["    return cols", ""]
+        return lines, list(input_columns)
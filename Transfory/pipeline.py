@@ -1,12 +1,22 @@
 from __future__ import annotations
-from typing import Any, Dict, List, Optional, Tuple, Union
+import contextlib
+import contextvars
+import copy
+import functools
+import queue
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 import pandas as pd
 import joblib
-from .base import BaseTransformer
+from .base import BaseTransformer, _float_dtype, _routed_logs, _updatable
 from .exceptions import InvalidStepError, TransforyError, NotFittedError, FrozenTransformerError, PipelineLogicError, PipelineProcessingError, ConfigurationError
 from .scaler import Scaler
 from .encoder import Encoder
 from .outlier import OutlierHandler
+from .numpy_export import compile_numpy_function, _indent
+from . import aio, fileio
+from .profiling import DataProfile, activate, profile_of
+from . import backend as _backend
 
 
 class Pipeline(BaseTransformer):
@@ -26,14 +36,29 @@ class Pipeline(BaseTransformer):
     ... ])
     >>> pipe.fit(df_train)
     >>> df_transformed = pipe.transform(df_test)
+
+    `dtype` (e.g. np.float32) is passed on to every step with a `dtype` option
+    (Scaler, OutlierHandler, MissingValueHandler, FeatureGenerator), including steps of
+    nested Pipelines and ColumnTransformers, unless the step sets its own.
     """
+    # Steps handle their own backends, so Polars/Arrow frames flow through unconverted.
+    _native_backends = ("polars",)
 
     def __init__(self, steps: List[Tuple[str, BaseTransformer]], name: Optional[str] = None,
-                 logging_callback: Optional[callable] = None):
+                 logging_callback: Optional[callable] = None, dtype: Any = None):
         super().__init__(name=name or "Pipeline", logging_callback=logging_callback)
         self.steps = steps
+        self.dtype = dtype
+        _float_dtype(dtype)
         self.named_steps = self._validate_steps()
         self._validate_logical_order()
+        self._propagate_dtype()
+
+    def _propagate_dtype(self) -> None:
+        """Set `dtype` on steps that support it and have none of their own."""
+        if self.dtype is not None:
+            for _, transformer in self.steps:
+                _set_default_dtype(transformer, self.dtype)
 
     # ------------------------------
     # Validation
@@ -93,29 +118,34 @@ class Pipeline(BaseTransformer):
 
 
 
+    def _step_logs(self, name: str, transformer: BaseTransformer):
+        """
+        Route a step's events to the pipeline's callback for the current call, prefixing the
+        step's own step name (so nested names like "ct::imputer" become "pipe_step::ct::imputer").
+        The step object itself is not modified, so concurrent calls do not interfere.
+        """
+        callback = self._current_callback()
+        if not callback:
+            return contextlib.nullcontext()
+        return _routed_logs(transformer, lambda child_step_name, payload: callback(f"{name}::{child_step_name}", payload))
+
     # ------------------------------
     # Core fitting logic
     # ------------------------------
     def _fit(self, X: pd.DataFrame, y: Optional[pd.Series] = None) -> None:
+        self._propagate_dtype()
         current_data = X
+        profile = profile_of(X)
         last_step_idx = len(self.steps) - 1
         for i, (name, transformer) in enumerate(self.steps):
-            # Pass the pipeline's callback and the step name to the transformer
-            # The lambda now correctly uses the step_name from the child, which is crucial for ColumnTransformer
-            if self._logging_callback:
-                # This lambda captures the pipeline's step name (`name`) but passes the child's
-                # own `step_name` to the callback. This preserves nested names like "ct::imputer".
-                # We now prepend the pipeline step name to create a nested name.
-                transformer._logging_callback = lambda child_step_name, payload, pipeline_step_name=name: self._logging_callback(
-                    f"{pipeline_step_name}::{child_step_name}", payload
-                )
-
             self._log("fit_step_start", {"step": name, "shape": current_data.shape})
             try:
-                if i < last_step_idx:
-                    current_data = transformer.fit_transform(current_data, y)
-                else: # For the last step, just fit.
-                    transformer.fit(current_data, y)
+                with self._step_logs(name, transformer), activate(profile):
+                    if i < last_step_idx:
+                        current_data = transformer.fit_transform(current_data, y)
+                        profile = _derive_profile(profile, transformer, current_data)
+                    else: # For the last step, just fit.
+                        transformer.fit(current_data, y)
             except Exception as e:
                 raise PipelineProcessingError(
                     f"Error during 'fit' in step '{name}' ({transformer.__class__.__name__}): {e}"
@@ -135,22 +165,58 @@ class Pipeline(BaseTransformer):
     def _transform(self, X: pd.DataFrame) -> pd.DataFrame:
         current_data = X
         for name, transformer in self.steps:
-            # Pass the pipeline's callback to the transformer
-            if self._logging_callback:
-                transformer._logging_callback = lambda child_step_name, payload, pipeline_step_name=name: self._logging_callback(
-                    f"{pipeline_step_name}::{child_step_name}", payload
-                )
+            current_data = self._transform_step(name, transformer, current_data)
+        return current_data
 
-            self._log("transform_step", {"step": name, "input_shape": current_data.shape})
-            try:
-                current_data = transformer.transform(current_data)
-            except Exception as e:
-                raise PipelineProcessingError(
-                    f"Error during 'transform' in step '{name}' ({transformer.__class__.__name__}): {e}"
-                ) from e
+    def _transform_step(self, name: str, transformer: BaseTransformer, X: Any) -> Any:
+        self._log("transform_step", {"step": name, "input_shape": X.shape})
+        try:
+            with self._step_logs(name, transformer):
+                out = transformer.transform(X)
+        except Exception as e:
+            raise PipelineProcessingError(
+                f"Error during 'transform' in step '{name}' ({transformer.__class__.__name__}): {e}"
+            ) from e
 
-            self._log("transform_done", {"step": name, "output_shape": current_data.shape})
-        return current_data
+        self._log("transform_done", {"step": name, "output_shape": out.shape})
+        return out
+
+    def _transform_polars(self, X: Any) -> Any:
+        return self._transform(X)
+
+    # ------------------------------
+    # Column pruning
+    # ------------------------------
+    def _first_step(self) -> Optional[BaseTransformer]:
+        for _, transformer in self.steps:
+            if isinstance(transformer, BaseTransformer):
+                return transformer
+        return None
+
+    @property
+    def required_columns(self) -> List[str]:
+        """
+        Input columns the fitted pipeline reads. Later steps only see the first step's
+        output, so this is what the first step reads (e.g. the columns a ColumnTransformer
+        with remainder='drop' routes to its branches).
+        """
+        columns = super().required_columns
+        first = self._first_step()
+        if first is None:
+            return columns
+        read = set(first.required_columns)
+        return [col for col in columns if col in read]
+
+    def _sampling_errors(self, profile: DataProfile, population_size: int) -> Dict[str, Any]:
+        return {name: transformer.sampling_report["errors"] for name, transformer in self.steps
+                if isinstance(transformer, BaseTransformer) and transformer.sampling_report is not None}
+
+    def _modified_columns(self) -> Optional[List[str]]:
+        return _union_modified(transformer for _, transformer in self.steps)
+
+    def _drops_unread_columns(self) -> bool:
+        first = self._first_step()
+        return first is not None and first._drops_unread_columns()
 
     def fit_transform(self, X: pd.DataFrame, y: Optional[pd.Series] = None) -> pd.DataFrame:
         """
@@ -163,17 +229,15 @@ class Pipeline(BaseTransformer):
             raise FrozenTransformerError(f"Transformer {self.name} is frozen and cannot be refit.")
 
         self._validate_input(X)
+        self._propagate_dtype()
         current_data = X
+        profile = profile_of(X) if _backend.get_backend(X) == _backend.PANDAS else None
         for name, transformer in self.steps:
-            # Pass the pipeline's callback to the transformer
-            if self._logging_callback:
-                transformer._logging_callback = lambda child_step_name, payload, pipeline_step_name=name: self._logging_callback(
-                    f"{pipeline_step_name}::{child_step_name}", payload
-                )
-
             self._log("fit_transform_step", {"step": name, "input_shape": current_data.shape})
             try:
-                current_data = transformer.fit_transform(current_data, y)
+                with self._step_logs(name, transformer), activate(profile):
+                    current_data = transformer.fit_transform(current_data, y)
+                    profile = _derive_profile(profile, transformer, current_data)
             except Exception as e:
                 raise PipelineProcessingError(
                     f"Error during 'fit_transform' in step '{name}' ({transformer.__class__.__name__}): {e}"
@@ -181,9 +245,72 @@ class Pipeline(BaseTransformer):
 
             self._log("fit_transform_done", {"step": name, "output_shape": current_data.shape})
 
+        self._fitted_params = {
+            "step_names": [n for n, _ in self.steps],
+            "n_steps": len(self.steps),
+        }
         self._is_fitted = True
+        self._last_input_columns = list(X.columns)
+        self._output_schema = self._schema_of(current_data)
         return current_data
 
+    # ------------------------------
+    # Incremental fitting
+    # ------------------------------
+    def partial_fit(self, X: pd.DataFrame, y: Optional[pd.Series] = None) -> "Pipeline":
+        """
+        Update every step with one more batch: each step is updated with `partial_fit` on
+        the output of the steps before it. The first call fits every step. Later batches
+        need every step to support incremental updates (merging, see `BaseTransformer.merge`,
+        or its own `partial_fit`, as nested Pipelines and ColumnTransformers have); a step
+        that cannot be updated raises ConfigurationError instead of keeping the state
+        fitted on the first batch.
+
+        Columns a step outputs for the first time (such as one-hot columns for a category
+        that appears in a later batch) are absorbed by the steps after it, which merge on
+        the union of the columns.
+        """
+        if self._frozen:
+            raise FrozenTransformerError(f"Transformer {self.name} is frozen and cannot be refit.")
+
+        X = self._validate_input(X)
+        self._propagate_dtype()
+        current_data = X
+        last_step_idx = len(self.steps) - 1
+        for i, (name, transformer) in enumerate(self.steps):
+            try:
+                with self._step_logs(name, transformer):
+                    if transformer.is_fitted and not _updatable(transformer):
+                        raise ConfigurationError(
+                            f"{transformer.__class__.__name__} cannot be updated with partial_fit: it neither "
+                            f"merges fitted state nor has its own partial_fit. Fit the pipeline with `fit` instead."
+                        )
+                    transformer.partial_fit(current_data, y)
+                    if i < last_step_idx:
+                        current_data = transformer.transform(current_data)
+            except Exception as e:
+                raise PipelineProcessingError(
+                    f"Error during 'partial_fit' in step '{name}' ({transformer.__class__.__name__}): {e}"
+                ) from e
+
+        self._fitted_params = {
+            "step_names": [n for n, _ in self.steps],
+            "n_steps": len(self.steps),
+        }
+        self._is_fitted = True
+        self._last_input_columns = list(X.columns)
+        self._output_schema = self._probe_output_schema(X)
+        self._log("partial_fit", {"input_shape": X.shape, "fitted_params": dict(self._fitted_params)})
+        return self
+
+    def _adopt(self, source: "Pipeline") -> None:
+        """Adopt `source`'s fitted state step by step, so the step objects (and their callbacks) stay the same."""
+        for (_, transformer), (_, saved) in zip(self.steps, source.steps):
+            transformer._adopt(saved)
+        state = {key: value for key, value in source.__dict__.items()
+                 if key not in ("steps", "named_steps", "_logging_callback")}
+        self.__dict__.update(copy.deepcopy(state))
+
     # ------------------------------
     # Step management
     # ------------------------------
@@ -209,6 +336,134 @@ class Pipeline(BaseTransformer):
                 return t
         return None
 
+    # ------------------------------
+    # Batch file processing
+    # ------------------------------
+    def transform_file(self, src: str, dst: str, format: str = "parquet", batch_size: int = 65536,
+                       prefetch: int = 1, write_kwargs: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Transform a Parquet or CSV file in batches, writing each batch to `dst` as it is done.
+
+        Only `required_columns` are read. Every batch is written with the first batch's
+        output columns and dtypes, and up to `prefetch` batches are read on a background
+        thread while the current one transforms (0 disables prefetching).
+        Returns ``{"n_rows", "n_batches", "columns"}``. See `transfory.fileio.transform_file`.
+        """
+        if not self.is_fitted:
+            raise NotFittedError(f"Transformer {self.name} is not fitted. Call .fit() first.")
+        return fileio.transform_file(self, src, dst, format=format, batch_size=batch_size,
+                                     prefetch_batches=prefetch, write_kwargs=write_kwargs)
+
+    # ------------------------------
+    # Chunk streams
+    # ------------------------------
+    def transform_stream(self, chunks: Iterable[Any], queue_size: int = 1) -> Iterator[Any]:
+        """
+        Transform an iterable of chunks with the steps running as concurrent stages.
+
+        Reading the input and each step run on their own thread, connected by queues of
+        `queue_size` chunks, so step k transforms chunk i while step k+1 transforms chunk
+        i-1. A full queue blocks the stage feeding it (backpressure), bounding memory to
+        about `queue_size` chunks per stage. Results are yielded in input order and equal
+        `transform(chunk)`. Throughput improves when steps spend time in NumPy / sklearn
+        code that releases the GIL.
+        """
+        if not self.is_fitted:
+            raise NotFittedError(f"Transformer {self.name} is not fitted. Call .fit() first.")
+        if queue_size < 1:
+            raise ConfigurationError("`queue_size` must be a positive integer.")
+        if not self.steps:
+            return (self.transform(chunk) for chunk in chunks)
+
+        last = len(self.steps) - 1
+
+        def stage(index: int, name: str, transformer: BaseTransformer, item: Any) -> Any:
+            if index == 0:
+                item = self._stream_input(item)
+            X, meta = item
+            X = self._transform_step(name, transformer, X)
+            return self._stream_output(X, meta) if index == last else (X, meta)
+
+        stages = [functools.partial(stage, i, name, transformer) for i, (name, transformer) in enumerate(self.steps)]
+        return _run_stages(chunks, stages, depth=queue_size)
+
+    def _stream_input(self, X: Any) -> Tuple[Any, Tuple[Optional[str], bool, Tuple[int, int]]]:
+        """The input half of `transform` for one chunk: validation, pruning and backend handling."""
+        backend = _backend.get_backend(X)
+        if backend in (_backend.POLARS, _backend.ARROW):
+            X = _backend.to_polars(X)
+            self._check_columns(list(X.columns))
+            if self._drops_unread_columns():
+                X = X.select(self.required_columns)
+            return X, (backend, False, X.shape)
+        X = self._validate_input(X, require_same_columns=True)
+        return X, (backend, len(X.columns) == len(self._last_input_columns or ()), X.shape)
+
+    def _stream_output(self, X: Any, meta: Tuple[Optional[str], bool, Tuple[int, int]]) -> Any:
+        """The output half of `transform` for one chunk."""
+        backend, reorder, input_shape = meta
+        if backend in (_backend.POLARS, _backend.ARROW):
+            self._log("transform", {"input_shape": input_shape, "output_shape": X.shape})
+            return _backend.from_polars(X, backend)
+        X = self._conform_output(X, reorder=reorder)
+        self._log("transform", {"input_shape": input_shape, "output_shape": X.shape})
+        if backend not in (None, _backend.PANDAS):
+            X = _backend.from_pandas(X, backend)
+        return X
+
+    # ------------------------------
+    # asyncio
+    # ------------------------------
+    async def atransform(self, X: pd.DataFrame, executor: Any = None) -> pd.DataFrame:
+        """
+        Transform X on `executor` (a thread or process pool; the event loop's default
+        thread pool if None) without blocking the event loop. See `transfory.aio`.
+        """
+        if not self.is_fitted:
+            raise NotFittedError(f"Transformer {self.name} is not fitted. Call .fit() first.")
+        return await aio.atransform(self, X, executor=executor)
+
+    def atransform_stream(self, chunks: Any, executor: Any = None, max_pending: int = 2) -> Any:
+        """
+        Asynchronously transform an (async) iterable of chunks, yielding results in order.
+        Up to `max_pending` chunks transform on `executor` while the next chunk is read and
+        finished ones are consumed:
+
+        >>> async for out in pipe.atransform_stream(read_chunks()):
+        ...     await write(out)
+        """
+        if not self.is_fitted:
+            raise NotFittedError(f"Transformer {self.name} is not fitted. Call .fit() first.")
+        return aio.atransform_stream(self, chunks, executor=executor, max_pending=max_pending)
+
+    # ------------------------------
+    # Export
+    # ------------------------------
+    def to_numpy_function(self, path: Optional[str] = None) -> Callable[[Any], Any]:
+        """
+        Compile the fitted pipeline into a standalone function that needs only NumPy at runtime.
+
+        The returned `transform(data)` accepts a dict of 1-D arrays (returning a dict of arrays)
+        or a 2-D array whose columns follow the pipeline's fit-time input columns (returning a
+        2-D array). If `path` is given, the generated module is also written there so it can be
+        shipped without pandas or Transfory.
+
+        Raises ConfigurationError if a step does not support NumPy export.
+        """
+        return compile_numpy_function(self, path=path)
+
+    def _numpy_source(self, fn_name: str, input_columns: List[str]) -> Tuple[List[str], List[str]]:
+        lines: List[str] = [f"def {fn_name}(cols):"]
+        calls: List[str] = []
+        columns = list(input_columns)
+        for i, (name, transformer) in enumerate(self.steps):
+            step_fn = f"{fn_name}_{i}"
+            step_lines, columns = transformer._numpy_source(step_fn, columns)
+            lines += _indent(step_lines)
+            calls.append(f"cols = {step_fn}(cols)  # step '{name}'")
+        lines += _indent(calls + ["return cols"]) + [""]
+        return lines, columns
+
     # ------------------------------
     # Persistence
     # ------------------------------
@@ -230,3 +485,107 @@ class Pipeline(BaseTransformer):
     def __repr__(self) -> str:
         step_names = " → ".join([name for name, _ in self.steps])
         return f"<Pipeline ({len(self.steps)} steps): {step_names}>"
+
+
+def _run_stages(iterable: Iterable[Any], stages: List[Callable[[Any], Any]], depth: int = 1) -> Iterator[Any]:
+    """
+    Yield ``stages[-1](...stages[0](item))`` for every item, in order. The source and each
+    stage run on their own thread (in a copy of the caller's context), connected by queues
+    of `depth` items. The first exception raised anywhere is re-raised in the consumer;
+    closing the generator early stops and joins all threads.
+    """
+    stop = threading.Event()
+    done = object()
+    queues: List["queue.Queue[Any]"] = [queue.Queue(maxsize=depth) for _ in range(len(stages) + 1)]
+
+    def put(q: "queue.Queue[Any]", item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def get(q: "queue.Queue[Any]") -> Any:
+        while not stop.is_set():
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return done, None
+
+    def source() -> None:
+        try:
+            for item in iterable:
+                if not put(queues[0], (None, item)):
+                    return
+            put(queues[0], (done, None))
+        except BaseException as e:
+            put(queues[0], (done, e))
+
+    def worker(fn: Callable[[Any], Any], q_in: "queue.Queue[Any]", q_out: "queue.Queue[Any]") -> None:
+        while True:
+            marker, item = get(q_in)
+            if marker is done:
+                # Forward end-of-stream (or an upstream error) and stop.
+                put(q_out, (done, item))
+                return
+            try:
+                result = fn(item)
+            except BaseException as e:
+                put(q_out, (done, e))
+                return
+            if not put(q_out, (None, result)):
+                return
+
+    targets = [(source, ())] + [(worker, (fn, queues[i], queues[i + 1])) for i, fn in enumerate(stages)]
+    threads = [
+        threading.Thread(target=contextvars.copy_context().run, args=(target, *args), name=f"transfory-stage-{i}", daemon=True)
+        for i, (target, args) in enumerate(targets)
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        while True:
+            marker, item = queues[-1].get()
+            if marker is done:
+                if item is not None:
+                    raise item
+                return
+            yield item
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+
+def _derive_profile(profile: Optional[DataProfile], transformer: BaseTransformer, output: Any) -> Optional[DataProfile]:
+    """Profile of a step's output, reusing what `profile` cached for the columns the step left unchanged."""
+    if profile is None or _backend.get_backend(output) != _backend.PANDAS:
+        return None
+    return profile.derive(output, transformer._modified_columns())
+
+
+def _union_modified(transformers: Iterable[Any]) -> Optional[List[str]]:
+    """Columns modified by any of `transformers`, or None if any of them does not know."""
+    modified: List[str] = []
+    for transformer in transformers:
+        columns = transformer._modified_columns() if isinstance(transformer, BaseTransformer) else None
+        if columns is None:
+            return None
+        modified.extend(col for col in columns if col not in modified)
+    return modified
+
+
+def _set_default_dtype(transformer: Any, dtype: Any) -> None:
+    """Apply a pipeline-wide `dtype` to a step, recursing into nested Pipelines and ColumnTransformers."""
+    if isinstance(transformer, Pipeline):
+        if transformer.dtype is None:
+            transformer.dtype = dtype
+        transformer._propagate_dtype()
+    elif hasattr(transformer, "transformers"):
+        for _, branch, _ in transformer.transformers:
+            _set_default_dtype(branch, dtype)
+    elif getattr(transformer, "dtype", dtype) is None:
+        transformer.dtype = dtype
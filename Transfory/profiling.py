@@ -0,0 +1,254 @@
+"""
+Shared column profiles for fitting.
+
+A `DataProfile` wraps one DataFrame and computes per-column statistics on first
+request, caching them: null counts, dtype class, moments (count / sum / mean /
+variance), min / max, sorted values for exact quantiles and medians, a
+`QuantileSketch`, factorized categories (value counts and cardinality) and
+datetime convertibility. Transformers read their fit statistics from the active
+profile (`profile_of(X)`) instead of rescanning the column.
+
+`Pipeline.fit` builds one profile for its input and hands it from step to step:
+after a step transforms the data, `derive` carries the cached statistics of every
+column the step did not modify (`BaseTransformer._modified_columns`) over to the
+profile of the step's output, so each column is scanned once however many steps
+read it.
+
+`profile(X)` computes the numeric statistics of every column up front and returns
+the profile; `DataProfile.summary()` tabulates them.
+"""
+
+from __future__ import annotations
+import contextlib
+import contextvars
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from . import schema as _schema
+from .sketch import QuantileSketch
+
+_active_profile: contextvars.ContextVar[Optional["DataProfile"]] = contextvars.ContextVar("transfory_profile", default=None)
+
+
+class DataProfile:
+    """
+    Lazily computed, cached per-column statistics of one DataFrame.
+
+    Parameters
+    ----------
+    frame : pd.DataFrame
+        The data being profiled. The profile must not outlive modifications to it.
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        self.frame = frame
+        # column -> {statistic name -> value}
+        self._cache: Dict[Hashable, Dict[str, Any]] = {}
+        self._fingerprint: Optional[_schema.Fingerprint] = None
+
+    @property
+    def fingerprint(self) -> "_schema.Fingerprint":
+        """`schema.schema_fingerprint` of the frame, computed once."""
+        if self._fingerprint is None:
+            self._fingerprint = _schema.schema_fingerprint(self.frame)
+        return self._fingerprint
+
+    # ------------------------------
+    # Caching
+    # ------------------------------
+    def _get(self, col: Hashable, key: str, compute: Callable[[], Any]) -> Any:
+        entry = self._cache.setdefault(col, {})
+        if key not in entry:
+            entry[key] = compute()
+        return entry[key]
+
+    def derive(self, frame: pd.DataFrame, modified: Optional[Iterable[Hashable]]) -> "DataProfile":
+        """
+        Profile of `frame` (e.g. a step's output) sharing the statistics of columns that
+        are unchanged: present in both frames with the same dtype and not in `modified`.
+        Statistics computed through either profile are then visible to both.
+        `modified=None` means unknown, and nothing is shared.
+        """
+        derived = DataProfile(frame)
+        if modified is None or len(frame) != len(self.frame):
+            return derived
+        modified = set(modified)
+        for col in frame.columns:
+            if col not in modified and col in self.frame.columns and frame[col].dtype == self.frame[col].dtype:
+                derived._cache[col] = self._cache.setdefault(col, {})
+        return derived
+
+    # ------------------------------
+    # Statistics
+    # ------------------------------
+    def _values(self, col: Hashable) -> np.ndarray:
+        """Non-missing values of a numeric column as float64."""
+        return self._get(col, "values", lambda: _non_missing(self.frame[col]))
+
+    def null_count(self, col: Hashable) -> int:
+        return self._get(col, "null_count", lambda: int(self.frame[col].isna().sum()))
+
+    def has_missing(self, col: Hashable) -> bool:
+        return self.null_count(col) > 0
+
+    def kind(self, col: Hashable) -> str:
+        """Dtype class: 'numeric', 'boolean', 'datetime', 'categorical' or 'other'."""
+        return self._get(col, "kind", lambda: _kind(self.frame[col]))
+
+    def moments(self, col: Hashable) -> Tuple[int, float, float]:
+        """(count, sum, sum of squared deviations from the mean) of the non-missing values."""
+        def compute() -> Tuple[int, float, float]:
+            values = self._values(col)
+            if not len(values):
+                return 0, 0.0, 0.0
+            total = float(values.sum())
+            return len(values), total, float(((values - total / len(values)) ** 2).sum())
+        return self._get(col, "moments", compute)
+
+    def count(self, col: Hashable) -> int:
+        return self.moments(col)[0]
+
+    def sum(self, col: Hashable) -> float:
+        return self.moments(col)[1]
+
+    def mean(self, col: Hashable) -> float:
+        n, total, _ = self.moments(col)
+        return total / n if n else float("nan")
+
+    def var(self, col: Hashable, ddof: int = 0) -> float:
+        n, _, m2 = self.moments(col)
+        return m2 / (n - ddof) if n > ddof else float("nan")
+
+    def min(self, col: Hashable) -> float:
+        return self._get(col, "min", lambda: float(self._values(col).min()) if len(self._values(col)) else float("nan"))
+
+    def max(self, col: Hashable) -> float:
+        return self._get(col, "max", lambda: float(self._values(col).max()) if len(self._values(col)) else float("nan"))
+
+    def sorted_values(self, col: Hashable) -> np.ndarray:
+        """Non-missing values in ascending order (float64)."""
+        return self._get(col, "sorted", lambda: np.sort(self._values(col)))
+
+    def quantile(self, col: Hashable, q: float, interpolation: str = "linear") -> float:
+        """Same result as `Series.quantile(q, interpolation=...)`."""
+        values = self.sorted_values(col)
+        if not len(values):
+            return float("nan")
+        return float(np.percentile(values, q * 100, method=interpolation))
+
+    def median(self, col: Hashable) -> float:
+        """Same result as `Series.median()`."""
+        values = self.sorted_values(col)
+        return float(np.median(values)) if len(values) else float("nan")
+
+    def sketch(self, col: Hashable) -> QuantileSketch:
+        return self._get(col, "sketch", lambda: QuantileSketch.from_values(self.sorted_values(col)))
+
+    def factorize(self, col: Hashable) -> Tuple[np.ndarray, pd.Index]:
+        """`pd.factorize` of the column: codes (-1 for missing) and categories in first-appearance order."""
+        def compute() -> Tuple[np.ndarray, pd.Index]:
+            codes, uniques = pd.factorize(self.frame[col])
+            return codes, pd.Index(uniques, dtype=object)
+        return self._get(col, "factorize", compute)
+
+    def category_counts(self, col: Hashable) -> pd.Series:
+        """Count of each non-missing value, in first-appearance order."""
+        def compute() -> pd.Series:
+            codes, uniques = self.factorize(col)
+            return pd.Series(np.bincount(codes[codes >= 0], minlength=len(uniques)), index=uniques)
+        return self._get(col, "category_counts", compute)
+
+    def n_unique(self, col: Hashable) -> int:
+        return len(self.factorize(col)[1])
+
+    def value_counts(self, col: Hashable) -> pd.Series:
+        """Same result as `Series.value_counts()`."""
+        return self._get(col, "value_counts", lambda: self.frame[col].value_counts())
+
+    def datetime_convertible(self, col: Hashable) -> bool:
+        """Whether the column is datetime-typed or has any value `pd.to_datetime` can parse."""
+        def compute() -> bool:
+            values = self.frame[col]
+            return bool(pd.api.types.is_datetime64_any_dtype(values) or pd.to_datetime(values, errors="coerce").notna().any())
+        return self._get(col, "datetime_convertible", compute)
+
+    # ------------------------------
+    # Eager profiling
+    # ------------------------------
+    def compute(self, quantiles: bool = False) -> "DataProfile":
+        """Compute null counts, dtype classes and (for numeric columns) moments and min/max now."""
+        for col in self.frame.columns:
+            self.null_count(col)
+            if self.kind(col) == "numeric":
+                self.moments(col)
+                self.min(col)
+                self.max(col)
+                if quantiles:
+                    self.sketch(col)
+        return self
+
+    def summary(self) -> pd.DataFrame:
+        """One row per column: dtype, kind, null count, cardinality and numeric statistics."""
+        rows = {}
+        for col in self.frame.columns:
+            numeric = self.kind(col) == "numeric"
+            rows[col] = {
+                "dtype": str(self.frame[col].dtype),
+                "kind": self.kind(col),
+                "null_count": self.null_count(col),
+                "n_unique": self.n_unique(col),
+                "min": self.min(col) if numeric else np.nan,
+                "max": self.max(col) if numeric else np.nan,
+                "mean": self.mean(col) if numeric else np.nan,
+                "var": self.var(col) if numeric else np.nan,
+            }
+        return pd.DataFrame.from_dict(rows, orient="index")
+
+    def __repr__(self) -> str:
+        return f"DataProfile({self.frame.shape[0]} rows, {self.frame.shape[1]} columns, {len(self._cache)} profiled)"
+
+
+def _non_missing(values: pd.Series) -> np.ndarray:
+    array = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    return array[~np.isnan(array)]
+
+
+def _kind(values: pd.Series) -> str:
+    if pd.api.types.is_bool_dtype(values):
+        return "boolean"
+    if pd.api.types.is_numeric_dtype(values):
+        return "numeric"
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return "datetime"
+    if isinstance(values.dtype, pd.CategoricalDtype) or pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(values):
+        return "categorical"
+    return "other"
+
+
+def profile(X: pd.DataFrame, quantiles: bool = False) -> DataProfile:
+    """Profile every column of X now (see `DataProfile.compute`)."""
+    return DataProfile(X).compute(quantiles=quantiles)
+
+
+def profile_of(X: pd.DataFrame) -> DataProfile:
+    """The active profile if it describes X, otherwise a new (empty) profile of X."""
+    active = _active_profile.get()
+    return active if active is not None and active.frame is X else DataProfile(X)
+
+
+def active_for(X: Any) -> Optional[DataProfile]:
+    """The active profile if it describes X, else None."""
+    active = _active_profile.get()
+    return active if active is not None and active.frame is X else None
+
+
+@contextlib.contextmanager
+def activate(profile: Optional[DataProfile]) -> Iterator[Optional[DataProfile]]:
+    """Make `profile` the active profile for fits in this block (in this thread / task only); None clears it."""
+    token = _active_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _active_profile.reset(token)
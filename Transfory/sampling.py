@@ -0,0 +1,256 @@
+"""
+Sample-based fitting.
+
+`fit(X, y, sample=...)` fits on a uniform random sample of the rows instead of all
+of them. `X` may be one frame or an iterable of chunks (frames, or `(frame, y)`
+pairs), which is read once: `draw` keeps a reservoir of the rows with the smallest
+random keys, so memory stays at the sample size however long the stream is.
+
+With a `y` of labels (any non-float dtype), the sample is stratified: each label
+keeps its own reservoir and the final sample allocates rows to labels in proportion
+to their counts in the full data. Float targets are sampled uniformly.
+
+A transformer fitted on a sample records `sampling_report`: the sample and population
+sizes, plus estimated errors of its fitted statistics (`_sampling_errors`). Errors are
+half-widths of approximate 95% intervals, with the finite population correction:
+
+- means: ``1.96 * std / sqrt(n)``;
+- quantiles: half the spread of the sample values at ranks ``q * n ± 1.96 * sqrt(n q (1 - q))``;
+- vocabularies: the Good-Turing estimate of the share of rows whose category the
+  sample never saw (categories seen once / n);
+- min/max ranges: the chance ``2 / (n + 1)`` that a new value falls outside.
+"""
+
+from __future__ import annotations
+import contextlib
+import contextvars
+import math
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from . import backend as _backend
+from .exceptions import ConfigurationError
+from .profiling import DataProfile
+
+# z-score of the reported (two-sided 95%) error intervals.
+Z = 1.96
+
+# Number of rows in the data the current fits' sample was drawn from (None: not sampling).
+_population: contextvars.ContextVar[Optional[int]] = contextvars.ContextVar("transfory_population", default=None)
+
+
+class Sample(NamedTuple):
+    """Rows drawn by `draw`: the sampled frame, its targets (or None) and the number of rows read."""
+    X: pd.DataFrame
+    y: Optional[pd.Series]
+    n_seen: int
+
+
+class _Reservoir:
+    """The rows with the smallest random keys seen so far (at most `capacity`, None: unbounded)."""
+
+    def __init__(self, capacity: Optional[int]):
+        self.capacity = capacity
+        self.keys = np.empty(0)
+        self.positions = np.empty(0, dtype=np.int64)
+        self.frames: List[pd.DataFrame] = []
+        self.targets: List[np.ndarray] = []
+        self.count = 0  # rows offered, kept or not
+
+    def offer(self, keys: np.ndarray, positions: np.ndarray, frame: pd.DataFrame, target: Optional[np.ndarray]) -> None:
+        self.count += len(keys)
+        self.keys = np.concatenate([self.keys, keys])
+        self.positions = np.concatenate([self.positions, positions])
+        self.frames.append(frame)
+        if target is not None:
+            self.targets.append(target)
+        if self.capacity is not None and len(self.keys) > self.capacity:
+            self.trim(self.capacity)
+
+    def frame(self) -> pd.DataFrame:
+        return pd.concat(self.frames) if len(self.frames) > 1 else self.frames[0]
+
+    def target(self) -> Optional[np.ndarray]:
+        return np.concatenate(self.targets) if self.targets else None
+
+    def trim(self, size: int) -> None:
+        """Keep the `size` rows with the smallest keys, in arrival order."""
+        if size >= len(self.keys):
+            return
+        keep = np.sort(np.argpartition(self.keys, size - 1)[:size]) if size else np.empty(0, dtype=np.int64)
+        target = self.target()
+        self.frames = [self.frame().iloc[keep]]
+        self.targets = [] if target is None else [target[keep]]
+        self.keys, self.positions = self.keys[keep], self.positions[keep]
+
+
+def _chunks(X: Any, y: Any) -> Iterator[Tuple[pd.DataFrame, Any]]:
+    """(frame, y) pairs from one frame or an iterable of frames / (frame, y) pairs."""
+    if _backend.get_backend(X) is not None:
+        yield _backend.to_pandas(X), y
+        return
+    if y is not None:
+        raise ConfigurationError("With chunked input, pass targets inside the chunks as (X, y) pairs.")
+    for chunk in X:
+        frame, target = chunk if isinstance(chunk, tuple) else (chunk, None)
+        if _backend.get_backend(frame) is None:
+            raise TypeError(f"Chunks must be DataFrames or (DataFrame, y) pairs, got {type(frame)}.")
+        yield _backend.to_pandas(frame), target
+
+
+def _check_sample(sample: Union[int, float]) -> Union[int, float]:
+    if isinstance(sample, (bool, np.bool_)) or not isinstance(sample, (int, float, np.integer, np.floating)):
+        raise ConfigurationError(f"`sample` must be a row count (int) or a fraction (float), got {sample!r}.")
+    if isinstance(sample, (float, np.floating)):
+        if not 0 < sample <= 1:
+            raise ConfigurationError(f"A fractional `sample` must be in (0, 1], got {sample!r}.")
+        return float(sample)
+    if sample < 1:
+        raise ConfigurationError(f"`sample` must be a positive row count, got {sample!r}.")
+    return int(sample)
+
+
+def _stratify(target: Optional[np.ndarray]) -> bool:
+    return target is not None and not np.issubdtype(target.dtype, np.floating)
+
+
+def draw(X: Any, y: Any = None, sample: Union[int, float] = 0.01, random_state: Optional[int] = None) -> Sample:
+    """
+    Draw a uniform (or, for label `y`, stratified) random sample of rows in one pass.
+
+    Parameters
+    ----------
+    X : DataFrame or iterable
+        A pandas / Polars / Arrow frame, or an iterable of frames or `(frame, y)` pairs.
+    y : array-like, optional
+        Targets for a single-frame `X`.
+    sample : int or float
+        Number of rows, or fraction of rows. For a single frame, a fraction is turned
+        into a row count. For chunked input, whose length is unknown up front, each
+        row is kept with that probability.
+    random_state : int, optional
+        Seed for the random keys.
+    """
+    sample = _check_sample(sample)
+    rng = np.random.default_rng(random_state)
+    single = _backend.get_backend(X) is not None
+    if single and isinstance(sample, float):
+        sample = max(1, round(sample * len(X)))
+    bernoulli = isinstance(sample, float)
+    capacity = None if bernoulli else sample
+
+    strata: Dict[Hashable, _Reservoir] = {}
+    seen = 0
+    for frame, target in _chunks(X, y):
+        target = None if target is None else np.asarray(target)
+        if target is not None and len(target) != len(frame):
+            raise ConfigurationError(f"Targets have {len(target)} rows but the chunk has {len(frame)}.")
+        keys = rng.random(len(frame))
+        positions = np.arange(seen, seen + len(frame))
+        seen += len(frame)
+        if bernoulli:
+            kept = keys < sample
+            frame, keys, positions = frame.iloc[np.flatnonzero(kept)], keys[kept], positions[kept]
+            target = None if target is None else target[kept]
+        if not _stratify(target):
+            strata.setdefault(None, _Reservoir(capacity)).offer(keys, positions, frame, target)
+            continue
+        codes, labels = pd.factorize(target, use_na_sentinel=False)
+        for code, label in enumerate(labels):
+            rows = np.flatnonzero(codes == code)
+            label = "__nan__" if pd.isna(label) else label
+            strata.setdefault(label, _Reservoir(capacity)).offer(keys[rows], positions[rows], frame.iloc[rows], target[rows])
+
+    if not seen:
+        raise ConfigurationError("Cannot sample from empty input.")
+    if not bernoulli and len(strata) > 1:
+        for reservoir, size in zip(strata.values(), _allocate(sample, [r.count for r in strata.values()])):
+            reservoir.trim(size)
+
+    parts = [r for r in strata.values() if len(r.keys)]
+    if not parts:
+        raise ConfigurationError(f"`sample={sample}` drew no rows from {seen} rows.")
+    order = np.argsort(np.concatenate([r.positions for r in parts]), kind="stable")  # keep the input's row order
+    X_sample = pd.concat([r.frame() for r in parts]).iloc[order]
+    y_sample = None
+    if any(r.targets for r in parts):
+        y_sample = pd.Series(np.concatenate([r.target() for r in parts])[order], index=X_sample.index,
+                             name=getattr(y, "name", None))
+    return Sample(X_sample, y_sample, seen)
+
+
+def _allocate(size: int, counts: List[int]) -> List[int]:
+    """Split `size` rows over strata in proportion to `counts` (largest remainders)."""
+    total = sum(counts)
+    size = min(size, total)
+    shares = np.array(counts, dtype=np.float64) * size / total
+    alloc = np.floor(shares).astype(np.int64)
+    alloc[np.argsort(alloc - shares, kind="stable")[:size - alloc.sum()]] += 1
+    return [int(a) for a in np.minimum(alloc, counts)]
+
+
+# ------------------------------
+# Sampling context
+# ------------------------------
+@contextlib.contextmanager
+def population(n_rows: int) -> Iterator[None]:
+    """Fits in this block are fits on a sample of `n_rows` rows (in this thread / task only)."""
+    token = _population.set(n_rows)
+    try:
+        yield
+    finally:
+        _population.reset(token)
+
+
+def active_population() -> Optional[int]:
+    return _population.get()
+
+
+def report(transformer: Any, profile: DataProfile, population_size: int) -> Dict[str, Any]:
+    """`sampling_report` of a transformer just fitted on `profile.frame`."""
+    n = len(profile.frame)
+    return {
+        "sample_size": n,
+        "population_size": population_size,
+        "fraction": n / population_size if population_size else float("nan"),
+        "errors": transformer._sampling_errors(profile, population_size),
+    }
+
+
+# ------------------------------
+# Error estimates
+# ------------------------------
+def _fpc(n: int, population_size: int) -> float:
+    """Finite population correction of a standard error."""
+    return math.sqrt(max(population_size - n, 0) / (population_size - 1)) if population_size > 1 else 0.0
+
+
+def mean_error(profile: DataProfile, col: Hashable, population_size: int) -> float:
+    n = profile.count(col)
+    if n < 2:
+        return float("nan")
+    return Z * math.sqrt(profile.var(col, ddof=1) / n) * _fpc(n, population_size)
+
+
+def quantile_error(profile: DataProfile, col: Hashable, q: float, population_size: int) -> float:
+    values = profile.sorted_values(col)
+    n = len(values)
+    if n < 2:
+        return float("nan")
+    spread = Z * math.sqrt(n * q * (1 - q)) * _fpc(n, population_size)
+    lo = int(np.clip(math.floor(q * (n - 1) - spread), 0, n - 1))
+    hi = int(np.clip(math.ceil(q * (n - 1) + spread), 0, n - 1))
+    return float(values[hi] - values[lo]) / 2
+
+
+def range_error(profile: DataProfile, col: Hashable) -> float:
+    """Chance that a new value falls outside the sample's [min, max]."""
+    return 2 / (profile.count(col) + 1)
+
+
+def unseen_share(counts: pd.Series) -> float:
+    """Good-Turing estimate of the share of rows with a category `counts` does not contain."""
+    total = counts.sum()
+    return float((counts == 1).sum() / total) if total else float("nan")
@@ -1,7 +1,13 @@
 import pandas as pd
 from sklearn.preprocessing import MinMaxScaler, StandardScaler
-from .base import BaseTransformer as Transformer
+import numpy as np
+from .base import BaseTransformer as Transformer, _check_decay_window, _float_dtype, _union_columns
 from .exceptions import ConfigurationError, NoApplicableColumnsError
+from .numpy_export import _literal
+from .backend import import_optional, polars_float
+from .schema import select_columns
+from .profiling import profile_of
+from .sampling import mean_error, range_error
 
 class Scaler(Transformer):
     """
@@ -12,11 +18,26 @@ class Scaler(Transformer):
     Methods:
     - 'minmax':  Wraps sklearn.preprocessing.MinMaxScaler.
     - 'zscore': Wraps sklearn.preprocessing.StandardScaler.
+
+    `dtype` (float32 or float64) is the precision the scaler is fitted in and the dtype
+    of the scaled columns. By default, scikit-learn's float64 is used, and the statistics
+    are read from the shared column profile (see `transfory.profiling`) rather than
+    recomputed by scikit-learn.
+
+    `partial_fit` updates a fitted scaler with a new batch. With `decay`, the counts
+    behind the current means and variances are multiplied by `decay` before each batch
+    is merged, and 'minmax' moves the current range a `1 - decay` step toward the batch's
+    (always covering the batch). With `window`, only the last `window` batches count.
     """
+    _native_backends = ("polars",)
 
-    def __init__(self, method="minmax"):
+    def __init__(self, method="minmax", dtype=None, decay=None, window=None):
         super().__init__(name=f"Scaler(method='{method}')")
         self.method = method
+        self.dtype = dtype
+        _float_dtype(dtype)
+        # `partial_fit` forgetting: old state weighted by `decay` per batch, or only the last `window` batches.
+        self.decay, self.window = _check_decay_window(decay, window)
 
         # Map method names to scikit-learn scaler classes
         scaler_map = {
@@ -33,19 +54,148 @@ class Scaler(Transformer):
 
     def _fit(self, X: pd.DataFrame, y=None):
         """Fit the scaler on the numerical columns of X."""
-        self._columns_to_scale = X.select_dtypes(include="number").columns
+        self._columns_to_scale = pd.Index(select_columns(X, "number"))
         if self._columns_to_scale.empty:
             raise NoApplicableColumnsError(
                 f"Scaler found no numeric columns to scale in the provided DataFrame. Columns available: {X.columns.tolist()}"
             )
-        self._scaler.fit(X[self._columns_to_scale])
+        if _float_dtype(self.dtype) is None:
+            self._fit_from_profile(profile_of(X))
+        else:
+            self._scaler.fit(self._numeric(X))
 
         # Store the fitted scaler for persistence and inspection, per BaseTransformer design
         self._fitted_params["scaler_instance"] = self._scaler
         self._fitted_params["columns"] = self._columns_to_scale
 
+    def _fit_from_profile(self, profile):
+        """Fit in float64 from the profiled column statistics instead of rescanning the columns."""
+        cols = self._columns_to_scale
+        if self.method == "minmax":
+            self._fit_range(np.array([profile.min(col) for col in cols]), np.array([profile.max(col) for col in cols]))
+        else:
+            self._fit_moments(np.array([profile.count(col) for col in cols], dtype=np.float64),
+                              np.array([profile.mean(col) for col in cols]),
+                              np.array([profile.var(col) for col in cols]))
+
+    def _fit_range(self, data_min, data_max):
+        """
+        Fit the MinMaxScaler to per-column minima and maxima: fitting on the two rows
+        holding them gives exactly the range a fit on the full columns gives.
+        """
+        self._scaler.fit(pd.DataFrame([data_min, data_max], columns=self._columns_to_scale))
+
+    def _fit_moments(self, count, mean, var):
+        """
+        Fit the StandardScaler to per-column (possibly fractional) counts, means and ddof=0
+        variances. Fitting on one all-missing row records the columns; the documented fitted
+        attributes (`mean_`, `var_`, `scale_`, `n_samples_seen_`) are then set from the
+        moments as StandardScaler derives them, with no loss of precision.
+        """
+        with np.errstate(invalid="ignore", divide="ignore"):
+            self._scaler.fit(pd.DataFrame([np.full(len(count), np.nan)], columns=self._columns_to_scale))
+        count, mean, var = (np.asarray(v, dtype=np.float64) for v in (count, mean, var))
+        # StandardScaler's test for (near) constant columns, which get a scale of 1.
+        eps = np.finfo(np.float64).eps
+        constant = var <= count * eps * var + (count * mean * eps) ** 2
+        scale = np.sqrt(var)
+        scale[constant] = 1.0
+        self._scaler.mean_, self._scaler.var_, self._scaler.scale_ = mean, var, scale
+        self._scaler.n_samples_seen_ = count
+
+    def _sampling_errors(self, profile, population_size):
+        if self.method == "zscore":
+            return {"mean": {col: mean_error(profile, col, population_size) for col in self._columns_to_scale}}
+        return {"outside_range": {col: range_error(profile, col) for col in self._columns_to_scale}}
+
+    def _modified_columns(self):
+        return list(self._columns_to_scale)
+
     def _transform(self, X: pd.DataFrame) -> pd.DataFrame:
         """Transform the numerical columns of X using the fitted scaler."""
         if self._columns_to_scale is not None and not self._columns_to_scale.empty:
-            X[self._columns_to_scale] = self._scaler.transform(X[self._columns_to_scale])
+            X[self._columns_to_scale] = self._scaler.transform(self._numeric(X))
         return X
+
+    def _numeric(self, X: pd.DataFrame) -> pd.DataFrame:
+        """The columns to scale, cast to `dtype` when one is set (scikit-learn preserves float32)."""
+        dtype = _float_dtype(self.dtype)
+        subset = X[self._columns_to_scale]
+        return subset.astype(dtype) if dtype is not None else subset
+
+    def _transform_polars(self, X):
+        """Polars version of `_transform`, using the fitted scikit-learn statistics."""
+        pl = import_optional("polars")
+        if self._columns_to_scale is None or self._columns_to_scale.empty:
+            return X
+        float_type = polars_float(self.dtype)
+        if self.method == "minmax":
+            exprs = [(pl.col(c).cast(float_type) * float(scale) + float(offset)).cast(float_type)
+                     for c, scale, offset in zip(self._columns_to_scale, self._scaler.scale_, self._scaler.min_)]
+        else:
+            exprs = [((pl.col(c).cast(float_type) - float(mean)) / float(scale)).cast(float_type)
+                     for c, mean, scale in zip(self._columns_to_scale, self._scaler.mean_, self._scaler.scale_)]
+        return X.with_columns(exprs)
+
+    def _merge(self, other):
+        """
+        Combine fitted scikit-learn statistics: min/max for 'minmax', counts/means/variances
+        for 'zscore'. A column only one side scaled counts as empty on the other.
+        """
+        a, b = self._scaler, other._scaler
+        columns = pd.Index(_union_columns(self._columns_to_scale, other._columns_to_scale))
+        # Align both sides' per-column statistics to the union of the columns.
+        mine, theirs = self._columns_to_scale.get_indexer(columns), other._columns_to_scale.get_indexer(columns)
+        self._columns_to_scale = columns
+        self._fitted_params["columns"] = columns
+        if self.method == "minmax":
+            self._fit_range(np.fmin(_aligned(a.data_min_, mine), _aligned(b.data_min_, theirs)),
+                            np.fmax(_aligned(a.data_max_, mine), _aligned(b.data_max_, theirs)))
+        else:
+            n_a = _aligned(np.broadcast_to(a.n_samples_seen_, a.mean_.shape).astype(np.float64), mine, 0.0)
+            n_b = _aligned(np.broadcast_to(b.n_samples_seen_, b.mean_.shape).astype(np.float64), theirs, 0.0)
+            mean_a, mean_b = _aligned(a.mean_, mine), _aligned(b.mean_, theirs)
+            var_a, var_b = _aligned(a.var_, mine), _aligned(b.var_, theirs)
+            n = n_a + n_b
+            # Chan et al. pairwise update of means and sums of squared deviations.
+            with np.errstate(invalid="ignore", divide="ignore"):
+                delta = mean_b - mean_a
+                mean = np.where(n_b == 0, mean_a, mean_a + delta * n_b / n)
+                m2 = np.nan_to_num(var_a * n_a) + np.nan_to_num(var_b * n_b) + np.nan_to_num(delta ** 2 * n_a * n_b / n)
+                var = m2 / n
+            mean = np.where(n_a == 0, mean_b, mean)
+            self._fit_moments(n, mean, var)
+
+    def _decay(self, factor, batch):
+        """Down-weight the fitted counts ('zscore') or pull the fitted range toward the batch's ('minmax')."""
+        a, b = self._scaler, batch._scaler
+        if self.method == "zscore":
+            n = np.broadcast_to(a.n_samples_seen_, a.mean_.shape).astype(np.float64)
+            self._fit_moments(n * factor, a.mean_, a.var_)
+            return
+        # Columns the batch does not have keep their range; new ones are added by `merge`.
+        order = batch._columns_to_scale.get_indexer(self._columns_to_scale)
+        ema = lambda old, new: np.where(np.isnan(new), old, factor * old + (1 - factor) * new)
+        self._fit_range(ema(a.data_min_, _aligned(b.data_min_, order)), ema(a.data_max_, _aligned(b.data_max_, order)))
+
+    def _numpy_source(self, fn_name, input_columns):
+        lines = [f"def {fn_name}(cols):", "    cols = dict(cols)"]
+        if self._columns_to_scale is not None and not self._columns_to_scale.empty:
+            dtype = f"np.{(_float_dtype(self.dtype) or np.dtype(np.float64)).name}"
+            if self.method == "minmax":
+                # MinMaxScaler.transform computes X * scale_ + min_
+                params = zip(self._columns_to_scale, self._scaler.scale_, self._scaler.min_)
+                template = "    cols[{col}] = (cols[{col}].astype({dtype}) * {a} + {b}).astype({dtype})"
+            else:
+                # StandardScaler.transform computes (X - mean_) / scale_
+                params = zip(self._columns_to_scale, self._scaler.mean_, self._scaler.scale_)
+                template = "    cols[{col}] = ((cols[{col}].astype({dtype}) - {a}) / {b}).astype({dtype})"
+            for col, a, b in params:
+                lines.append(template.format(col=_literal(col), a=_literal(a), b=_literal(b), dtype=dtype))
+        lines += ["    return cols", ""]
+        return lines, list(input_columns)
+
+
+def _aligned(values, indexer, fill=np.nan):
+    """`values[indexer]`, with `fill` where the indexer is -1 (a column the values do not cover)."""
+    return np.where(indexer >= 0, values[indexer], fill)
@@ -0,0 +1,97 @@
+"""
+Schema fingerprints and cached dtype-based column selection.
+
+A schema fingerprint is a frame's column names and dtypes, as a hashable tuple.
+Results that only depend on the schema (which columns `select_dtypes` picks, whether
+the columns a transformer reads are present) are cached against it, so repeated calls
+on frames with the same layout -- e.g. small-batch transforms or cross-validation
+refits -- skip recomputing them. The caches compare the full tuples, so two different
+schemas never share an entry.
+
+During a fit, the fingerprint of each frame is computed once and kept on its
+`DataProfile`, which `Pipeline` hands from step to step.
+"""
+
+from __future__ import annotations
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+from . import profiling as _profiling
+
+# Maximum number of entries kept by each cache.
+CACHE_SIZE = 256
+
+Fingerprint = Tuple[Tuple[Hashable, ...], Tuple[Any, ...]]
+
+_selection_cache: "OrderedDict[Hashable, List[str]]" = OrderedDict()
+_coverage_cache: "OrderedDict[Hashable, None]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def schema_fingerprint(X: Any) -> Fingerprint:
+    """Column names and dtypes of a pandas or Polars frame."""
+    # pandas' block manager lists the dtypes without building a Series, as `X.dtypes` does.
+    manager = getattr(X, "_mgr", None)
+    dtypes = manager.get_dtypes() if hasattr(manager, "get_dtypes") else X.dtypes
+    return tuple(X.columns), tuple(dtypes)
+
+
+def select_columns(X: pd.DataFrame, include: Union[str, Any, Sequence[Any]], fingerprint: Optional[Fingerprint] = None) -> List[str]:
+    """
+    Column names `X.select_dtypes(include=include)` would return, cached by schema.
+
+    Parameters
+    ----------
+    X : pd.DataFrame
+        Frame to select from.
+    include : str, dtype or list of those
+        Passed through to `select_dtypes`.
+    fingerprint : tuple, optional
+        Precomputed `schema_fingerprint(X)`. By default it is taken from the active
+        profile of X (see `transfory.profiling`), or computed.
+    """
+    if fingerprint is None:
+        profile = _profiling.active_for(X)
+        fingerprint = profile.fingerprint if profile is not None else schema_fingerprint(X)
+    key_include = tuple(include) if isinstance(include, (list, tuple)) else (include,)
+    key = (fingerprint, tuple(map(str, key_include)))
+    with _lock:
+        if key in _selection_cache:
+            _selection_cache.move_to_end(key)
+            return list(_selection_cache[key])
+
+    selected = X.select_dtypes(include=include).columns.tolist()
+    with _lock:
+        _selection_cache[key] = selected
+        _trim(_selection_cache)
+    return list(selected)
+
+
+def covers_columns(columns: Sequence[Hashable], required: Sequence[Hashable]) -> bool:
+    """Whether every name in `required` is in `columns`; layouts that pass are cached."""
+    key = (tuple(columns), tuple(required))
+    with _lock:
+        if key in _coverage_cache:
+            _coverage_cache.move_to_end(key)
+            return True
+    if not set(required).issubset(key[0]):
+        return False
+    with _lock:
+        _coverage_cache[key] = None
+        _trim(_coverage_cache)
+    return True
+
+
+def _trim(cache: OrderedDict) -> None:
+    while len(cache) > CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def clear_cache() -> None:
+    """Drop all cached column selections and column checks."""
+    with _lock:
+        _selection_cache.clear()
+        _coverage_cache.clear()
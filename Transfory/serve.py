@@ -0,0 +1,491 @@
+"""
+Local micro-batching inference server for fitted Transfory pipelines.
+
+Row-at-a-time calls to `Pipeline.transform` pay the full pandas per-call
+overhead for every record. `MicroBatcher` coalesces concurrent single-record
+requests into small batches (bounded by `max_batch_size` and `max_wait_ms`)
+and runs one `transform` per batch.
+
+Usage
+-----
+    python -m transfory.serve trained_pipeline.joblib --port 8000
+    python -m transfory.serve trained_pipeline.joblib --unix-socket /tmp/transfory.sock
+    python -m transfory.serve trained_pipeline.joblib --load-test sample.csv
+
+Endpoints
+---------
+POST /transform   body: a JSON record, or a list of records. Returns the transformed record(s).
+GET  /metrics     returns the request/batch latency histograms and batch size counts.
+"""
+
+from __future__ import annotations
+import argparse
+import bisect
+import json
+import os
+import queue
+import socketserver
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .base import BaseTransformer
+from .exceptions import ColumnMismatchError, ConfigurationError, NotFittedError
+from .pipeline import Pipeline
+
+
+class LatencyHistogram:
+    """
+    Thread-safe fixed-bucket histogram of latencies, in milliseconds.
+
+    Percentiles are estimated from the bucket upper bounds, which is accurate
+    enough for monitoring and keeps `record()` O(log buckets).
+    """
+
+    DEFAULT_BUCKETS_MS = (0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+    def __init__(self, buckets_ms: Sequence[float] = DEFAULT_BUCKETS_MS):
+        self.buckets_ms = tuple(sorted(buckets_ms))
+        self._counts = [0] * (len(self.buckets_ms) + 1)  # last bucket is +inf
+        self._total = 0
+        self._sum_ms = 0.0
+        self._max_ms = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        ms = seconds * 1000.0
+        idx = bisect.bisect_left(self.buckets_ms, ms)
+        with self._lock:
+            self._counts[idx] += 1
+            self._total += 1
+            self._sum_ms += ms
+            self._max_ms = max(self._max_ms, ms)
+
+    def percentile(self, q: float) -> float:
+        """Return the upper bound (ms) of the bucket containing the q-th percentile (0-100)."""
+        with self._lock:
+            if self._total == 0:
+                return 0.0
+            target = q / 100.0 * self._total
+            running = 0
+            for idx, count in enumerate(self._counts):
+                running += count
+                if running >= target and count:
+                    return self.buckets_ms[idx] if idx < len(self.buckets_ms) else self._max_ms
+            return self._max_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            labels = [f"<={b}ms" for b in self.buckets_ms] + [f">{self.buckets_ms[-1]}ms"]
+            counts = dict(zip(labels, self._counts))
+            total, sum_ms, max_ms = self._total, self._sum_ms, self._max_ms
+        return {
+            "count": total,
+            "mean_ms": sum_ms / total if total else 0.0,
+            "max_ms": max_ms,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "buckets": counts,
+        }
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent single-record transform requests into micro-batches.
+
+    A single worker thread waits for the first queued record, then keeps
+    collecting records until either `max_batch_size` records are queued or
+    `max_wait_ms` has elapsed, and calls `pipeline.transform` once for the batch.
+
+    Parameters
+    ----------
+    pipeline : BaseTransformer
+        A fitted transformer (usually a loaded `Pipeline`).
+    max_batch_size : int, default=64
+        Upper bound on the number of records per `transform` call.
+    max_wait_ms : float, default=5.0
+        Upper bound on how long the first record of a batch waits for company.
+    """
+
+    _STOP = object()
+
+    def __init__(self, pipeline: BaseTransformer, max_batch_size: int = 64, max_wait_ms: float = 5.0):
+        if not getattr(pipeline, "is_fitted", False):
+            raise NotFittedError("MicroBatcher requires a fitted pipeline.")
+        if max_batch_size < 1:
+            raise ConfigurationError("`max_batch_size` must be at least 1.")
+        if max_wait_ms < 0:
+            raise ConfigurationError("`max_wait_ms` must be non-negative.")
+
+        self.pipeline = pipeline
+        # Records may only use the fit-time input columns and must hold every column transform reads.
+        self._input_columns = list(getattr(pipeline, "_last_input_columns", None) or [])
+        self._known_columns = set(self._input_columns)
+        self._required_columns = list(pipeline.required_columns)
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.request_latency = LatencyHistogram()
+        self.batch_latency = LatencyHistogram()
+        self.batch_sizes: Dict[int, int] = {}
+        self._batch_sizes_lock = threading.Lock()  # the worker updates batch_sizes while handlers read it
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        # Held while enqueueing, so no record can be queued behind the STOP sentinel.
+        self._lifecycle_lock = threading.Lock()
+
+    # ------------------------------
+    # Lifecycle
+    # ------------------------------
+    def start(self) -> "MicroBatcher":
+        with self._lifecycle_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="transfory-microbatcher", daemon=True)
+                self._worker.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Process the records queued so far, then stop the worker. Later submissions raise."""
+        with self._lifecycle_lock:
+            worker, self._worker = self._worker, None
+            if worker is not None and worker.is_alive():
+                self._queue.put(self._STOP)
+        if worker is not None:
+            worker.join(timeout)
+        if worker is None or not worker.is_alive():
+            self._fail_pending()
+
+    def __enter__(self) -> "MicroBatcher":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    # ------------------------------
+    # Client API
+    # ------------------------------
+    def submit_async(self, record: Dict[str, Any]) -> "Future[Dict[str, Any]]":
+        """Queue a single record and return a Future for its transformed output."""
+        if not isinstance(record, dict):
+            raise TypeError(f"A record must be a dict of column values, got {type(record).__name__}.")
+        future: "Future[Dict[str, Any]]" = Future()
+        with self._lifecycle_lock:
+            if self._worker is None:
+                raise RuntimeError("MicroBatcher is not running. Call .start() first.")
+            self._queue.put((record, future, time.perf_counter()))
+        return future
+
+    def submit(self, record: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Transform a single record, blocking until its micro-batch has been processed."""
+        return self.submit_async(record).result(timeout)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "request_latency": self.request_latency.snapshot(),
+            "batch_latency": self.batch_latency.snapshot(),
+            "batch_sizes": self._batch_sizes_snapshot(),
+        }
+
+    def _batch_sizes_snapshot(self) -> Dict[int, int]:
+        with self._batch_sizes_lock:
+            return dict(sorted(self.batch_sizes.items()))
+
+    # ------------------------------
+    # Worker
+    # ------------------------------
+    def _collect_batch(self, first: Any) -> Tuple[List[Any], bool]:
+        batch = [first]
+        deadline = time.perf_counter() + self.max_wait_ms / 1000.0
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is self._STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is self._STOP:
+                break
+            batch, stop = self._collect_batch(first)
+            self._process(batch)
+            if stop:
+                break
+        self._fail_pending()
+
+    def _fail_pending(self) -> None:
+        """Fail every request still queued, so no caller waits forever on a stopped batcher."""
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is not self._STOP and not item[1].done():
+                item[1].set_exception(RuntimeError("MicroBatcher was stopped before the record was processed."))
+
+    def _check_record(self, record: Dict[str, Any]) -> Optional[Exception]:
+        """An error for a record with unknown or missing columns, else None."""
+        unknown = [key for key in record if key not in self._known_columns] if self._known_columns else []
+        missing = [col for col in self._required_columns if col not in record]
+        if unknown or missing:
+            return ColumnMismatchError(f"Record has unknown columns {unknown} and lacks columns {missing}.")
+        return None
+
+    def _process(self, batch: List[Any]) -> None:
+        valid = []
+        for item in batch:
+            error = self._check_record(item[0])
+            if error is None:
+                valid.append(item)
+            else:
+                item[1].set_exception(error)
+        if not valid:
+            return
+        batch = valid
+        records = [record for record, _, _ in batch]
+        keys = set().union(*records)
+        columns = [col for col in self._input_columns if col in keys] or None
+        started = time.perf_counter()
+        try:
+            transformed = self.pipeline.transform(pd.DataFrame.from_records(records, columns=columns))
+            results = transformed.to_dict(orient="records")
+        except Exception as e:
+            if len(batch) == 1:
+                batch[0][1].set_exception(e)
+                return
+            # One bad record must not fail the unrelated requests batched with it:
+            # retry record by record so only the offending request gets the error.
+            for item in batch:
+                self._process([item])
+            return
+        finished = time.perf_counter()
+
+        self.batch_latency.record(finished - started)
+        with self._batch_sizes_lock:
+            self.batch_sizes[len(batch)] = self.batch_sizes.get(len(batch), 0) + 1
+        for (_, future, enqueued), result in zip(batch, results):
+            self.request_latency.record(finished - enqueued)
+            future.set_result(result)
+
+
+# ------------------------------
+# HTTP / Unix-socket front end
+# ------------------------------
+def _json_safe(value: Any) -> Any:
+    """Replace NaN, infinities and missing markers with None, which JSON encodes as null."""
+    if isinstance(value, dict):
+        return {key: _json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(item) for item in value]
+    if isinstance(value, (float, np.floating)) and not np.isfinite(value):
+        return None
+    if value is pd.NaT or value is pd.NA:
+        return None
+    return value
+
+
+def _dumps(payload: Any, **kwargs: Any) -> str:
+    """Strict JSON: non-finite floats become null instead of the non-standard `NaN` token."""
+    return json.dumps(_json_safe(payload), default=_json_default, allow_nan=False, **kwargs)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class _TransformRequestHandler(BaseHTTPRequestHandler):
+    """Routes POST /transform to the server's MicroBatcher and GET /metrics to its histograms."""
+
+    def _send_json(self, status: int, payload: Any) -> None:
+        body = _dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if self.path.rstrip("/") == "/metrics":
+            self._send_json(200, self.server.batcher.metrics())
+        else:
+            self._send_json(404, {"error": f"Unknown path '{self.path}'."})
+
+    def do_POST(self) -> None:
+        if self.path.rstrip("/") != "/transform":
+            self._send_json(404, {"error": f"Unknown path '{self.path}'."})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length) or b"null")
+        except (ValueError, json.JSONDecodeError) as e:
+            self._send_json(400, {"error": f"Invalid JSON body: {e}"})
+            return
+
+        if not isinstance(payload, (dict, list)):
+            self._send_json(400, {"error": "Body must be a JSON object or a list of objects."})
+            return
+        records = payload if isinstance(payload, list) else [payload]
+        if not all(isinstance(record, dict) for record in records):
+            self._send_json(400, {"error": "Every item of a list body must be a JSON object."})
+            return
+        try:
+            futures = [self.server.batcher.submit_async(record) for record in records]
+            results = [future.result() for future in futures]
+        except Exception as e:
+            self._send_json(500, {"error": str(e)})
+            return
+        self._send_json(200, results if isinstance(payload, list) else results[0])
+
+    def address_string(self) -> str:
+        # Unix-socket peers have no (host, port) address.
+        return self.client_address[0] if isinstance(self.client_address, tuple) and self.client_address else "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], batcher: MicroBatcher, verbose: bool = False):
+        super().__init__(address, _TransformRequestHandler)
+        self.batcher = batcher
+        self.verbose = verbose
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, batcher: MicroBatcher, verbose: bool = False):
+        if os.path.exists(path):
+            os.remove(path)
+        super().__init__(path, _TransformRequestHandler)
+        self.batcher = batcher
+        self.verbose = verbose
+
+
+def make_server(batcher: MicroBatcher, host: str = "127.0.0.1", port: int = 8000,
+                unix_socket: Optional[str] = None, verbose: bool = False) -> socketserver.BaseServer:
+    """
+    Build (but do not start) an HTTP server in front of `batcher`.
+
+    If `unix_socket` is given, the server listens on that path instead of `host:port`.
+    """
+    if unix_socket is not None:
+        return _UnixHTTPServer(unix_socket, batcher, verbose=verbose)
+    return _HTTPServer((host, port), batcher, verbose=verbose)
+
+
+def serve(model_path: str, host: str = "127.0.0.1", port: int = 8000, unix_socket: Optional[str] = None,
+          max_batch_size: int = 64, max_wait_ms: float = 5.0, verbose: bool = False) -> None:
+    """Load a saved pipeline and serve it until interrupted."""
+    pipeline = Pipeline.load(model_path)
+    with MicroBatcher(pipeline, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms) as batcher:
+        server = make_server(batcher, host=host, port=port, unix_socket=unix_socket, verbose=verbose)
+        where = unix_socket or f"http://{host}:{server.server_address[1]}"
+        print(f"Serving {pipeline!r} on {where} (max_batch_size={max_batch_size}, max_wait_ms={max_wait_ms})")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            if unix_socket is not None and os.path.exists(unix_socket):
+                os.remove(unix_socket)
+
+
+# ------------------------------
+# Load testing
+# ------------------------------
+def load_test(batcher: MicroBatcher, records: Sequence[Dict[str, Any]], n_clients: int = 16,
+              n_requests: int = 1000) -> Dict[str, Any]:
+    """
+    Drive `batcher` with `n_clients` concurrent stand-in clients, each submitting
+    single records (cycled from `records`) until `n_requests` have been sent.
+
+    Returns throughput and the batcher's latency metrics.
+
+    The clients call `submit` in-process: the numbers cover queueing, batching
+    and `transform`, but not HTTP parsing, JSON encoding or the network, so
+    they are an upper bound on what the server sustains end to end.
+    """
+    if not records:
+        raise ValueError("load_test requires at least one record.")
+
+    counter = iter(range(n_requests))
+    lock = threading.Lock()
+    errors: List[BaseException] = []
+
+    def client() -> None:
+        while True:
+            with lock:
+                i = next(counter, None)
+            if i is None:
+                return
+            try:
+                batcher.submit(records[i % len(records)])
+            except Exception as e:
+                errors.append(e)
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=client) for _ in range(n_clients)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    return {
+        "n_requests": n_requests,
+        "n_clients": n_clients,
+        "n_errors": len(errors),
+        "elapsed_s": elapsed,
+        "requests_per_s": n_requests / elapsed if elapsed else float("inf"),
+        **batcher.metrics(),
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="transfory.serve", description="Serve a saved Transfory pipeline with micro-batching.")
+    parser.add_argument("model", help="Path to a pipeline saved with Pipeline.save().")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--unix-socket", default=None, help="Listen on this Unix socket path instead of host:port.")
+    parser.add_argument("--max-batch-size", type=int, default=64)
+    parser.add_argument("--max-wait-ms", type=float, default=5.0)
+    parser.add_argument("--verbose", action="store_true", help="Log every HTTP request.")
+    parser.add_argument("--load-test", metavar="CSV", default=None,
+                        help="Instead of serving, run an in-process load test using records from this CSV.")
+    parser.add_argument("--clients", type=int, default=16, help="Concurrent clients for --load-test.")
+    parser.add_argument("--requests", type=int, default=1000, help="Total requests for --load-test.")
+    args = parser.parse_args(argv)
+
+    if args.load_test:
+        pipeline = Pipeline.load(args.model)
+        records = pd.read_csv(args.load_test).to_dict(orient="records")
+        with MicroBatcher(pipeline, max_batch_size=args.max_batch_size, max_wait_ms=args.max_wait_ms) as batcher:
+            report = load_test(batcher, records, n_clients=args.clients, n_requests=args.requests)
+        print(_dumps(report, indent=2))
+        return
+
+    serve(args.model, host=args.host, port=args.port, unix_socket=args.unix_socket,
+          max_batch_size=args.max_batch_size, max_wait_ms=args.max_wait_ms, verbose=args.verbose)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Mergeable quantile sketch.
+
+`QuantileSketch` summarizes a numeric column in at most `max_size` weighted points.
+Sketches built on disjoint partitions merge into a sketch of the union, so quantile
+statistics (OutlierHandler bounds, MissingValueHandler medians) can be fitted per
+partition and reduced afterwards.
+
+Up to `max_size` values the sketch stores every value and its quantiles are exact
+(matching pandas for every interpolation). Beyond that, runs of neighbouring values
+are collapsed into weighted centroids of roughly equal weight, so the rank error of a
+query is bounded by about ``n / max_size`` values per compression.
+"""
+
+from __future__ import annotations
+from typing import Any, Optional
+
+import numpy as np
+
+# Default number of points kept per sketch.
+DEFAULT_SIZE = 2048
+
+_INTERPOLATIONS = ("linear", "lower", "higher", "midpoint", "nearest")
+
+
+class QuantileSketch:
+    """
+    Weighted, sorted summary of the non-missing values of a column.
+
+    Parameters
+    ----------
+    max_size : int
+        Maximum number of stored points. The minimum and maximum are always exact.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_SIZE):
+        if max_size < 2:
+            raise ValueError("`max_size` must be at least 2.")
+        self.max_size = max_size
+        self.values = np.empty(0, dtype=np.float64)
+        self.weights = np.empty(0, dtype=np.float64)
+
+    @classmethod
+    def from_values(cls, values: Any, max_size: int = DEFAULT_SIZE) -> "QuantileSketch":
+        """Sketch of `values`, ignoring NaN."""
+        sketch = cls(max_size)
+        sketch.update(values)
+        return sketch
+
+    @property
+    def count(self) -> float:
+        return float(self.weights.sum())
+
+    @property
+    def is_exact(self) -> bool:
+        """True while every stored point is a single original value."""
+        return bool((self.weights == 1).all())
+
+    def update(self, values: Any) -> "QuantileSketch":
+        """Add `values` (NaN is ignored) to the sketch in place."""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        return self._absorb(values, np.ones(len(values)))
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """A new sketch summarizing both inputs."""
+        merged = QuantileSketch(max(self.max_size, other.max_size))
+        merged.values, merged.weights = self.values.copy(), self.weights.copy()
+        return merged._absorb(other.values, other.weights)
+
+    def scaled(self, factor: float) -> "QuantileSketch":
+        """A new sketch with every weight multiplied by `factor` (e.g. to down-weight old data)."""
+        scaled = QuantileSketch(self.max_size)
+        scaled.values, scaled.weights = self.values.copy(), self.weights * factor
+        return scaled
+
+    def _absorb(self, values: np.ndarray, weights: np.ndarray) -> "QuantileSketch":
+        values = np.concatenate([self.values, values])
+        weights = np.concatenate([self.weights, weights])
+        order = np.argsort(values, kind="stable")
+        self.values, self.weights = values[order], weights[order]
+        if len(self.values) > self.max_size:
+            self._compress()
+        return self
+
+    def _compress(self) -> None:
+        """Collapse neighbouring points into `max_size` centroids of about equal weight."""
+        values, weights = self.values, self.weights
+        cumulative = np.cumsum(weights)
+        total = cumulative[-1]
+        # Keep the extremes as their own points so min/max stay exact.
+        inner = slice(1, len(values) - 1)
+        n_bins = self.max_size - 2
+        midpoints = (cumulative[inner] - weights[inner] / 2 - weights[0]) / (total - weights[0] - weights[-1])
+        bins = np.minimum((midpoints * n_bins).astype(np.int64), n_bins - 1)
+        bin_weights = np.bincount(bins, weights=weights[inner], minlength=n_bins)
+        bin_sums = np.bincount(bins, weights=values[inner] * weights[inner], minlength=n_bins)
+        used = bin_weights > 0
+        self.values = np.concatenate([values[:1], bin_sums[used] / bin_weights[used], values[-1:]])
+        self.weights = np.concatenate([weights[:1], bin_weights[used], weights[-1:]])
+
+    def quantile(self, q: float, interpolation: str = "linear") -> float:
+        """
+        Estimate the `q` quantile. Exact sketches match `pandas.Series.quantile`; compressed
+        ones interpolate linearly between centroids placed at the middle of their ranks.
+        """
+        if interpolation not in _INTERPOLATIONS:
+            raise ValueError(f"interpolation must be one of {list(_INTERPOLATIONS)}.")
+        if not len(self.values):
+            return float("nan")
+        if self.is_exact:
+            return float(np.quantile(self.values, q, method=interpolation))
+        # Rank position (0 .. n-1) of each centroid's middle value.
+        positions = np.cumsum(self.weights) - (self.weights + 1) / 2
+        return float(np.interp(q * (self.count - 1), positions, self.values))
+
+    def __repr__(self) -> str:
+        return f"QuantileSketch(count={self.count:g}, points={len(self.values)}, max_size={self.max_size})"
+
+
+def merge_sketches(a: Optional[QuantileSketch], b: Optional[QuantileSketch]) -> Optional[QuantileSketch]:
+    """Merge two optional sketches."""
+    if a is None or b is None:
+        return a if b is None else b
+    return a.merge(b)
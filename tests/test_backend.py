@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pl = pytest.importorskip("polars")
+pa = pytest.importorskip("pyarrow")
+
+from transfory.pipeline import Pipeline
+from transfory.column_transformer import ColumnTransformer
+from transfory.missing import MissingValueHandler
+from transfory.encoder import Encoder
+from transfory.scaler import Scaler
+from transfory.outlier import OutlierHandler
+from transfory.datetime import DatetimeFeatureExtractor
+from transfory.featuregen import FeatureGenerator
+from transfory.exceptions import ColumnMismatchError
+
+
+@pytest.fixture
+def raw_df():
+    return pd.DataFrame({
+        "age": [20, 25, 30, np.nan, 22, 90],
+        "income": [50000, 60000, np.nan, 55000, 52000, 1e6],
+        "city": ["Manila", "Cebu", "Manila", "Davao", None, "Cebu"],
+        "signup": ["2023-01-05", "2024-03-10", "2022-12-31", "2021-06-15", "2020-02-29", "2019-07-04"],
+    })
+
+
+@pytest.mark.parametrize("transformer", [
+    MissingValueHandler(strategy="mean"),
+    MissingValueHandler(strategy="mode"),
+    Encoder(method="onehot"),
+    Encoder(method="label"),
+    OutlierHandler(method="iqr"),
+    DatetimeFeatureExtractor(features=["year", "month", "day", "dayofweek", "dayofyear", "quarter"]),
+])
+def test_polars_transform_matches_pandas(raw_df, transformer):
+    expected = transformer.fit(raw_df).transform(raw_df)
+    result = transformer.transform(pl.from_pandas(raw_df))
+
+    assert isinstance(result, pl.DataFrame)
+    assert result.columns == list(expected.columns)
+    pd.testing.assert_frame_equal(result.to_pandas(), expected, check_dtype=False)
+
+
+def test_polars_scaler_matches_pandas(raw_df):
+    numeric = raw_df[["age", "income"]].fillna(0)
+    for method in ["minmax", "zscore"]:
+        scaler = Scaler(method=method).fit(numeric)
+        expected = scaler.transform(numeric)
+        result = scaler.transform(pl.from_pandas(numeric))
+        np.testing.assert_allclose(result.to_numpy(), expected.to_numpy())
+
+
+def test_arrow_pipeline_roundtrip(raw_df):
+    pipe = Pipeline([
+        ("dates", DatetimeFeatureExtractor()),
+        ("imputer", MissingValueHandler(strategy="median")),
+        ("encoder", Encoder()),
+        ("scaler", Scaler()),
+        ("features", FeatureGenerator()),  # no Polars implementation: falls back to pandas
+    ])
+    expected = pipe.fit_transform(raw_df)
+    result = pipe.transform(pa.Table.from_pandas(raw_df, preserve_index=False))
+
+    assert isinstance(result, pa.Table)
+    assert result.column_names == list(expected.columns)
+    np.testing.assert_allclose(result.to_pandas().to_numpy(dtype=float), expected.to_numpy(dtype=float))
+
+
+def test_polars_fit_and_column_transformer(raw_df):
+    ct = ColumnTransformer([
+        ("num", Pipeline([("imputer", MissingValueHandler()), ("scaler", Scaler())]), ["age", "income"]),
+        ("cat", Encoder(method="label"), ["city"]),
+    ], remainder="drop")
+    frame = pl.from_pandas(raw_df)
+    result = ct.fit_transform(frame)
+
+    assert isinstance(result, pl.DataFrame)
+    assert result.columns == ["age", "income", "city"]
+    with pytest.raises(ColumnMismatchError):
+        ct.transform(frame.drop("city"))
+
+
+def test_unsupported_input_type():
+    with pytest.raises(TypeError, match="expects a pandas.DataFrame"):
+        MissingValueHandler().fit([[1, 2], [3, 4]])
@@ -1,7 +1,14 @@
 # tests/test_base.py
+import pickle
 import pytest
+import numpy as np
 import pandas as pd
-from transfory.base import ExampleScaler
+from transfory.base import BaseTransformer, ExampleScaler, keep_merge_state
+from transfory.datetime import DatetimeFeatureExtractor
+from transfory.encoder import Encoder
+from transfory.exceptions import ColumnMismatchError, ConfigurationError, NotFittedError
+from transfory.missing import MissingValueHandler
+from transfory.outlier import OutlierHandler
 
 
 @pytest.fixture
@@ -13,8 +20,194 @@ def sample_dataframe():
     })
     return df
 
+
+@pytest.fixture
+def partition_df():
+    """Numeric and categorical columns with missing values, for merge tests."""
+    return pd.DataFrame({"x": [1.0, np.nan, 3.0, 4.0, 10.0, np.nan], "s": ["a", "b", None, "b", "a", "b"]})
+
+
+@pytest.fixture
+def batches():
+    """Two consecutive batches for partial_fit tests."""
+    return [pd.DataFrame({"x": [1.0, np.nan, 3.0], "s": ["a", None, "a"]}),
+            pd.DataFrame({"x": [5.0, 7.0, np.nan], "s": ["b", "b", "b"]})]
+
+
 def test_example_scaler(sample_dataframe):
     scaler = ExampleScaler()
     result = scaler.fit_transform(sample_dataframe)
     assert isinstance(result, pd.DataFrame)
-    assert not result.equals(sample_dataframe), "fit_transform should modify the DataFrame."
\ No newline at end of file
+    assert not result.equals(sample_dataframe), "fit_transform should modify the DataFrame."
+
+
+def test_clone_copies_params_not_fitted_state(sample_dataframe):
+    scaler = ExampleScaler(columns=["A"], name="custom").fit(sample_dataframe)
+    clone = scaler.clone()
+    assert isinstance(clone, ExampleScaler)
+    assert clone.get_params() == {"columns": ["A"], "name": "custom", "logging_callback": None}
+    assert not clone.is_fitted and clone.fitted_params == {}
+    assert clone.columns is not scaler.columns
+
+
+def test_output_schema_recorded_at_fit_with_missing_values():
+    """A NaT in the fit data makes the features float, whichever batch is transformed first."""
+    dates = pd.DataFrame({"d": pd.to_datetime(["2024-01-05", "2024-02-10", None])})
+    extractor = DatetimeFeatureExtractor(features=["year", "month"]).fit(dates)
+    assert extractor.output_schema["columns"] == ["d_year", "d_month"]
+    assert list(extractor.transform(dates.iloc[:2]).dtypes) == ["float64", "float64"]
+    assert list(extractor.transform(dates.iloc[2:]).dtypes) == ["float64", "float64"]
+
+
+def test_transform_does_not_modify_fitted_state():
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [4.0, None, 6.0]})
+    imputer = MissingValueHandler(strategy="median").fit(df)
+    state = dict(vars(imputer))
+    imputer.transform(df)
+    imputer.transform(df[["b", "a"]])
+    assert vars(imputer).keys() == state.keys()
+    assert all(vars(imputer)[key] is value for key, value in state.items())
+
+
+def test_output_schema_restores_integer_dtype_and_column_order():
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [4.0, None, 6.0]})
+    imputer = MissingValueHandler(strategy="median")
+    imputer.fit_transform(df)
+    out = imputer.transform(pd.DataFrame({"b": [4.0, None], "a": [1.0, 2.0]}))
+    assert list(out.columns) == ["a", "b"]
+    assert out["a"].dtype == "int64" and out["b"].tolist() == [4.0, 5.0]
+
+
+def test_output_schema_keeps_non_integral_floats():
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [4.0, None, 6.0]})
+    imputer = MissingValueHandler(strategy="median")
+    imputer.fit_transform(df)
+    assert imputer.transform(pd.DataFrame({"a": [1.5], "b": [1.0]}))["a"].dtype == "float64"
+
+
+def test_output_schema_column_mismatch_raises():
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [4.0, None, 6.0]})
+    scaler = ExampleScaler()
+    scaler.fit_transform(df)
+    scaler._output_schema = dict(scaler.output_schema, columns=["a", "c"])
+    with pytest.raises(ColumnMismatchError):
+        scaler.transform(df)
+
+
+@pytest.mark.parametrize("strategy", ["mean", "median", "mode"])
+def test_merge_missing_value_handler_matches_full_fit(partition_df, strategy):
+    # The first partition has no missing 'x', but its values still count towards the fill.
+    with keep_merge_state():
+        merged = BaseTransformer.combine([MissingValueHandler(strategy).fit(partition_df.iloc[[0, 2, 3]]),
+                                          MissingValueHandler(strategy).fit(partition_df.iloc[[1, 4, 5]])])
+    full = MissingValueHandler(strategy).fit(partition_df.iloc[[0, 2, 3, 1, 4, 5]])
+    assert merged.fitted_params["fill_values"] == full.fitted_params["fill_values"]
+
+
+def test_merge_requires_fitted_other(partition_df):
+    with pytest.raises(NotFittedError):
+        MissingValueHandler("mean").fit(partition_df).merge(MissingValueHandler("mean"))
+
+
+def test_merge_requires_same_params_and_class(partition_df):
+    fitted = MissingValueHandler("mean").fit(partition_df)
+    with pytest.raises(ConfigurationError):
+        fitted.merge(MissingValueHandler("median").fit(partition_df))
+    with pytest.raises(ConfigurationError):
+        fitted.merge(Encoder().fit(partition_df))
+
+
+def test_merge_realigns_to_union_of_columns(partition_df):
+    # 's' is only in the second partition, so its fill comes from that partition alone.
+    with keep_merge_state():
+        merged = MissingValueHandler("mode").fit(partition_df.iloc[[0, 1, 3]][["x"]])
+        merged.merge(MissingValueHandler("mode").fit(partition_df.iloc[[2, 4, 5]]))
+    assert merged.required_columns == ["x", "s"]
+    assert merged.fitted_params["fill_values"] == {"x": 1.0, "s": "a"}
+
+
+def test_merge_unsupported_transformer_raises(partition_df):
+    with pytest.raises(ConfigurationError, match="does not support merging"):
+        ExampleScaler().fit(partition_df[["x"]]).merge(ExampleScaler().fit(partition_df[["x"]]))
+
+
+def test_plain_fit_keeps_no_merge_state(partition_df):
+    fitted = MissingValueHandler("median").fit(partition_df)
+    assert fitted._stats is None
+    with pytest.raises(ConfigurationError, match="keep_merge_state"):
+        fitted.merge(MissingValueHandler("median").fit(partition_df))
+
+
+def test_pickle_drops_merge_state_unless_kept(batches):
+    imputer = MissingValueHandler("median")
+    for batch in batches:
+        imputer.partial_fit(batch)
+    assert imputer._stats is not None
+    restored = pickle.loads(pickle.dumps(imputer))
+    assert "_stats" not in restored.__dict__
+    assert restored.transform(batches[0]).equals(imputer.transform(batches[0]))
+    with keep_merge_state():
+        kept = pickle.loads(pickle.dumps(imputer))
+    assert kept._stats is not None
+
+
+def test_partial_fit_missing_value_handler_accumulates(batches):
+    imputer = MissingValueHandler("mean")
+    for batch in batches:
+        imputer.partial_fit(batch)
+    assert imputer.fitted_params["fill_values"] == {"x": 4.0}
+
+
+def test_partial_fit_missing_value_handler_decay(batches):
+    imputer = MissingValueHandler("mean", decay=0.5)
+    for batch in batches:
+        imputer.partial_fit(batch)
+    # sum = 0.5 * 4 + 12, count = 0.5 * 2 + 2
+    assert imputer.fitted_params["fill_values"] == {"x": 14.0 / 3.0}
+
+
+def test_partial_fit_missing_value_handler_window(batches):
+    # Only the last batch is in the window: it has no missing 's', and 5.0 / 7.0 tie.
+    imputer = MissingValueHandler("mode", window=1)
+    for batch in batches:
+        imputer.partial_fit(batch)
+    assert imputer.fitted_params["fill_values"] == {"x": 5.0}
+
+
+def test_partial_fit_unsupported_transformer_raises(batches):
+    with pytest.raises(ConfigurationError, match="does not support merging"):
+        ExampleScaler().partial_fit(batches[0]).partial_fit(batches[1])
+
+
+@pytest.fixture
+def n_jobs_frames():
+    """Numeric (with NaN), categorical and date-string frames wide enough to fit in parallel."""
+    rng = np.random.default_rng(0)
+    numeric = pd.DataFrame(rng.normal(size=(300, 12)), columns=[f"n{i}" for i in range(12)])
+    numeric.iloc[::5, ::2] = np.nan
+    categorical = pd.DataFrame({f"c{i}": rng.choice(list("abcde"), 300) for i in range(8)})
+    dates = pd.DataFrame({f"d{i}": pd.date_range("2024-01-01", periods=300).astype(str) for i in range(4)})
+    dates["text"] = "not a date"
+    return {"numeric": numeric, "categorical": categorical, "missing_categorical": categorical.mask(categorical == "e"),
+            "dates": dates}
+
+
+@pytest.mark.parametrize("make, frame, key", [
+    (lambda **kw: OutlierHandler(**kw), "numeric", "bounds"),
+    (lambda **kw: MissingValueHandler(strategy="median", **kw), "numeric", "fill_values"),
+    (lambda **kw: MissingValueHandler(strategy="mode", **kw), "missing_categorical", "fill_values"),
+    (lambda **kw: Encoder(method="label", **kw), "categorical", "mappings"),
+    (lambda **kw: DatetimeFeatureExtractor(**kw), "dates", "datetime_columns"),
+])
+def test_n_jobs_fit_matches_serial_fit(n_jobs_frames, make, frame, key):
+    df = n_jobs_frames[frame]
+    serial = make().fit(df).fitted_params[key]
+    parallel = make(n_jobs=4).fit(df).fitted_params[key]
+    assert parallel == serial
+    assert list(parallel) == list(serial)
+
+
+@pytest.mark.parametrize("bad", [0, -2, 1.5])
+def test_n_jobs_validation(bad):
+    with pytest.raises(ConfigurationError):
+        OutlierHandler(n_jobs=bad)
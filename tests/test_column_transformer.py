@@ -9,7 +9,8 @@ from transfory.scaler import Scaler
 from transfory.featuregen import FeatureGenerator
 from transfory.insight import InsightReporter
 from transfory.pipeline import Pipeline # To test pipelines within ColumnTransformer
-from transfory.base import NotFittedError
+from transfory.base import ExampleScaler, NotFittedError
+from transfory.exceptions import ConfigurationError
 
 @pytest.fixture
 def sample_df_for_ct():
@@ -216,4 +217,69 @@ def test_column_transformer_empty_columns_for_transformer(sample_df_for_ct):
     assert "skipped sub-transformer 'MissingValueHandler': No columns selected for transformation." in report_summary
     assert 'cat_col1_A' in transformed_df.columns
     assert 'num_col1' not in transformed_df.columns # Dropped by default remainder='drop'
-    assert 'non_existent_col' not in transformed_df.columns # Should not be created
\ No newline at end of file
+    assert 'non_existent_col' not in transformed_df.columns # Should not be created
+
+
+def test_column_transformer_clones_branches_without_fitted_state(sample_df_for_ct):
+    """Branches are rebuilt from constructor params, leaving the user's instances untouched."""
+    num_pipeline = Pipeline([
+        ("impute", MissingValueHandler(strategy="mean")),
+        ("scale", Scaler(method="zscore"))
+    ])
+    num_pipeline.fit(sample_df_for_ct[['num_col1', 'num_col2']])
+    ct = ColumnTransformer(transformers=[("num_pipe", num_pipeline, ['num_col1'])])
+    ct.fit(sample_df_for_ct)
+
+    fitted_branch = ct.fitted_params['processed_transformers'][0][1]
+    assert fitted_branch is not num_pipeline
+    assert fitted_branch.named_steps['scale'] is not num_pipeline.named_steps['scale']
+    assert fitted_branch._last_input_columns == ['num_col1']
+    assert num_pipeline._last_input_columns == ['num_col1', 'num_col2']
+
+
+def test_column_transformer_output_schema_block_dtype(sample_df_for_ct):
+    """Uniform-dtype outputs are written into one preallocated block."""
+    df = sample_df_for_ct[['num_col1', 'num_col2', 'id_col']].astype(float)
+    ct = ColumnTransformer(
+        transformers=[("scale", Scaler(method="minmax"), ['num_col1'])],
+        remainder='passthrough'
+    ).fit(df)
+    expected = pd.concat([Scaler(method="minmax").fit_transform(df[['num_col1']]), df[['num_col2', 'id_col']]], axis=1)
+    pd.testing.assert_frame_equal(ct.transform(df), expected)
+    assert ct.output_schema['columns'] == ['num_col1', 'num_col2', 'id_col']
+    assert ct.output_schema['block_dtype'] == np.float64
+    pd.testing.assert_frame_equal(ct.transform(df), expected)
+
+
+def test_column_transformer_dtype_drift_falls_back(sample_df_for_ct):
+    """An int passthrough column no longer matches the fitted float block; the output is cast back."""
+    df = sample_df_for_ct[['num_col1', 'num_col2', 'id_col']].astype(float)
+    ct = ColumnTransformer(
+        transformers=[("scale", Scaler(method="minmax"), ['num_col1'])],
+        remainder='passthrough'
+    ).fit(df)
+    expected = ct.transform(df)
+    drifted = df.assign(id_col=df['id_col'].astype(int))
+    pd.testing.assert_frame_equal(ct.transform(drifted), expected)
+
+
+def test_column_transformer_partial_fit_matches_fit(sample_df_for_ct):
+    """Branches are updated batch by batch; 'C' only appears in the second batch."""
+    make = lambda: ColumnTransformer(
+        transformers=[
+            ("num", Pipeline([("impute", MissingValueHandler(strategy="mean")), ("scale", Scaler(method="minmax"))]),
+             ['num_col1', 'num_col2']),
+            ("cat", Encoder(method="onehot"), ['cat_col1']),
+        ],
+        remainder='passthrough'
+    )
+    streamed = make().partial_fit(sample_df_for_ct.iloc[:3]).partial_fit(sample_df_for_ct.iloc[3:])
+    expected = make().fit(sample_df_for_ct).transform(sample_df_for_ct)
+    pd.testing.assert_frame_equal(streamed.transform(sample_df_for_ct), expected)
+
+
+def test_column_transformer_partial_fit_rejects_non_updatable_branch(sample_df_for_ct):
+    ct = ColumnTransformer(transformers=[("scale", ExampleScaler(), ['id_col'])])
+    ct.partial_fit(sample_df_for_ct.iloc[:3])
+    with pytest.raises(ConfigurationError, match="cannot be updated"):
+        ct.partial_fit(sample_df_for_ct.iloc[3:])
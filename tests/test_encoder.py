@@ -1,8 +1,11 @@
 import pandas as pd
 import pytest
 import re
+import numpy as np
 
+from transfory.base import keep_merge_state
 from transfory.encoder import Encoder
+from transfory.exceptions import ConfigurationError
 
 @pytest.fixture
 def sample_df():
@@ -72,4 +75,152 @@ def test_label_encoder_error_unseen(sample_df, unseen_df):
     encoder.fit(sample_df)
 
     with pytest.raises(ValueError, match=re.escape("Unseen categories in column 'city': ['Dubai']")):
-        encoder.transform(unseen_df)
\ No newline at end of file
+        encoder.transform(unseen_df)
+
+
+# --- Tests for method='hashing' ---
+
+def test_hashing_encoder_fixed_width_sparse_output(sample_df, unseen_df):
+    """Hashing encoder stores no vocabulary and maps every value into n_features sparse buckets."""
+    encoder = Encoder(method='hashing', n_features=16)
+    encoder.fit(sample_df)
+    assert encoder.fitted_params["mappings"] == {}
+    assert encoder.fitted_params["hashed_columns"] == ['city', 'weather']
+
+    transformed = encoder.transform(sample_df)
+    assert transformed.shape == (4, 32)
+    assert all(isinstance(dtype, pd.SparseDtype) for dtype in transformed.dtypes)
+    city_block = transformed[[f"city_hash_{i}" for i in range(16)]].sparse.to_dense()
+    assert (city_block.sum(axis=1) == 1).all()
+    # Equal values land in the same bucket.
+    assert (city_block.iloc[1] == city_block.iloc[2]).all()
+
+    # Unseen values still map to exactly one bucket, with the same width.
+    unseen_out = encoder.transform(unseen_df)
+    assert unseen_out.shape == (2, 32)
+    assert (unseen_out[[f"city_hash_{i}" for i in range(16)]].sparse.to_dense().sum(axis=1) == 1).all()
+
+
+def test_hashing_encoder_missing_values():
+    """Missing values produce an all-zero row."""
+    df = pd.DataFrame({'url': ['a.com', None, 'b.com']})
+    transformed = Encoder(method='hashing', n_features=4).fit_transform(df)
+    assert transformed.sparse.to_dense().sum(axis=1).tolist() == [1, 0, 1]
+
+
+def test_hashing_encoder_requires_positive_n_features():
+    with pytest.raises(ValueError, match="n_features"):
+        Encoder(method='hashing', n_features=0)
+
+
+# --- Tests for method='frequency' and method='target' ---
+
+def test_frequency_encoder(sample_df, unseen_df):
+    """Frequency encoding replaces categories with their share of the fit rows; unseen -> 0."""
+    encoder = Encoder(method='frequency')
+    transformed = encoder.fit_transform(sample_df)
+    assert transformed['city'].tolist() == [0.25, 0.5, 0.5, 0.25]
+
+    unseen_out = encoder.transform(unseen_df)
+    assert unseen_out['city'].tolist() == [0.5, 0.0]
+
+
+def test_target_encoder_smoothing(sample_df, unseen_df):
+    """Target encoding blends the category mean with the prior using `smoothing`."""
+    y = pd.Series([1.0, 0.0, 1.0, 0.0])
+    encoder = Encoder(method='target', smoothing=2.0, cv=1)
+    encoder.fit(sample_df, y)
+
+    prior = 0.5
+    assert encoder.fitted_params['target_prior'] == prior
+    # London: sum=1, count=2 -> (1 + 2*0.5) / (2 + 2)
+    assert encoder.fitted_params['mappings']['city']['London'] == pytest.approx(0.5)
+    # New York: sum=1, count=1 -> (1 + 1) / 3
+    assert encoder.fitted_params['mappings']['city']['New York'] == pytest.approx(2 / 3)
+
+    unseen_out = encoder.transform(unseen_df)
+    assert unseen_out['city'].tolist() == pytest.approx([0.5, prior])
+
+
+def test_target_encoder_out_of_fold_fit_transform():
+    """fit_transform uses out-of-fold statistics; transform uses the full-data mapping."""
+    df = pd.DataFrame({'cat': ['a', 'a', 'b', 'b']})
+    y = pd.Series([1.0, 0.0, 1.0, 1.0])
+    encoder = Encoder(method='target', smoothing=0.0, cv=4, random_state=0)  # leave-one-out
+
+    oof = encoder.fit_transform(df, y)
+    # Each row sees only the other row of its category.
+    assert oof['cat'].tolist() == pytest.approx([0.0, 1.0, 1.0, 1.0])
+
+    full = encoder.transform(df)
+    assert full['cat'].tolist() == pytest.approx([0.5, 0.5, 1.0, 1.0])
+
+
+def test_target_encoder_requires_y(sample_df):
+    with pytest.raises(ValueError, match="requires `y`"):
+        Encoder(method='target').fit(sample_df)
+
+
+@pytest.fixture
+def rare_df():
+    return pd.DataFrame({'city': ['A'] * 5 + ['B'] * 3 + ['C', 'D']})
+
+
+def test_rare_categories_folded_into_other(rare_df):
+    encoder = Encoder(method="onehot", min_frequency=2)
+    out = encoder.fit_transform(rare_df)
+    assert list(out.columns) == ['city_A', 'city_B', 'city___other__']
+    assert out['city___other__'].tolist() == [0] * 8 + [1, 1]
+
+
+def test_unseen_categories_share_other_bucket(rare_df):
+    """Unseen values share the '__other__' bucket instead of being errors."""
+    strict = Encoder(method="label", max_categories=2, handle_unseen="error").fit(rare_df)
+    assert strict.fitted_params['mappings']['city'] == {'A': 0, '__other__': 1}
+    assert strict.transform(pd.DataFrame({'city': ['A', 'C', 'Z', None]}))['city'].tolist() == [0, 1, 1, -1]
+
+
+def test_rare_categories_with_frequency_encoding():
+    df = pd.DataFrame({'city': ['A', 'A', 'A', 'B', 'C', 'D']})
+    freq = Encoder(method="frequency", min_frequency=0.3).fit(df)
+    assert freq.fitted_params['mappings']['city'] == pytest.approx({'A': 0.5, '__other__': 0.5})
+
+
+def test_rare_categories_with_target_encoding():
+    df = pd.DataFrame({'city': ['A', 'A', 'A', 'B', 'C', 'D']})
+    target = Encoder(method="target", max_categories=2, smoothing=0.0).fit(df, [1, 1, 1, 0, 0, 1])
+    assert target.fitted_params['mappings']['city'] == pytest.approx({'A': 1.0, '__other__': 1 / 3})
+
+
+def test_max_categories_folds_nothing_when_all_fit():
+    df = pd.DataFrame({'city': ['A', 'A', 'A', 'B', 'C', 'D']})
+    assert Encoder(method="label", max_categories=4).fit(df).fitted_params['mappings']['city'] == {'A': 0, 'B': 1, 'C': 2, 'D': 3}
+
+
+@pytest.mark.parametrize("params", [{"method": "hashing", "min_frequency": 2}, {"max_categories": 0}])
+def test_rare_category_options_validation(params):
+    with pytest.raises(ConfigurationError):
+        Encoder(**params)
+
+
+@pytest.mark.parametrize("params", [
+    {"method": "label"},
+    {"method": "onehot"},
+    {"method": "frequency"},
+    {"method": "target"},
+    {"method": "label", "max_categories": 3},
+])
+def test_encoder_merge_partitions_matches_full_fit(params):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"city": rng.choice(list("abcdef"), 600, p=[.4, .2, .2, .1, .07, .03])})
+    y = rng.normal(size=600)
+
+    with keep_merge_state():
+        first = Encoder(**params).fit(df.iloc[:250], y[:250])
+        first.merge(Encoder(**params).fit(df.iloc[250:], y[250:]))
+    full = Encoder(**params).fit(df, y)
+    merged_map, full_map = first.fitted_params["mappings"]["city"], full.fitted_params["mappings"]["city"]
+    if params["method"] in ("frequency", "target"):
+        pd.testing.assert_series_equal(pd.Series(merged_map).sort_index(), pd.Series(full_map).sort_index())
+    else:
+        assert merged_map == full_map
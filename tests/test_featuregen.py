@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from transfory.featuregen import FeatureGenerator
+from transfory.lazyframe import LazyFeatureFrame
+from transfory.pipeline import Pipeline
+from transfory.scaler import Scaler
+from transfory.exceptions import ConfigurationError
+
+
+@pytest.fixture
+def numeric_df():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "a": rng.normal(size=200),
+        "b": rng.normal(size=200),
+        "c": rng.normal(size=200) * 10,
+        "d": rng.normal(size=200),
+    })
+
+
+def test_default_features(numeric_df):
+    out = FeatureGenerator().fit_transform(numeric_df)
+    assert "a^2" in out.columns and "a_x_b" in out.columns
+    assert out.shape[1] == 4 + 4 + 6
+    np.testing.assert_allclose(out["b_x_c"], numeric_df["b"] * numeric_df["c"])
+
+
+def test_interaction_only(numeric_df):
+    out = FeatureGenerator(interaction_only=True).fit_transform(numeric_df)
+    assert not any("^" in c for c in out.columns)
+    assert sum("_x_" in c for c in out.columns) == 6
+
+
+def test_explicit_pairs(numeric_df):
+    out = FeatureGenerator(degree=1, pairs=[("a", "d")]).fit_transform(numeric_df)
+    assert list(out.columns) == ["a", "b", "c", "d", "a_x_d"]
+
+
+def test_explicit_pairs_must_be_numeric_columns(numeric_df):
+    with pytest.raises(ConfigurationError):
+        FeatureGenerator(pairs=[("a", "missing")]).fit(numeric_df)
+
+
+def test_screening_keeps_top_correlated_features(numeric_df):
+    y = numeric_df["a"] * numeric_df["d"] + 0.01 * numeric_df["b"]
+    gen = FeatureGenerator(max_features=1, sample_size=100, random_state=0).fit(numeric_df, y)
+    assert list(gen.fitted_params["feature_scores"]) == ["a_x_d"]
+    assert list(gen.transform(numeric_df).columns) == ["a", "b", "c", "d", "a_x_d"]
+
+
+def test_correlation_screening_with_large_means(numeric_df):
+    shifted = numeric_df + 1e8
+    y = numeric_df["a"] + 0.5 * numeric_df["b"]
+    gen = FeatureGenerator(degree=1, pairs=[("a", "b"), ("c", "d")], max_features=1).fit(shifted, y)
+    expected = np.corrcoef(shifted["a"] * shifted["b"], y)[0, 1]
+    np.testing.assert_allclose(gen.fitted_params["feature_scores"]["a_x_b"], abs(expected), rtol=1e-6)
+
+
+def test_screening_by_variance_without_y(numeric_df):
+    # The highest-variance candidates win ('c' is 10x wider).
+    gen = FeatureGenerator(max_features=2).fit(numeric_df)
+    kept = list(gen.fitted_params["feature_scores"])
+    assert kept[0] == "c^2" and kept[1] in {"a_x_c", "b_x_c", "c_x_d"}
+
+
+def test_correlation_screening_requires_y(numeric_df):
+    with pytest.raises(ConfigurationError):
+        FeatureGenerator(max_features=1, screening="correlation").fit(numeric_df)
+
+
+def test_max_features_must_be_positive():
+    with pytest.raises(ConfigurationError):
+        FeatureGenerator(max_features=0)
+
+
+def test_lazy_mode_matches_eager(numeric_df):
+    eager = FeatureGenerator().fit_transform(numeric_df)
+    lazy = FeatureGenerator(lazy=True).fit(numeric_df).transform(numeric_df)
+    assert isinstance(lazy, LazyFeatureFrame)
+    assert list(lazy.columns) == list(eager.columns) and lazy.shape == eager.shape
+    pd.testing.assert_series_equal(lazy["a_x_b"], eager["a_x_b"])
+    pd.testing.assert_frame_equal(lazy.to_pandas(), eager)
+
+
+def test_lazy_mode_iter_batches(numeric_df):
+    eager = FeatureGenerator().fit_transform(numeric_df)
+    lazy = FeatureGenerator(lazy=True).fit(numeric_df).transform(numeric_df)
+    batches = list(lazy.iter_batches(batch_size=64, columns=["a", "c^2"]))
+    assert [len(b) for b in batches] == [64, 64, 64, 8]
+    pd.testing.assert_frame_equal(pd.concat(batches), eager[["a", "c^2"]])
+
+
+def test_lazy_pipeline_fit_transform_records_schema_without_computing(numeric_df, monkeypatch):
+    materialized = []
+    to_pandas = LazyFeatureFrame.to_pandas
+    monkeypatch.setattr(LazyFeatureFrame, "to_pandas", lambda self, *a, **kw: materialized.append(1) or to_pandas(self, *a, **kw))
+    pipe = Pipeline([("features", FeatureGenerator(lazy=True))])
+    out = pipe.fit_transform(numeric_df)
+    assert isinstance(out, LazyFeatureFrame) and materialized == []
+    assert pipe.output_schema["columns"] == list(out.columns)
+
+
+def test_lazy_output_is_materialized_downstream(numeric_df):
+    lazy = FeatureGenerator(lazy=True).fit(numeric_df).transform(numeric_df)
+    scaled = Scaler().fit(lazy).transform(lazy)
+    assert isinstance(scaled, pd.DataFrame) and scaled.shape == lazy.shape
@@ -0,0 +1,116 @@
+import pytest
+import pandas as pd
+import numpy as np
+
+from transfory.memory import MemoryOptimizer
+from transfory.missing import MissingValueHandler
+from transfory.encoder import Encoder
+from transfory.pipeline import Pipeline
+from transfory.exceptions import ConfigurationError
+
+
+@pytest.fixture
+def wide_df():
+    """DataFrame whose columns are all stored wider than needed."""
+    rng = np.random.default_rng(0)
+    n = 200
+    return pd.DataFrame({
+        "small": rng.integers(0, 100, n),
+        "medium": rng.integers(-40000, 40000, n),
+        "unsigned": rng.integers(0, 300, n).astype(np.uint64),
+        "quarters": rng.integers(0, 40, n) / 4,  # exactly representable in float32
+        "noise": rng.normal(size=n),
+        "city": pd.Series(rng.choice(["Paris", "Oslo", "Rome"], n), dtype=object),
+        "user": pd.Series([f"user{i}" for i in range(n)], dtype=object),
+        "flag": rng.random(n) > 0.5,
+    })
+
+
+def test_memory_optimizer_narrows_dtypes(wide_df):
+    optimizer = MemoryOptimizer()
+    out = optimizer.fit_transform(wide_df)
+
+    assert out["small"].dtype == np.int8
+    assert out["medium"].dtype == np.int32
+    assert out["unsigned"].dtype == np.uint16
+    assert out["quarters"].dtype == np.float32
+    assert out["noise"].dtype == np.float64  # float32 would round it
+    assert isinstance(out["city"].dtype, pd.CategoricalDtype)
+    assert out["user"].dtype == pd.StringDtype("pyarrow")
+    assert out["flag"].dtype == bool
+    assert set(optimizer.fitted_params["dtypes"]) == {"small", "medium", "unsigned", "quarters", "city", "user"}
+
+    # No value changes, and memory drops.
+    for col in wide_df.columns:
+        assert (out[col].astype(object) == wide_df[col].astype(object)).all()
+    assert out.memory_usage(deep=True).sum() < wide_df.memory_usage(deep=True).sum() / 2
+
+    # With a tolerance, float32 rounding is accepted.
+    assert MemoryOptimizer(float_rtol=1e-6).fit_transform(wide_df)["noise"].dtype == np.float32
+
+
+def test_memory_optimizer_never_loses_values(wide_df):
+    """Out-of-range integers keep their dtype and unseen strings become new categories."""
+    optimizer = MemoryOptimizer().fit(wide_df)
+    batch = wide_df.head(3).copy()
+    batch.loc[0, "small"] = 1000
+    batch.loc[1, "city"] = "Lima"
+
+    out = optimizer.transform(batch)
+    assert out["small"].dtype == np.int64
+    assert out["small"].tolist() == batch["small"].tolist()
+    assert out["city"].tolist() == batch["city"].tolist()
+    assert out["city"].cat.categories[-1] == "Lima"
+
+
+@pytest.mark.parametrize("values", [[np.nan], [1.7, 2.5]])
+def test_memory_optimizer_leaves_retyped_columns_alone(values):
+    """An integer column that arrives as floats (with NaN or fractions) is not cast."""
+    optimizer = MemoryOptimizer().fit(pd.DataFrame({"n": [1, 2, 3]}))
+    out = optimizer.transform(pd.DataFrame({"n": values}))
+    assert out["n"].dtype == np.float64
+    np.testing.assert_array_equal(out["n"].to_numpy(), values)
+
+
+def test_memory_optimizer_partial_fit_matches_fit(wide_df):
+    streamed = MemoryOptimizer()
+    for start in range(0, len(wide_df), 50):
+        streamed.partial_fit(wide_df.iloc[start:start + 50])
+    assert streamed.fitted_params == MemoryOptimizer().fit(wide_df).fitted_params
+
+
+def test_memory_optimizer_first_pipeline_step(wide_df):
+    df = wide_df.drop(columns="user")
+    df.loc[::7, "city"] = np.nan
+    pipe = Pipeline([
+        ("memory", MemoryOptimizer()),
+        ("imputer", MissingValueHandler(strategy="mode")),
+        ("encoder", Encoder(method="onehot")),
+    ])
+    out = pipe.fit_transform(df)
+    reference = Pipeline([
+        ("imputer", MissingValueHandler(strategy="mode")),
+        ("encoder", Encoder(method="onehot")),
+    ]).fit_transform(df)
+    assert sorted(out.columns) == sorted(reference.columns)
+    assert out["small"].dtype == np.int8
+
+
+def test_memory_optimizer_validates_options():
+    with pytest.raises(ConfigurationError):
+        MemoryOptimizer(category_ratio=2)
+    with pytest.raises(ConfigurationError):
+        MemoryOptimizer(float_rtol=-1)
+
+
+def test_memory_optimizer_then_constant_imputer():
+    """The constant fill value is added to the categories of a column cast to `category`."""
+    df = pd.DataFrame({"city": ["Paris", "Oslo", None, "Paris", "Oslo", "Paris"], "n": range(6)})
+    pipe = Pipeline([
+        ("memory", MemoryOptimizer()),
+        ("imputer", MissingValueHandler(strategy="constant", fill_value="unknown")),
+    ])
+    out = pipe.fit_transform(df)
+    assert isinstance(out["city"].dtype, pd.CategoricalDtype)
+    assert out["city"].tolist() == ["Paris", "Oslo", "unknown", "Paris", "Oslo", "Paris"]
+    assert pipe.transform(df.iloc[2:3])["city"].tolist() == ["unknown"]
@@ -2,7 +2,9 @@ import pytest
 import pandas as pd
 import numpy as np
 
+from transfory.base import keep_merge_state
 from transfory.outlier import OutlierHandler
+from transfory.sketch import QuantileSketch
 from transfory.pipeline import Pipeline
 from transfory.insight import InsightReporter
 
@@ -61,4 +63,54 @@ def test_outlier_handler_in_pipeline_with_reporter(sample_df_with_outliers):
     # Check for the specific, user-friendly text from the InsightReporter
     assert "learned capping bounds using 'iqr' for 2 column(s)" in report_summary
     assert "will be capped between" in report_summary
-    assert "applied capping to 2 column(s)" in report_summary
\ No newline at end of file
+    assert "applied capping to 2 column(s)" in report_summary
+
+@pytest.fixture
+def large_df():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({"a": rng.normal(size=20000), "b": rng.integers(0, 100, 20000)})
+
+
+def test_outlier_combine_partitions_exact_below_sketch_size(large_df):
+    small = [large_df.iloc[:400], large_df.iloc[400:1000]]
+    with keep_merge_state():
+        merged = OutlierHandler.combine([OutlierHandler().fit(p) for p in small])
+    full = OutlierHandler().fit(large_df.iloc[:1000])
+    for col in ("a", "b"):
+        np.testing.assert_allclose(merged.fitted_params["bounds"][col], full.fitted_params["bounds"][col])
+
+
+def test_outlier_combine_partitions_within_rank_error(large_df):
+    parts = (large_df.iloc[i:i + 4000] for i in range(0, len(large_df), 4000))
+    with keep_merge_state():
+        merged = OutlierHandler.combine([OutlierHandler(method="percentile").fit(p) for p in parts])
+    lower, upper = merged.fitted_params["bounds"]["a"]
+    assert abs((large_df["a"] < lower).mean() - 0.01) < 0.002
+    assert abs((large_df["a"] > upper).mean() - 0.01) < 0.002
+
+
+def test_quantile_sketch_ignores_nan():
+    sketch = QuantileSketch.from_values([3.0, np.nan, 1.0, 2.0])
+    assert sketch.count == 3 and sketch.quantile(0.5) == 2.0
+
+
+@pytest.fixture
+def drifting_batches():
+    rng = np.random.default_rng(0)
+    return [pd.DataFrame({"a": rng.normal(10 * i, 1, 500)}) for i in range(4)]
+
+
+def test_outlier_partial_fit_window(drifting_batches):
+    windowed = OutlierHandler(window=1)
+    for batch in drifting_batches:
+        windowed.partial_fit(batch)
+    assert windowed.fitted_params["bounds"] == OutlierHandler().fit(drifting_batches[-1]).fitted_params["bounds"]
+
+
+def test_outlier_partial_fit_decay_tracks_drift(drifting_batches):
+    decayed = OutlierHandler(decay=0.1)
+    for batch in drifting_batches:
+        decayed.partial_fit(batch)
+    lower, upper = decayed.fitted_params["bounds"]["a"]
+    # Older batches barely count, so the bounds sit around the latest batch.
+    assert 20 < lower < 30 < upper < 40
@@ -1,11 +1,25 @@
 import pytest
 import pandas as pd
+import numpy as np
 import os
+import asyncio
+import runpy
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from transfory.base import ExampleScaler
 from transfory.pipeline import Pipeline
 from transfory.insight import InsightReporter
 from transfory.base import NotFittedError, FrozenTransformerError
+from transfory.checkpoint import load_checkpoint
+from transfory.column_transformer import ColumnTransformer
+from transfory.encoder import Encoder
+from transfory.exceptions import ColumnMismatchError, ConfigurationError, PipelineProcessingError
+from transfory.featuregen import FeatureGenerator
+from transfory.fileio import read_csv
+from transfory.missing import MissingValueHandler
+from transfory.outlier import OutlierHandler
+from transfory.scaler import Scaler
 
 @pytest.fixture
 def sample_dataframe():
@@ -117,3 +131,348 @@ def test_pipeline_with_insight_reporter(sample_dataframe):
     # The pipeline itself logs fit_start/end and transform_step/done for each step
     assert len(reporter._logs) > 0
     assert "Pipeline" in reporter.summary()
+
+
+def test_pipeline_to_numpy_function_matches_transform(tmp_path):
+    """The exported NumPy function reproduces Pipeline.transform without pandas."""
+    df = pd.DataFrame({
+        "age": [20, 25, 30, np.nan, 22, 90],
+        "city": ["Manila", "Cebu", "Manila", "Davao", None, "Cebu"],
+    })
+    pipe = Pipeline([
+        ("imputer", MissingValueHandler(strategy="median")),
+        ("encoder", Encoder(method="onehot")),
+        ("outlier", OutlierHandler()),
+        ("scaler", Scaler(method="zscore")),
+    ])
+    expected = pipe.fit_transform(df)
+
+    path = os.path.join(tmp_path, "exported.py")
+    fn = pipe.to_numpy_function(path=path)
+    assert "pandas" not in fn.source
+    assert fn.output_columns == list(expected.columns)
+
+    result = fn({col: df[col].to_numpy() for col in df.columns})
+    for col in expected.columns:
+        np.testing.assert_allclose(result[col].astype(float), expected[col].to_numpy(dtype=float))
+
+    module = runpy.run_path(path)
+    arr = module["transform"](df.to_numpy(dtype=object))
+    np.testing.assert_allclose(arr.astype(float), expected.to_numpy(dtype=float))
+
+
+def test_pipeline_to_numpy_function_unsupported_step(sample_dataframe):
+    """Steps without a NumPy implementation raise a ConfigurationError."""
+    pipe = Pipeline([("scaler", ExampleScaler())])
+    pipe.fit(sample_dataframe)
+    with pytest.raises(ConfigurationError, match="does not support export"):
+        pipe.to_numpy_function()
+
+
+@pytest.fixture
+def wide_df():
+    return pd.DataFrame({f"c{i}": np.arange(5, dtype=float) * i for i in range(10)})
+
+
+@pytest.fixture
+def pruning_pipeline(wide_df):
+    """A leading ColumnTransformer with remainder='drop' limits what the pipeline reads."""
+    return Pipeline([
+        ("select", ColumnTransformer([("impute", MissingValueHandler(strategy="mean"), ["c1", "c3"])], remainder="drop")),
+        ("scaler", Scaler()),
+    ]).fit(wide_df)
+
+
+def test_pipeline_required_columns_prunes_input(pruning_pipeline, wide_df):
+    assert pruning_pipeline.required_columns == ["c1", "c3"]
+    assert Pipeline([("scaler", Scaler())]).fit(wide_df).required_columns == list(wide_df.columns)
+
+
+def test_pipeline_unread_columns_may_be_missing(pruning_pipeline, wide_df):
+    expected = pruning_pipeline.transform(wide_df)
+    pd.testing.assert_frame_equal(pruning_pipeline.transform(wide_df[["c3", "c1"]]), expected)
+    with pytest.raises((PipelineProcessingError, ColumnMismatchError)):
+        pruning_pipeline.transform(wide_df[["c1"]])
+
+
+def test_read_csv_loads_only_required_columns(pruning_pipeline, wide_df, tmp_path):
+    path = os.path.join(tmp_path, "wide.csv")
+    wide_df.to_csv(path, index=False)
+    pruned = read_csv(path, transformer=pruning_pipeline)
+    assert list(pruned.columns) == ["c1", "c3"]
+    pd.testing.assert_frame_equal(pruning_pipeline.transform(pruned), pruning_pipeline.transform(wide_df))
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "csv"])
+def test_pipeline_transform_file_matches_transform(tmp_path, fmt):
+    """Batched file transforms keep one output schema across batches."""
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame({
+        "age": [20.0, np.nan, 31.0, 45.0, 28.0, 52.0, 39.0],
+        "city": ["Manila", "Cebu", "Manila", "Davao", "Cebu", "Manila", "Manila"],
+    })
+    pipe = Pipeline([
+        ("imputer", MissingValueHandler(strategy="mean")),
+        ("encoder", Encoder(method="onehot")),
+        ("scaler", Scaler()),
+    ]).fit(df)
+    expected = pipe.transform(df)
+
+    src = os.path.join(tmp_path, f"in.{fmt}")
+    dst = os.path.join(tmp_path, f"out.{fmt}")
+    df.to_parquet(src) if fmt == "parquet" else df.to_csv(src, index=False)
+
+    # Batches of 2 rows: the last batch only contains 'Manila'.
+    report = pipe.transform_file(src, dst, format=fmt, batch_size=2)
+    assert report == {"n_rows": 7, "n_batches": 4, "columns": list(expected.columns)}
+
+    result = pd.read_parquet(dst) if fmt == "parquet" else pd.read_csv(dst)
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_pipeline_transform_file_requires_fit():
+    with pytest.raises(NotFittedError):
+        Pipeline([("scaler", ExampleScaler())]).transform_file("in.csv", "out.csv", format="csv")
+
+
+def test_pipeline_transform_file_rejects_unknown_format(sample_dataframe):
+    pipe = Pipeline([("scaler", ExampleScaler())]).fit(sample_dataframe)
+    with pytest.raises(ConfigurationError):
+        pipe.transform_file("in.json", "out.json", format="json")
+
+
+def test_pipeline_transform_file_read_error_leaves_no_output(tmp_path, sample_dataframe):
+    """Read errors on the prefetch thread surface in the caller and leave no partial output."""
+    pipe = Pipeline([("scaler", ExampleScaler())]).fit(sample_dataframe)
+    dst = os.path.join(tmp_path, "out.csv")
+    with pytest.raises(FileNotFoundError):
+        pipe.transform_file(os.path.join(tmp_path, "missing.csv"), dst, format="csv")
+    assert not os.path.exists(dst)
+
+
+def test_pipeline_float32_dtype_propagates_to_numeric_steps():
+    df = pd.DataFrame({"a": [1.0, 2.0, np.nan, 40.0], "b": [1, 2, 3, 4], "c": ["x", "y", "x", "y"]})
+    pipe = Pipeline([
+        ("imputer", MissingValueHandler(strategy="mean")),
+        ("encoder", Encoder(method="onehot")),
+        ("outlier", OutlierHandler(dtype="float64")),  # an explicit step dtype wins
+        ("features", FeatureGenerator(include_interactions=False)),
+        ("scaler", Scaler(method="zscore")),
+    ], dtype=np.float32)
+    assert pipe.named_steps["imputer"].dtype == np.float32
+    assert pipe.named_steps["outlier"].dtype == "float64"
+
+    out = pipe.fit_transform(df)
+    assert set(out.dtypes) == {np.dtype(np.float32)}
+    assert set(pipe.transform(df).dtypes) == {np.dtype(np.float32)}
+    assert isinstance(pipe.named_steps["imputer"].fitted_params["fill_values"]["a"], np.float32)
+    assert isinstance(pipe.named_steps["outlier"].fitted_params["bounds"]["a"][0], float)
+
+
+def test_pipeline_concurrent_transform_is_side_effect_free():
+    """One fitted pipeline serves many threads: identical results, per-call log routing, untouched steps."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "x": rng.normal(size=400),
+        "y": np.where(rng.random(400) < 0.1, np.nan, rng.normal(size=400)),
+        "cat": rng.choice(["a", "b", "c"], size=400),
+    })
+    events = []
+    lock = threading.Lock()
+
+    def callback(step_name, payload):
+        with lock:
+            events.append((threading.get_ident(), step_name))
+
+    pipe = Pipeline([
+        ("impute", MissingValueHandler(strategy="mean")),
+        ("ct", ColumnTransformer([
+            ("num", Scaler(), ["x", "y"]),
+            ("cat", Encoder(method="onehot"), ["cat"]),
+        ])),
+    ], logging_callback=callback)
+    pipe.fit(df)
+    batches = [df.iloc[i:i + 20] for i in range(0, len(df), 20)]
+    expected = [pipe.transform(b) for b in batches]
+    events.clear()
+
+    def run(i):
+        return i % len(batches), pipe.transform(batches[i % len(batches)])
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(run, range(400)))
+
+    for i, out in results:
+        pd.testing.assert_frame_equal(out, expected[i])
+    # Every step's events reached the pipeline callback with nested step names.
+    assert any(name.startswith("ct::num::") for _, name in events)
+    # Fitted steps were not modified by routing.
+    assert all(t._logging_callback is None for _, t in pipe.steps)
+    for _, fitted, _ in pipe.named_steps["ct"].fitted_params["processed_transformers"]:
+        assert fitted._logging_callback is None
+
+
+@pytest.fixture
+def stream_df():
+    return pd.DataFrame({"a": np.arange(100.0), "b": np.arange(100.0) ** 0.5})
+
+
+@pytest.fixture
+def stream_pipeline(stream_df):
+    return Pipeline([("scale", Scaler()), ("gen", FeatureGenerator())]).fit(stream_df)
+
+
+def test_pipeline_atransform_matches_transform(stream_pipeline, stream_df):
+    pd.testing.assert_frame_equal(asyncio.run(stream_pipeline.atransform(stream_df)), stream_pipeline.transform(stream_df))
+
+
+def test_pipeline_atransform_stream_from_async_iterable(stream_pipeline, stream_df):
+    chunks = [stream_df.iloc[i:i + 16] for i in range(0, len(stream_df), 16)]
+
+    async def agen():
+        for chunk in chunks:
+            await asyncio.sleep(0)
+            yield chunk
+
+    async def run():
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            return [out async for out in stream_pipeline.atransform_stream(agen(), executor=pool, max_pending=3)]
+
+    outs = asyncio.run(run())
+    assert len(outs) == len(chunks)
+    pd.testing.assert_frame_equal(pd.concat(outs), stream_pipeline.transform(stream_df))
+
+
+def test_pipeline_atransform_stream_from_plain_iterable(stream_pipeline, stream_df):
+    chunks = [stream_df.iloc[i:i + 16] for i in range(0, len(stream_df), 16)]
+
+    async def run():
+        return [out async for out in stream_pipeline.atransform_stream(iter(chunks))]
+
+    outs = asyncio.run(run())
+    assert len(outs) == len(chunks)
+    pd.testing.assert_frame_equal(pd.concat(outs), stream_pipeline.transform(stream_df))
+
+
+def test_pipeline_atransform_requires_fit(stream_df):
+    with pytest.raises(NotFittedError):
+        asyncio.run(Pipeline([("scale", Scaler())]).atransform(stream_df))
+
+
+@pytest.fixture
+def clip_pipeline_chunks():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"a": rng.normal(size=500), "b": rng.normal(size=500)})
+    pipe = Pipeline([("clip", OutlierHandler()), ("scale", Scaler())]).fit(df)
+    return pipe, df, [df.iloc[i:i + 50] for i in range(0, len(df), 50)]
+
+
+def test_pipeline_transform_stream_matches_transform(clip_pipeline_chunks):
+    pipe, _, chunks = clip_pipeline_chunks
+    outs = list(pipe.transform_stream(iter(chunks), queue_size=2))
+    assert len(outs) == len(chunks)
+    for chunk, out in zip(chunks, outs):
+        pd.testing.assert_frame_equal(out, pipe.transform(chunk))
+
+
+def test_pipeline_transform_stream_keeps_polars_type(clip_pipeline_chunks):
+    pl = pytest.importorskip("polars")
+    pipe, _, chunks = clip_pipeline_chunks
+    polars_outs = list(pipe.transform_stream(pl.from_pandas(c) for c in chunks))
+    assert isinstance(polars_outs[0], pl.DataFrame)
+
+
+def test_pipeline_transform_stream_stops_threads_on_close_and_errors(clip_pipeline_chunks):
+    pipe, df, chunks = clip_pipeline_chunks
+    n_threads = threading.active_count()
+    stream = pipe.transform_stream(iter(chunks))
+    next(stream)
+    stream.close()
+    with pytest.raises(ColumnMismatchError):
+        list(pipe.transform_stream([chunks[0], df[["a"]]]))
+    with pytest.raises(PipelineProcessingError, match="step 'clip'"):
+        list(pipe.transform_stream([chunks[0], chunks[1].assign(a="x")]))
+    assert threading.active_count() == n_threads
+
+
+@pytest.fixture
+def missing_chunks():
+    rng = np.random.default_rng(0)
+    chunks = []
+    for i in range(6):
+        df = pd.DataFrame({"A": rng.normal(i, 1, 50), "B": rng.normal(0, i + 1, 50)})
+        df.loc[df.sample(5, random_state=i).index, "A"] = np.nan
+        chunks.append(df)
+    return chunks
+
+
+def _imputer_scaler(logging_callback=None):
+    return Pipeline([("imputer", MissingValueHandler("mean")), ("scaler", Scaler("zscore"))],
+                    logging_callback=logging_callback)
+
+
+def _interrupted(chunks, at):
+    for i, chunk in enumerate(chunks):
+        if i == at:
+            raise RuntimeError("pre-empted")
+        yield chunk
+
+
+def test_pipeline_fit_stream_writes_checkpoint_offset(missing_chunks, tmp_path):
+    path = str(tmp_path / "ckpt" / "pipe.joblib")
+    with pytest.raises(RuntimeError):
+        _imputer_scaler().fit_stream(_interrupted(missing_chunks, 4), checkpoint=path, checkpoint_every=2)
+    assert load_checkpoint(path).offset == 4
+
+
+def test_pipeline_fit_stream_resumes_from_checkpoint(missing_chunks, tmp_path):
+    """A stream fit interrupted after a checkpoint resumes to the same state as an uninterrupted one."""
+    path = str(tmp_path / "pipe.joblib")
+    with pytest.raises(RuntimeError):
+        _imputer_scaler().fit_stream(_interrupted(missing_chunks, 4), checkpoint=path, checkpoint_every=2)
+
+    events = []
+    resumed = _imputer_scaler(lambda step, payload: events.append((step, payload["event"])))
+    resumed.fit_stream(missing_chunks, checkpoint=path, resume_from=path)
+    assert load_checkpoint(path).offset == 6
+    assert events.count(("Pipeline", "partial_fit")) == 2  # only the chunks after the checkpoint
+
+    full = _imputer_scaler().fit_stream(missing_chunks)
+    probe = pd.concat(missing_chunks)
+    pd.testing.assert_frame_equal(resumed.transform(probe), full.transform(probe))
+
+
+def test_pipeline_fit_stream_rejects_mismatched_checkpoint(missing_chunks, tmp_path):
+    path = str(tmp_path / "pipe.joblib")
+    _imputer_scaler().fit_stream(missing_chunks[:2], checkpoint=path)
+    with pytest.raises(ConfigurationError):
+        Pipeline([("scaler", Scaler("zscore"))]).fit_stream(missing_chunks, resume_from=path)
+
+
+@pytest.fixture
+def category_chunks():
+    """Two chunks; the second brings a new category 'c'."""
+    return [pd.DataFrame({"c": ["a", "b", "a"], "x": [1.0, 2.0, 3.0]}),
+            pd.DataFrame({"c": ["c", "a", "c"], "x": [4.0, 5.0, 6.0]})]
+
+
+def test_pipeline_fit_stream_absorbs_new_onehot_columns(category_chunks):
+    make = lambda: Pipeline([("enc", Encoder(method="onehot")), ("scale", Scaler("minmax"))])
+    streamed = make().fit_stream(category_chunks)
+    full = pd.concat(category_chunks, ignore_index=True)
+    assert list(streamed.transform(full).columns) == ["x", "c_a", "c_b", "c_c"]
+    pd.testing.assert_frame_equal(streamed.transform(full), make().fit(full).transform(full))
+
+
+def test_pipeline_fit_stream_updates_column_transformer_step(category_chunks):
+    make = lambda: Pipeline([("ct", ColumnTransformer([("num", Scaler("minmax"), ["x"]),
+                                                       ("cat", Encoder(method="label"), ["c"])]))])
+    streamed = make().fit_stream(category_chunks)
+    full = pd.concat(category_chunks, ignore_index=True)
+    pd.testing.assert_frame_equal(streamed.transform(full), make().fit(full).transform(full))
+
+
+def test_pipeline_partial_fit_rejects_non_updatable_step(category_chunks):
+    pipe = Pipeline([("scale", ExampleScaler())]).partial_fit(category_chunks[0][["x"]])
+    with pytest.raises(PipelineProcessingError, match="cannot be updated"):
+        pipe.partial_fit(category_chunks[1][["x"]])
@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from transfory import profiling
+from transfory.pipeline import Pipeline
+from transfory.missing import MissingValueHandler
+from transfory.encoder import Encoder
+from transfory.outlier import OutlierHandler
+from transfory.scaler import Scaler
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "a": rng.normal(size=300),
+        "b": rng.integers(0, 10, size=300),
+        "c": np.r_[np.nan, rng.normal(size=299) * 5],
+        "cat": rng.choice(["x", "y", "z"], size=300),
+    })
+
+
+def test_profile_matches_pandas(df):
+    prof = profiling.profile(df)
+    assert prof.null_count("c") == 1
+    assert prof.kind("a") == "numeric" and prof.kind("cat") == "categorical"
+    assert prof.n_unique("cat") == 3
+    np.testing.assert_allclose(prof.mean("c"), df["c"].mean())
+    np.testing.assert_allclose(prof.var("c", ddof=1), df["c"].var())
+    assert prof.min("b") == df["b"].min() and prof.max("b") == df["b"].max()
+    assert prof.median("c") == df["c"].median()
+    for interpolation in ("linear", "lower", "higher", "midpoint", "nearest"):
+        assert prof.quantile("c", 0.15, interpolation) == df["c"].quantile(0.15, interpolation=interpolation)
+    pd.testing.assert_series_equal(prof.value_counts("cat"), df["cat"].value_counts())
+
+    summary = prof.summary()
+    assert list(summary.index) == list(df.columns)
+    assert summary.loc["c", "null_count"] == 1
+
+
+def test_pipeline_fit_scans_unchanged_columns_once(df, monkeypatch):
+    scanned = []
+    non_missing = profiling._non_missing
+    monkeypatch.setattr(profiling, "_non_missing", lambda values: scanned.append(values.name) or non_missing(values))
+
+    pipe = Pipeline([
+        ("imputer", MissingValueHandler(strategy="mean")),
+        ("encoder", Encoder(method="label")),
+        ("scaler", Scaler(method="zscore")),
+    ]).fit(df)
+
+    # The imputer profiles every numeric column; the scaler only rescans what earlier
+    # steps changed: the filled column and the encoded one.
+    assert sorted(scanned) == ["a", "b", "c", "c", "cat"]
+
+    # Fits read from the shared profile match standalone fits.
+    filled = MissingValueHandler(strategy="mean").fit_transform(df)
+    expected = Scaler(method="zscore").fit(Encoder(method="label").fit_transform(filled))
+    np.testing.assert_allclose(pipe.named_steps["scaler"]._scaler.mean_, expected._scaler.mean_)
+    np.testing.assert_allclose(pipe.named_steps["scaler"]._scaler.scale_, expected._scaler.scale_)
+
+
+def test_profiled_fits_match_direct_computation(df):
+    scaler = Scaler(method="zscore").fit(df[["a", "b", "c"]])
+    assert list(scaler._scaler.n_samples_seen_) == [300, 300, 299]
+    np.testing.assert_allclose(scaler._scaler.mean_, df[["a", "b", "c"]].mean())
+    np.testing.assert_allclose(scaler._scaler.scale_, df[["a", "b", "c"]].std(ddof=0))
+
+    imputer = MissingValueHandler(strategy="median").fit(df)
+    assert imputer.fitted_params["fill_values"] == {"c": df["c"].median()}
+
+    bounds = OutlierHandler(method="percentile", lower_quantile=0.05, upper_quantile=0.95).fit(df).fitted_params["bounds"]
+    assert bounds["c"] == (df["c"].quantile(0.05), df["c"].quantile(0.95))
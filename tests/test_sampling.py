@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from transfory.sampling import draw
+from transfory.pipeline import Pipeline
+from transfory.missing import MissingValueHandler
+from transfory.encoder import Encoder
+from transfory.outlier import OutlierHandler
+from transfory.scaler import Scaler
+from transfory.exceptions import ConfigurationError
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(42)
+    n = 20000
+    df = pd.DataFrame({
+        "x": rng.normal(10, 2, n),
+        "z": np.where(rng.random(n) < 0.2, np.nan, rng.exponential(size=n)),
+        "cat": rng.choice(["a", "b", "c"], size=n),
+    })
+    y = pd.Series(rng.choice([0, 1], p=[0.95, 0.05], size=n), name="label")
+    return df, y
+
+
+def test_draw_sizes_strata_and_chunks(data):
+    df, y = data
+    sample = draw(df, y, sample=1000, random_state=0)
+    assert len(sample.X) == 1000 and sample.n_seen == len(df)
+    # Stratified: the label shares of the full data are kept exactly.
+    assert sample.y.sum() == round(1000 * y.mean())
+    assert sample.X.index.is_monotonic_increasing
+    assert (y.loc[sample.X.index].to_numpy() == sample.y.to_numpy()).all()
+
+    assert len(draw(df, sample=0.05, random_state=0).X) == 1000
+
+    # Chunked input is read once; pairs carry their targets.
+    chunks = ((df.iloc[i:i + 3000], y.iloc[i:i + 3000]) for i in range(0, len(df), 3000))
+    chunked = draw(chunks, sample=500, random_state=0)
+    assert len(chunked.X) == 500 and chunked.n_seen == len(df)
+    pd.testing.assert_frame_equal(chunked.X, df.loc[chunked.X.index])
+
+    with pytest.raises(ConfigurationError):
+        draw(df, sample=1.5)
+    with pytest.raises(ConfigurationError):
+        draw(df, sample=0)
+
+
+def test_fit_on_sample_reports_errors(data):
+    df, y = data
+    full = OutlierHandler().fit(df[["x", "z"]])
+    sampled = OutlierHandler().fit(df[["x", "z"]], sample=2000, random_state=1)
+    report = sampled.sampling_report
+    assert report["sample_size"] == 2000 and report["population_size"] == len(df)
+    for col in ("x", "z"):
+        lower_error, upper_error = report["errors"]["bounds"][col]
+        assert 0 < lower_error and 0 < upper_error
+        assert abs(sampled.fitted_params["bounds"][col][1] - full.fitted_params["bounds"][col][1]) < 3 * upper_error
+    assert full.sampling_report is None
+
+    scaler = Scaler(method="zscore").fit(df[["x"]], sample=0.1, random_state=1)
+    error = scaler.sampling_report["errors"]["mean"]["x"]
+    assert abs(scaler._scaler.mean_[0] - df["x"].mean()) < 3 * error
+
+
+def test_pipeline_fit_on_sample(data):
+    df, y = data
+    pipe = Pipeline([
+        ("imputer", MissingValueHandler(strategy="median")),
+        ("encoder", Encoder(method="target")),
+        ("scaler", Scaler(method="zscore")),
+    ])
+    pipe.fit(df, y, sample=0.1, random_state=3)
+    report = pipe.sampling_report
+    assert report["fraction"] == 0.1
+    assert set(report["errors"]) == {"imputer", "encoder", "scaler"}
+    assert report["errors"]["imputer"]["fill_values"]["z"] > 0
+    # Every category of a 3-value column shows up in the sample.
+    assert report["errors"]["encoder"]["unseen_share"]["cat"] == 0
+    assert pipe.named_steps["scaler"].sampling_report["sample_size"] == 2000
+    assert pipe.transform(df).shape == (len(df), 3)
@@ -5,6 +5,7 @@ import os
 
 from transfory.scaler import Scaler
 from transfory.base import NotFittedError, FrozenTransformerError
+from transfory.exceptions import ConfigurationError
 
 
 @pytest.fixture
@@ -150,4 +151,88 @@ def test_scaler_freezing(sample_dataframe):
     # Unfreezing should allow fitting again
     scaler.unfreeze()
     scaler.fit(sample_dataframe) # Should not raise an error
-    assert scaler.is_fitted
\ No newline at end of file
+    assert scaler.is_fitted
+
+
+def test_scaler_float32_dtype():
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [0.5, 1.5, 2.5, 3.5]})
+    out = Scaler(method="zscore", dtype=np.float32).fit_transform(df)
+    assert list(out.dtypes) == [np.float32, np.float32]
+    np.testing.assert_allclose(out.to_numpy(), Scaler(method="zscore").fit_transform(df).to_numpy(), rtol=1e-6)
+
+
+def test_scaler_rejects_non_float_dtype():
+    with pytest.raises(ConfigurationError):
+        Scaler(dtype="int32")
+
+
+@pytest.mark.parametrize("method", ["minmax", "zscore"])
+def test_scaler_combine_partitions_matches_full_fit(method):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"a": rng.normal(5, 3, 900), "b": rng.integers(0, 10, 900), "c": 1.0})
+    df.loc[::7, "a"] = np.nan
+    parts = [df.iloc[:200], df.iloc[200:650][["c", "b", "a"]], df.iloc[650:]]
+
+    merged = Scaler.combine([Scaler(method).fit(p) for p in parts])
+    full = Scaler(method).fit(df)
+    np.testing.assert_allclose(merged.transform(df).to_numpy(), full.transform(df).to_numpy(), rtol=1e-12, atol=1e-12)
+
+
+def test_zscore_scaler_keeps_precision_with_large_offset():
+    from sklearn.preprocessing import StandardScaler
+
+    rng = np.random.default_rng(2)
+    df = pd.DataFrame({"a": 1e9 + rng.normal(0, 1, 1000), "b": 1e9 + np.zeros(1000)})
+    scaler = Scaler("zscore").fit(df)
+    reference = StandardScaler().fit(df)
+    np.testing.assert_allclose(scaler._scaler.mean_, reference.mean_, rtol=1e-15)
+    np.testing.assert_allclose(scaler._scaler.scale_, reference.scale_, rtol=1e-12)
+
+
+@pytest.fixture
+def drifting_batches():
+    rng = np.random.default_rng(1)
+    return [pd.DataFrame({"a": rng.normal(i, 1, 300), "b": rng.normal(0, 1 + i, 300)}) for i in range(5)]
+
+
+@pytest.mark.parametrize("method", ["minmax", "zscore"])
+def test_scaler_partial_fit_matches_full_fit(method, drifting_batches):
+    scaler = Scaler(method)
+    for batch in drifting_batches:
+        scaler.partial_fit(batch)
+    full = pd.concat(drifting_batches)
+    np.testing.assert_allclose(scaler.transform(full), Scaler(method).fit(full).transform(full), rtol=1e-9, atol=1e-12)
+
+
+@pytest.mark.parametrize("method", ["minmax", "zscore"])
+def test_scaler_partial_fit_window(method, drifting_batches):
+    scaler = Scaler(method, window=2)
+    for batch in drifting_batches:
+        scaler.partial_fit(batch)
+    full, recent = pd.concat(drifting_batches), pd.concat(drifting_batches[-2:])
+    np.testing.assert_allclose(scaler.transform(full), Scaler(method).fit(recent).transform(full), rtol=1e-9, atol=1e-12)
+
+
+def test_scaler_partial_fit_decay_zscore(drifting_batches):
+    scaler = Scaler("zscore", decay=0.5)
+    for batch in drifting_batches:
+        scaler.partial_fit(batch)
+    # Batch i has weight 0.5 ** (4 - i) in the decayed mean.
+    weights = 0.5 ** np.arange(4, -1, -1)
+    expected = np.average([b["a"].mean() for b in drifting_batches], weights=weights)
+    np.testing.assert_allclose(scaler._scaler.mean_[0], expected)
+
+
+def test_scaler_partial_fit_decay_minmax(drifting_batches):
+    scaler = Scaler("minmax", decay=0.5)
+    for batch in drifting_batches:
+        scaler.partial_fit(batch)
+    # The range follows the drift but always covers the latest batch.
+    full = pd.concat(drifting_batches)
+    assert drifting_batches[-1]["a"].min() >= scaler._scaler.data_min_[0] > full["a"].min()
+
+
+@pytest.mark.parametrize("params", [{"decay": 0.5, "window": 3}, {"decay": 1.5}])
+def test_scaler_decay_window_validation(params):
+    with pytest.raises(ConfigurationError):
+        Scaler(**params)
@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from transfory import schema
+from transfory.profiling import DataProfile, activate
+from transfory.scaler import Scaler
+from transfory.exceptions import ColumnMismatchError
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    schema.clear_cache()
+    yield
+    schema.clear_cache()
+
+
+def test_fingerprint_tracks_names_and_dtypes():
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+    assert schema.schema_fingerprint(df) == schema.schema_fingerprint(df.copy())
+    assert schema.schema_fingerprint(df) != schema.schema_fingerprint(df.astype({"a": float}))
+    assert schema.schema_fingerprint(df) != schema.schema_fingerprint(df.rename(columns={"a": "c"}))
+
+
+def test_select_columns_is_cached_per_schema(monkeypatch):
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"], "c": [0.5, 1.5]})
+    assert schema.select_columns(df, "number") == ["a", "c"]
+
+    calls = []
+    original = pd.DataFrame.select_dtypes
+    monkeypatch.setattr(pd.DataFrame, "select_dtypes", lambda self, **kw: calls.append(kw) or original(self, **kw))
+    assert schema.select_columns(df.iloc[:1], "number") == ["a", "c"]
+    assert calls == []
+    assert schema.select_columns(df.astype({"a": str}), "number") == ["c"]
+    assert len(calls) == 1
+
+
+def test_select_columns_reuses_profile_fingerprint(monkeypatch):
+    """During a fit, each frame's fingerprint is computed once, however many selections it makes."""
+    df = pd.DataFrame({"a": [1.0, np.nan, 3.0], "b": ["x", None, "y"]})
+    calls = []
+    original = schema.schema_fingerprint
+    monkeypatch.setattr(schema, "schema_fingerprint", lambda X: calls.append(1) or original(X))
+    with activate(DataProfile(df)):
+        assert schema.select_columns(df, "number") == ["a"]
+        assert schema.select_columns(df, ["object", "category"]) == ["b"]
+    assert len(calls) == 1
+
+
+def test_column_check_does_not_modify_transformer():
+    df = pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": [4.0, 5.0, 6.0]})
+    scaler = Scaler().fit(df)
+    state = dict(scaler.__dict__)
+    scaler.transform(df)
+    scaler.transform(df.iloc[:1])
+    assert scaler.__dict__.keys() == state.keys()
+
+
+def test_column_check_is_cached_but_still_rejects_missing_columns():
+    df = pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": [4.0, 5.0, 6.0]})
+    scaler = Scaler().fit(df)
+    scaler.transform(df)
+    assert schema.covers_columns(df.columns, ["a", "b"])
+    with pytest.raises(ColumnMismatchError):
+        scaler.transform(df[["a"]])
@@ -0,0 +1,181 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from transfory.pipeline import Pipeline
+from transfory.missing import MissingValueHandler
+from transfory.encoder import Encoder
+from transfory.scaler import Scaler
+from transfory.serve import LatencyHistogram, MicroBatcher, make_server, load_test
+from transfory.exceptions import NotFittedError
+
+
+@pytest.fixture
+def fitted_pipeline():
+    df = pd.DataFrame({
+        "age": [20, 25, 30, np.nan, 22],
+        "city": ["Manila", "Cebu", "Manila", "Davao", "Cebu"],
+    })
+    pipe = Pipeline([
+        ("imputer", MissingValueHandler(strategy="mean")),
+        ("encoder", Encoder(method="onehot")),
+        ("scaler", Scaler(method="minmax")),
+    ])
+    pipe.fit(df)
+    return pipe
+
+
+def test_latency_histogram_percentiles():
+    hist = LatencyHistogram(buckets_ms=(1, 10, 100))
+    for _ in range(90):
+        hist.record(0.0005)  # 0.5 ms
+    for _ in range(10):
+        hist.record(0.05)  # 50 ms
+    snap = hist.snapshot()
+    assert snap["count"] == 100
+    assert snap["p50_ms"] == 1
+    assert snap["p99_ms"] == 100
+    assert snap["buckets"]["<=1ms"] == 90
+
+
+def test_microbatcher_requires_fitted_pipeline():
+    with pytest.raises(NotFittedError):
+        MicroBatcher(Pipeline([("scaler", Scaler())]))
+
+
+def test_microbatcher_coalesces_concurrent_requests(fitted_pipeline):
+    record = {"age": 25.0, "city": "Cebu"}
+    expected = fitted_pipeline.transform(pd.DataFrame([record])).to_dict(orient="records")[0]
+
+    with MicroBatcher(fitted_pipeline, max_batch_size=8, max_wait_ms=50) as batcher:
+        futures = [batcher.submit_async(record) for _ in range(8)]
+        results = [f.result(timeout=5) for f in futures]
+
+    assert all(r == pytest.approx(expected) for r in results)
+    assert batcher.batch_sizes == {8: 1}
+    assert batcher.request_latency.snapshot()["count"] == 8
+
+
+def test_microbatcher_propagates_errors(fitted_pipeline):
+    with MicroBatcher(fitted_pipeline, max_wait_ms=1) as batcher:
+        with pytest.raises(Exception):
+            batcher.submit({"unknown": 1}, timeout=5)
+
+
+def test_microbatcher_rejects_unknown_columns(fitted_pipeline):
+    """A record with unknown or missing keys fails alone and does not leak columns into other results."""
+    good = {"age": 25.0, "city": "Cebu"}
+    expected = fitted_pipeline.transform(pd.DataFrame([good])).to_dict(orient="records")[0]
+
+    with MicroBatcher(fitted_pipeline, max_batch_size=3, max_wait_ms=200) as batcher:
+        futures = [batcher.submit_async(good), batcher.submit_async({"unknown": 1}), batcher.submit_async(good)]
+        assert futures[0].result(timeout=5) == pytest.approx(expected)
+        assert futures[2].result(timeout=5) == pytest.approx(expected)
+        with pytest.raises(Exception):
+            futures[1].result(timeout=5)
+
+
+def test_microbatcher_retries_failed_batch_per_record(fitted_pipeline):
+    """When a batch fails to transform, only the request with the bad value gets the error."""
+    good = {"age": 25.0, "city": "Cebu"}
+    expected = fitted_pipeline.transform(pd.DataFrame([good])).to_dict(orient="records")[0]
+
+    with MicroBatcher(fitted_pipeline, max_batch_size=3, max_wait_ms=200) as batcher:
+        futures = [batcher.submit_async(good), batcher.submit_async({"age": "abc", "city": "Cebu"}),
+                   batcher.submit_async(good)]
+        assert futures[0].result(timeout=5) == pytest.approx(expected)
+        assert futures[2].result(timeout=5) == pytest.approx(expected)
+        with pytest.raises(Exception):
+            futures[1].result(timeout=5)
+    assert batcher.metrics()["batch_sizes"] == {1: 2}
+
+
+def test_http_server_rejects_non_object_items(fitted_pipeline):
+    with MicroBatcher(fitted_pipeline, max_wait_ms=1) as batcher:
+        server = make_server(batcher, port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}"
+            body = json.dumps([{"age": 20, "city": "Manila"}, 5]).encode()
+            req = urllib.request.Request(f"{url}/transform", data=body, headers={"Content-Type": "application/json"})
+            with pytest.raises(urllib.error.HTTPError) as excinfo:
+                urllib.request.urlopen(req, timeout=5)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    assert excinfo.value.code == 400
+    assert batcher.request_latency.snapshot()["count"] == 0
+
+
+def test_http_server_roundtrip(fitted_pipeline):
+    with MicroBatcher(fitted_pipeline, max_wait_ms=1) as batcher:
+        server = make_server(batcher, port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}"
+            body = json.dumps([{"age": 20, "city": "Manila"}, {"age": 30, "city": "Davao"}]).encode()
+            req = urllib.request.Request(f"{url}/transform", data=body, headers={"Content-Type": "application/json"})
+            with urllib.request.urlopen(req, timeout=5) as resp:
+                results = json.loads(resp.read())
+            with urllib.request.urlopen(f"{url}/metrics", timeout=5) as resp:
+                metrics = json.loads(resp.read())
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    assert len(results) == 2
+    assert results[0]["city_Manila"] == 1
+    assert metrics["request_latency"]["count"] == 2
+
+
+def test_load_test_reports_throughput(fitted_pipeline):
+    records = [{"age": 20, "city": "Manila"}, {"age": 28, "city": "Cebu"}]
+    with MicroBatcher(fitted_pipeline, max_batch_size=16, max_wait_ms=2) as batcher:
+        report = load_test(batcher, records, n_clients=8, n_requests=200)
+
+    assert report["n_errors"] == 0
+    assert report["request_latency"]["count"] == 200
+    assert sum(size * n for size, n in report["batch_sizes"].items()) == 200
+
+
+def test_microbatcher_stop_fails_requests_queued_after_stop(fitted_pipeline):
+    batcher = MicroBatcher(fitted_pipeline, max_wait_ms=1).start()
+    batcher.submit({"age": 25.0, "city": "Cebu"}, timeout=5)
+    # A record that slipped in behind the STOP sentinel must not leave its caller waiting.
+    batcher._queue.put(batcher._STOP)
+    late = batcher.submit_async({"age": 25.0, "city": "Cebu"})
+    batcher.stop(timeout=5)
+
+    with pytest.raises(RuntimeError):
+        late.result(timeout=5)
+    with pytest.raises(RuntimeError):
+        batcher.submit_async({"age": 25.0, "city": "Cebu"})
+
+
+def test_http_server_returns_null_for_nan():
+    pipe = Pipeline([("scaler", Scaler(method="minmax"))])
+    pipe.fit(pd.DataFrame({"age": [20.0, 30.0]}))
+    with MicroBatcher(pipe, max_wait_ms=1) as batcher:
+        server = make_server(batcher, port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}"
+            body = json.dumps({"age": None}).encode()
+            req = urllib.request.Request(f"{url}/transform", data=body, headers={"Content-Type": "application/json"})
+            with urllib.request.urlopen(req, timeout=5) as resp:
+                raw = resp.read().decode()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    assert "NaN" not in raw
+    assert json.loads(raw) == {"age": None}